@@ -0,0 +1,121 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2021, NetApp, Inc
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Support functions for NetApp ansible modules
+
+    Provides a bounded pool of threads to run independent ZAPI or REST calls concurrently.
+    Functions run in a worker thread must not call module.fail_json or module.exit_json,
+    errors are to be returned to the caller, and reported from the main thread.
+    A ZAPI connection is not thread safe, ThreadConnections provides one connection per worker thread.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    # python 2.7 without the futures backport, calls are run sequentially
+    HAS_FUTURES = False
+
+
+def iter_concurrently(function, args_list, max_workers=1):
+    """call function(*args) for each args in args_list, and yield the results in the same order
+       up to max_workers calls are running at any time.
+       With max_workers set to 1, calls are made lazily, one at a time, so that the caller can stop on error.
+       If the caller stops iterating, pending calls are cancelled, running calls are allowed to complete.
+    """
+    args_list = list(args_list)
+    if max_workers is None or max_workers <= 1 or len(args_list) <= 1 or not HAS_FUTURES:
+        for args in args_list:
+            yield function(*args)
+        return
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(args_list)))
+    futures = [executor.submit(function, *args) for args in args_list]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def run_concurrently(function, args_list, max_workers=1):
+    """call function(*args) for each args in args_list, and return the list of results in the same order
+       if a call raises an exception, it is reraised in the main thread.
+    """
+    return list(iter_concurrently(function, args_list, max_workers))
+
+
+class ThreadConnections(object):
+    """The main thread uses connection, each worker thread uses a clone, created on first use and reused for all its calls.
+       So at most max_workers connections are opened for a pool, whatever the number of calls.
+       Use it as a context manager around the pool, or call close once the pool is done, to close the clones.
+    """
+
+    def __init__(self, connection, clone):
+        """:param connection: connection for the main thread
+           :param clone: function returning a copy of connection, with its own socket
+        """
+        self.connection = connection
+        self.clone = clone
+        self.owner_thread = threading.current_thread()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.clones = list()
+
+    def get(self):
+        """return the connection for the current thread"""
+        if threading.current_thread() is self.owner_thread:
+            return self.connection
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.clone(self.connection)
+            self.local.connection = connection
+            with self.lock:
+                self.clones.append(connection)
+        return connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """close the connections opened by the clones, a clone used again would reconnect"""
+        with self.lock:
+            clones, self.clones = self.clones, list()
+        for connection in clones:
+            close_connection = getattr(connection, 'close_connection', None)
+            if close_connection is not None:
+                close_connection()
@@ -35,12 +35,21 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import base64
+import copy
+import errno
+import hashlib
+import json
 import logging
 import os
+import socket
 import ssl
+import stat
+import tempfile
+import threading
 import time
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils._text import to_native
+from ansible.module_utils.six.moves import http_client
 
 try:
     from ansible.module_utils.ansible_release import __version__ as ansible_version
@@ -99,6 +108,11 @@ ERROR_MSG = dict(
 
 LOG = logging.getLogger(__name__)
 
+# requests sessions are shared by all OntapRestAPI instances targeting the same host,
+# so that TCP and TLS connections are kept alive for the lifetime of the module.
+REST_SESSIONS = dict()
+JOB_STATS_LOCK = threading.Lock()
+
 try:
     from solidfire.factory import ElementFactory
     HAS_SF_SDK = True
@@ -155,7 +169,16 @@ def get_feature(module, feature_name):
         show_modified=True,
         always_wrap_zapi=True,                  # for better error reporting
         trace_apis=False,                       # if true, append ZAPI and REST requests/responses to /tmp/ontap_zapi.txt
-        flexcache_delete_return_timeout=5       # ONTAP bug if too big?
+        flexcache_delete_return_timeout=5,      # ONTAP bug if too big?
+        rest_keep_alive=True,                   # if true, reuse a persistent requests.Session for all REST calls
+        rest_pool_maxsize=10,                   # max number of connections kept alive per host by the REST session
+        zapi_keep_alive=True,                   # if true, reuse a persistent HTTP/1.1 connection for ZAPI calls
+        probe_cache_ttl=0,                      # if > 0, cache cluster version and admin vserver name on disk for this many seconds
+        probe_cache_dir=None,                   # directory for the cache, defaults to <tempdir>/ansible_netapp_ontap_cache, must be private to the user
+        ems_log_mode='always',                  # always: log synchronously, once: log once per ems_log_once_ttl, background: log in a thread
+        ems_log_once_ttl=3600,                  # with ems_log_mode=once, skip the EMS event if already logged for this cluster within this many seconds
+        api_stats=False,                        # if true, record ZAPI and REST calls, and add a summary in api_stats to the module result
+        api_stats_slowest=5,                    # number of slowest calls reported in api_stats
     )
 
     if module.params['feature_flags'] is not None and feature_name in module.params['feature_flags']:
@@ -272,6 +295,120 @@ def setup_na_ontap_zapi(module, vserver=None, wrap_zapi=False):
         module.fail_json(msg=netapp_lib_is_required())
 
 
+def is_private_dir(path, create=False):
+    ''' return True if path is a directory owned by the current user, with no access for group and others.
+        The default cache directories are in the shared temp dir, where another user could have created them,
+        to read the cached values or to plant a cache file.
+        A missing directory is created with mode 0700 when create is set.
+    '''
+    if create and not os.path.lexists(path):
+        try:
+            os.makedirs(path, 0o700)
+        except OSError as exc:
+            LOG.debug("Ignoring error creating cache directory: %s", repr(exc))
+    try:
+        # lstat, as a symbolic link is not trusted
+        stats = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(stats.st_mode) or stat.S_IMODE(stats.st_mode) & 0o077:
+        return False
+    return not hasattr(os, 'getuid') or stats.st_uid == os.getuid()
+
+
+def get_cache_dir(cache_dir, subdir=None, create=False):
+    ''' return cache_dir, or <tempdir>/ansible_netapp_ontap_cache[/subdir] if not set.
+        None is returned if the directory is not private to the current user.
+    '''
+    if cache_dir is not None:
+        return cache_dir if is_private_dir(cache_dir, create) else None
+    cache_dir = os.path.join(tempfile.gettempdir(), 'ansible_netapp_ontap_cache')
+    if not is_private_dir(cache_dir, create):
+        return None
+    if subdir is None:
+        return cache_dir
+    cache_dir = os.path.join(cache_dir, subdir)
+    return cache_dir if is_private_dir(cache_dir, create) else None
+
+
+def get_probe_cache_path(module, create=False):
+    ''' cache file is specific to the cluster and the user, credentials are not part of the name as they could be guessed from it
+        return cache_dir, cache_path, or None, None if the directory is not private to the current user
+    '''
+    cache_dir = get_cache_dir(get_feature(module, 'probe_cache_dir'), create=create)
+    if cache_dir is None:
+        LOG.debug("Ignoring probe cache, as the directory is missing, or not private to the current user")
+        return None, None
+    key = repr([module.params.get(option) for option in ('hostname', 'http_port', 'username')])
+    return cache_dir, os.path.join(cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+
+def read_probe_cache(module, name, ttl=None):
+    ''' return a cached value if caching is enabled and the value has not expired, or None '''
+    if module is None:
+        return None
+    if ttl is None:
+        ttl = get_feature(module, 'probe_cache_ttl')
+    if not ttl:
+        return None
+    dummy, cache_path = get_probe_cache_path(module)
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, 'r') as cache_file:
+            entry = json.load(cache_file)[name]
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
+    if time.time() - entry.get('timestamp', 0) > ttl:
+        return None
+    return entry.get('value')
+
+
+def write_probe_cache(module, name, value, ttl=None):
+    ''' cache a value if caching is enabled, errors are ignored as the cache is only an optimization '''
+    if module is None:
+        return
+    if ttl is None:
+        ttl = get_feature(module, 'probe_cache_ttl')
+    if not ttl:
+        return
+    cache_dir, cache_path = get_probe_cache_path(module, create=True)
+    if cache_path is None:
+        return
+    try:
+        try:
+            with open(cache_path, 'r') as cache_file:
+                entries = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            entries = dict()
+        entries[name] = dict(value=value, timestamp=time.time())
+        # write to a temporary file and rename, as other tasks may be reading or writing concurrently
+        handle, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(handle, 'w') as cache_file:
+            json.dump(entries, cache_file)
+        os.rename(tmp_path, cache_path)
+    except (IOError, OSError, TypeError, ValueError) as exc:
+        LOG.debug("Ignoring error writing to probe cache: %s", repr(exc))
+
+
+# the server closed or reset an idle persistent connection
+STALE_CONNECTION_ERRNOS = (errno.EPIPE, errno.ECONNRESET, errno.ECONNABORTED)
+
+
+def is_stale_connection_error(exc, stage):
+    ''' return True if a request can safely be sent again on a new connection.
+        This is only the case when the reused socket failed before the server started to respond:
+        while sending the request, or when no byte of the status line was received.
+        Any later error may happen after ONTAP ran the ZAPI, which may not be idempotent, eg volume-create.
+    '''
+    if stage == 'request':
+        return isinstance(exc, socket.error) and getattr(exc, 'errno', None) in STALE_CONNECTION_ERRNOS
+    if stage == 'getresponse':
+        # RemoteDisconnected is a subclass of BadStatusLine, with an empty line
+        return isinstance(exc, http_client.BadStatusLine) and exc.line in ('', "''")
+    return False
+
+
 def is_zapi_connection_error(message):
     ''' return True if it is a connection issue '''
     # netapp-lib message may contain a tuple or a str!
@@ -290,8 +427,8 @@ def is_zapi_write_access_error(message):
     return False
 
 
-def ems_log_event(source, server, name="Ansible", ident="12345", version=COLLECTION_VERSION,
-                  category="Information", event="setup", autosupport="false"):
+def _ems_log_event(source, server, name="Ansible", ident="12345", version=COLLECTION_VERSION,
+                   category="Information", event="setup", autosupport="false"):
     ems_log = zapi.NaElement('ems-autosupport-log')
     # Host name invoking the API.
     ems_log.add_new_child("computer-name", name)
@@ -363,6 +500,17 @@ def classify_zapi_exception(error):
 
 
 def get_cserver(connection, is_rest=False):
+    ''' the cluster vserver name is cached on disk when probe_cache_ttl is set '''
+    module = getattr(connection, 'module', None)
+    cserver = read_probe_cache(module, 'cserver')
+    if cserver is None:
+        cserver = _get_cserver(connection, is_rest)
+        if cserver is not None:
+            write_probe_cache(module, 'cserver', cserver)
+    return cserver
+
+
+def _get_cserver(connection, is_rest=False):
     if not is_rest:
         return get_cserver_zapi(connection)
 
@@ -383,6 +531,188 @@ def get_cserver(connection, is_rest=False):
     return None
 
 
+def get_ems_log_mode(module):
+    ''' always (default) if the module is not known, eg when called with a connection created outside of this collection '''
+    if module is None:
+        return 'always'
+    mode = get_feature(module, 'ems_log_mode')
+    if mode not in ('always', 'once', 'background'):
+        module.fail_json(msg="Error: unexpected value for ems_log_mode feature flag: %s, expecting one of always, once, background" % mode)
+    return mode
+
+
+def is_ems_log_event_needed(module, source, kwargs):
+    ''' with ems_log_mode=once, only log an event for a source and description once per cluster within ems_log_once_ttl seconds '''
+    if get_ems_log_mode(module) != 'once':
+        return True
+    name = 'ems:%s:%s' % (source, kwargs.get('event', 'setup'))
+    return read_probe_cache(module, name, get_feature(module, 'ems_log_once_ttl')) is None
+
+
+def record_ems_log_event(module, source, kwargs):
+    if get_ems_log_mode(module) == 'once':
+        name = 'ems:%s:%s' % (source, kwargs.get('event', 'setup'))
+        write_probe_cache(module, name, True, get_feature(module, 'ems_log_once_ttl'))
+
+
+def clone_zapi_server(server):
+    ''' a shallow copy is enough, but the persistent connection cannot be shared across threads '''
+    clone = copy.copy(server)
+    if hasattr(clone, '_connection'):
+        clone._connection = None
+        clone._connection_key = None
+    return clone
+
+
+class ApiStats(object):
+    ''' record ZAPI and REST calls, and summarize them for the module result '''
+
+    def __init__(self, slowest=5):
+        self.start_time = time.time()
+        self.slowest = slowest
+        self.calls = list()
+        # calls can be recorded from several threads, see concurrency_helpers
+        self.lock = threading.Lock()
+
+    def record(self, protocol, api, method, status, request_bytes, response_bytes, latency, retries=0):
+        call = dict(protocol=protocol, api=api, method=method, status=status, request_bytes=request_bytes,
+                    response_bytes=response_bytes, latency=round(latency, 3), retries=retries)
+        with self.lock:
+            self.calls.append(call)
+
+    @staticmethod
+    def is_error(call):
+        if call['protocol'] == 'ZAPI':
+            return call['status'] != 'passed'
+        return call['status'] is None or call['status'] >= 400
+
+    def summary(self):
+        ''' totals, totals per API, and slowest calls
+            api_time is the time spent waiting for ONTAP, local_time is the rest of the module run time
+        '''
+        with self.lock:
+            calls = list(self.calls)
+        total_time = time.time() - self.start_time
+        api_time = sum(call['latency'] for call in calls)
+        by_api = dict()
+        for call in calls:
+            key = call['api'] if call['protocol'] == 'ZAPI' else '%s %s' % (call['method'], call['api'])
+            totals = by_api.setdefault(key, dict(calls=0, time=0, request_bytes=0, response_bytes=0))
+            totals['calls'] += 1
+            totals['time'] = round(totals['time'] + call['latency'], 3)
+            totals['request_bytes'] += call['request_bytes']
+            totals['response_bytes'] += call['response_bytes']
+        return dict(
+            calls=len(calls),
+            errors=len([call for call in calls if self.is_error(call)]),
+            retries=sum(call['retries'] for call in calls),
+            request_bytes=sum(call['request_bytes'] for call in calls),
+            response_bytes=sum(call['response_bytes'] for call in calls),
+            api_time=round(api_time, 3),
+            local_time=round(max(total_time - api_time, 0), 3),
+            total_time=round(total_time, 3),
+            by_api=by_api,
+            slowest=sorted(calls, key=lambda call: call['latency'], reverse=True)[:self.slowest],
+        )
+
+    def add_to_result(self, exit_method):
+        ''' wrap exit_json or fail_json to report api_stats '''
+        def wrapper(*args, **kwargs):
+            kwargs['api_stats'] = self.summary()
+            return exit_method(*args, **kwargs)
+        return wrapper
+
+
+def get_api_stats(module):
+    ''' return the ApiStats object for this module, or None if the api_stats feature flag is not set
+        on first use, exit_json and fail_json are wrapped to add api_stats to the module result
+    '''
+    if module is None or not has_feature(module, 'api_stats'):
+        return None
+    api_stats = getattr(module, '_netapp_api_stats', None)
+    if api_stats is None:
+        api_stats = ApiStats(get_feature(module, 'api_stats_slowest'))
+        module._netapp_api_stats = api_stats
+        module.exit_json = api_stats.add_to_result(module.exit_json)
+        module.fail_json = api_stats.add_to_result(module.fail_json)
+    return api_stats
+
+
+def record_job_stats(module, job_stats):
+    ''' add the stats for a REST job to job_stats in the module result
+        on first use, exit_json and fail_json are wrapped to report the list
+        stats are recorded in the module object, as several threads may wait on jobs with copies of the same OntapRestAPI object
+    '''
+    if module is None:
+        return
+    with JOB_STATS_LOCK:
+        all_job_stats = getattr(module, '_netapp_job_stats', None)
+        if all_job_stats is None:
+            all_job_stats = list()
+            module._netapp_job_stats = all_job_stats
+
+            def add_to_result(exit_method):
+                def wrapper(*args, **kwargs):
+                    kwargs['job_stats'] = list(all_job_stats)
+                    return exit_method(*args, **kwargs)
+                return wrapper
+
+            for name in ('exit_json', 'fail_json'):
+                if hasattr(module, name):
+                    setattr(module, name, add_to_result(getattr(module, name)))
+        all_job_stats.append(job_stats)
+
+
+def run_ems_log_in_background(source, function, *args, **kwargs):
+    ''' EMS logging is informational, errors are logged but not reported.
+        The thread is not a daemon, so the interpreter waits for it on exit.
+    '''
+    def log_event():
+        try:
+            function(*args, **kwargs)
+        except Exception as exc:    # pylint: disable=broad-except
+            LOG.debug("Ignoring error in background EMS logging for %s: %s", source, repr(exc))
+
+    thread = threading.Thread(target=log_event, name='ems_log_%s' % source)
+    thread.start()
+    return thread
+
+
+def ems_log_event(source, server, **kwargs):
+    ''' log an EMS event, see _ems_log_event for the keyword arguments.
+        The ems_log_mode feature flag controls whether the event is sent synchronously, once, or in a background thread.
+    '''
+    module = getattr(server, 'module', None)
+    if not is_ems_log_event_needed(module, source, kwargs):
+        return
+    if get_ems_log_mode(module) == 'background':
+        run_ems_log_in_background(source, _ems_log_event, source, clone_zapi_server(server), **kwargs)
+        return
+    _ems_log_event(source, server, **kwargs)
+    record_ems_log_event(module, source, kwargs)
+
+
+def _ems_log_event_cserver(source, server, module, **kwargs):
+    results = get_cserver(server)
+    cserver = setup_na_ontap_zapi(module=module, vserver=results)
+    _ems_log_event(source, cserver, **kwargs)
+
+
+def ems_log_event_cserver(source, server, module, **kwargs):
+    ''' log an EMS event against the cluster vserver.
+        With ems_log_mode=once, the cluster vserver lookup is skipped when the event was already logged.
+        With ems_log_mode=background, the lookup and the EMS call are run in a thread.
+    '''
+    if not is_ems_log_event_needed(module, source, kwargs):
+        return
+    if get_ems_log_mode(module) == 'background':
+        run_ems_log_in_background(source, _ems_log_event_cserver, source, clone_zapi_server(server), module, **kwargs)
+        return
+    results = get_cserver(server)
+    cserver = setup_na_ontap_zapi(module=module, vserver=results)
+    ems_log_event(source, cserver, **kwargs)
+
+
 if HAS_NETAPP_LIB:
     class OntapZAPICx(zapi.NaServer):
         ''' override zapi NaServer class to:
@@ -409,8 +739,14 @@ if HAS_NETAPP_LIB:
             if auth_method == 'speedy_basic_auth':
                 auth = '%s:%s' % (username, password)
                 self.base64_creds = base64.b64encode(auth.encode()).decode()
-
-        def _create_certificate_auth_handler(self):
+            self._connection = None
+            self._connection_key = None
+            self.api_stats = get_api_stats(module)
+            self._retries = 0
+            self._request_bytes = 0
+            self._response_bytes = 0
+
+        def _create_ssl_context(self):
             try:
                 context = ssl.create_default_context()
             except AttributeError as exc:
@@ -420,12 +756,17 @@ if HAS_NETAPP_LIB:
             if not self.validate_certs:
                 context.check_hostname = False
                 context.verify_mode = ssl.CERT_NONE
-            try:
-                context.load_cert_chain(self.cert_filepath, keyfile=self.key_filepath)
-            except IOError as exc:      # python 2.7 does not have FileNotFoundError
-                msg = 'Cannot load SSL certificate, check files exist.'
-                msg += '  More info: %s' % repr(exc)
-                self.module.fail_json(msg=msg)
+            if self.cert_filepath is not None:
+                try:
+                    context.load_cert_chain(self.cert_filepath, keyfile=self.key_filepath)
+                except IOError as exc:      # python 2.7 does not have FileNotFoundError
+                    msg = 'Cannot load SSL certificate, check files exist.'
+                    msg += '  More info: %s' % repr(exc)
+                    self.module.fail_json(msg=msg)
+            return context
+
+        def _create_certificate_auth_handler(self):
+            context = self._create_ssl_context()
             return zapi.urllib.request.HTTPSHandler(context=context)
 
         def _parse_response(self, response):
@@ -468,26 +809,109 @@ if HAS_NETAPP_LIB:
                 request.add_header('Authorization', 'Basic %s' % self.base64_creds)
             return request, netapp_element
 
-        # as is from latest version of netapp-lib
+        def use_keep_alive(self):
+            ''' a persistent connection requires credentials to be sent preemptively, as there is no challenge handler '''
+            if self.module is None or not get_feature(self.module, 'zapi_keep_alive'):
+                return False
+            return self.base64_creds is not None or self._auth_style == zapi.NaServer.STYLE_CERTIFICATE
+
+        def _get_connection(self):
+            ''' return a persistent HTTP/1.1 connection, (re)creating it if the transport settings changed '''
+            key = (self._protocol, self._host, self._port)
+            if self._connection is None or self._connection_key != key:
+                self.close_connection()
+                kwargs = dict()
+                if hasattr(self, '_timeout'):
+                    kwargs['timeout'] = self._timeout
+                if self._protocol == zapi.NaServer.TRANSPORT_TYPE_HTTPS:
+                    self._connection = http_client.HTTPSConnection(self._host, self._port, context=self._create_ssl_context(), **kwargs)
+                else:
+                    self._connection = http_client.HTTPConnection(self._host, self._port, **kwargs)
+                self._connection_key = key
+            return self._connection
+
+        def close_connection(self):
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
+            self._connection_key = None
+
+        def _send_with_keep_alive(self, request):
+            ''' send the request over a persistent connection
+                if the server closed an idle connection before receiving the request, reconnect and send again, once
+                returns the response body, raises urllib exceptions to keep error reporting consistent
+            '''
+            url = '/' + self._url
+            headers = dict(request.header_items())
+            for attempt in (1, 2):
+                reused = self._connection is not None
+                connection = self._get_connection()
+                stage = 'request'
+                try:
+                    connection.request('POST', url, body=request.data, headers=headers)
+                    stage = 'getresponse'
+                    response = connection.getresponse()
+                    # never retry once the response started, the ZAPI may have run
+                    stage = 'read'
+                    body = response.read()
+                except (http_client.HTTPException, socket.error) as exc:
+                    self.close_connection()
+                    if reused and attempt == 1 and is_stale_connection_error(exc, stage):
+                        self._retries += 1
+                        continue
+                    raise zapi.urllib.error.URLError(exc)
+                if response.status != 200:
+                    raise zapi.urllib.error.HTTPError(request.get_full_url(), response.status, response.reason, response.msg, None)
+                return body
+
+        def _send_with_opener(self, request):
+            if not hasattr(self, '_opener') or not self._opener \
+                    or self._refresh_conn:
+                self._build_opener()
+            if hasattr(self, '_timeout'):
+                response = self._opener.open(request, timeout=self._timeout)
+            else:
+                response = self._opener.open(request)
+            return response.read()
+
         def invoke_elem(self, na_element, enable_tunneling=False):
+            """Invoke the API on the server, and record the call if api_stats is enabled."""
+            if self.api_stats is None:
+                return self._invoke_elem(na_element, enable_tunneling)
+            self._retries = 0
+            self._request_bytes = 0
+            self._response_bytes = 0
+            status = None
+            start_time = time.time()
+            try:
+                response_element = self._invoke_elem(na_element, enable_tunneling)
+                status = response_element.get_attr('status') if response_element is not None else None
+                return response_element
+            except zapi.NaApiError as exc:
+                status = exc.code
+                raise
+            finally:
+                self.api_stats.record('ZAPI', na_element.get_name() if isinstance(na_element, zapi.NaElement) else None, 'POST',
+                                      status, self._request_bytes, self._response_bytes, time.time() - start_time, self._retries)
+
+        # as is from latest version of netapp-lib, with support for persistent connections
+        def _invoke_elem(self, na_element, enable_tunneling=False):
             """Invoke the API on the server."""
             if not na_element or not isinstance(na_element, zapi.NaElement):
                 raise ValueError('NaElement must be supplied to invoke API')
 
             request, request_element = self._create_request(na_element,
                                                             enable_tunneling)
+            self._request_bytes = len(request.data or b'')
 
             if self._trace:
                 zapi.LOG.debug("Request: %s", request_element.to_string(pretty=True))
 
-            if not hasattr(self, '_opener') or not self._opener \
-                    or self._refresh_conn:
-                self._build_opener()
             try:
-                if hasattr(self, '_timeout'):
-                    response = self._opener.open(request, timeout=self._timeout)
+                if self.use_keep_alive():
+                    response_xml = self._send_with_keep_alive(request)
                 else:
-                    response = self._opener.open(request)
+                    response_xml = self._send_with_opener(request)
             except zapi.urllib.error.HTTPError as exc:
                 raise zapi.NaApiError(exc.code, exc.reason)
             except zapi.urllib.error.URLError as exc:
@@ -504,7 +928,7 @@ if HAS_NETAPP_LIB:
             except Exception as exc:
                 raise zapi.NaApiError('Unexpected error', repr(exc))
 
-            response_xml = response.read()
+            self._response_bytes = len(response_xml or b'')
             response_element = self._get_result(response_xml)
 
             if self._trace:
@@ -531,6 +955,7 @@ class OntapRestAPI(object):
         else:
             self.url = 'https://%s:%d/api/' % (self.hostname, port)
         self.is_rest_error = None
+        self.session = None
         self.ontap_version = dict(
             full='unknown',
             generation=-1,
@@ -544,6 +969,7 @@ class OntapRestAPI(object):
         self.check_required_library()
         if has_feature(module, 'trace_apis'):
             logging.basicConfig(filename='/tmp/ontap_apis.log', level=logging.DEBUG, format='%(asctime)s %(levelname)-8s %(message)s')
+        self.api_stats = get_api_stats(module)
 
     def requires_ontap_9_6(self, module_name):
         self.requires_ontap_version(module_name)
@@ -590,6 +1016,30 @@ class OntapRestAPI(object):
             headers['X-Dot-SVM-UUID'] = vserver_uuid
         return headers
 
+    def get_session(self):
+        ''' return a requests.Session with a connection pool for this host
+            the session is created on first use, and shared with other instances using the same URL
+            return None if keep alive is disabled
+        '''
+        if not get_feature(self.module, 'rest_keep_alive'):
+            return None
+        if self.session is None:
+            if self.url not in REST_SESSIONS:
+                session = requests.Session()
+                pool_maxsize = get_feature(self.module, 'rest_pool_maxsize')
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+                session.mount(self.url, adapter)
+                REST_SESSIONS[self.url] = session
+            self.session = REST_SESSIONS[self.url]
+        return self.session
+
+    def close_session(self):
+        ''' release pooled connections for this host '''
+        session = REST_SESSIONS.pop(self.url, None)
+        if session is not None:
+            session.close()
+        self.session = None
+
     def send_request(self, method, api, params, json=None, accept=None,
                      vserver_name=None, vserver_uuid=None):
         ''' send http request and process reponse, including error conditions '''
@@ -622,9 +1072,13 @@ class OntapRestAPI(object):
 
         self.log_debug('sending', repr(dict(method=method, url=url, verify=self.verify, params=params,
                                             timeout=self.timeout, json=json, headers=headers, **kwargs)))
+        session = self.get_session()
+        request_method = requests.request if session is None else session.request
+        response = None
+        start_time = time.time()
         try:
-            response = requests.request(method, url, verify=self.verify, params=params,
-                                        timeout=self.timeout, json=json, headers=headers, **kwargs)
+            response = request_method(method, url, verify=self.verify, params=params,
+                                      timeout=self.timeout, json=json, headers=headers, **kwargs)
             content = response.content  # for debug purposes
             status_code = response.status_code
             # If the response was successful, no Exception will be raised
@@ -642,6 +1096,9 @@ class OntapRestAPI(object):
         except Exception as err:
             self.log_error(status_code, 'Other error: %s' % err)
             error_details = str(err)
+        if self.api_stats is not None:
+            request_body = response.request.body if response is not None and response.request is not None else None
+            self.api_stats.record('REST', api, method, status_code, len(request_body or b''), len(content or b''), time.time() - start_time)
         if json_error is not None:
             self.log_error(status_code, 'Endpoint error: %d: %s' % (status_code, json_error))
             error_details = json_error
@@ -651,7 +1108,21 @@ class OntapRestAPI(object):
             json_dict['Allow'] = response.headers['Allow']
         return status_code, json_dict, error_details
 
-    def wait_on_job(self, job, timeout=600, increment=60):
+    def wait_on_job(self, job, timeout=600, increment=60, initial_increment=0.25, backoff=2):
+        ''' poll the job until it completes, fails, or timeout seconds have elapsed.
+            return message, error
+            Elapsed time and poll count are added to job_stats in the module result, see wait_on_job_with_stats.
+        '''
+        message, error, dummy = self.wait_on_job_with_stats(job, timeout, increment, initial_increment, backoff)
+        return message, error
+
+    def wait_on_job_with_stats(self, job, timeout=600, increment=60, initial_increment=0.25, backoff=2):
+        ''' poll the job until it completes, fails, or timeout seconds have elapsed.
+            Polling starts after initial_increment seconds, and the interval is multiplied by backoff
+            after each poll, up to increment seconds.
+            return message, error, job_stats where job_stats reports the job uuid, elapsed_time, and poll_count.
+            job_stats is also added to job_stats in the module result.
+        '''
         try:
             url = job['_links']['self']['href'].split('api/')[1]
         except Exception as err:
@@ -671,9 +1142,18 @@ class OntapRestAPI(object):
         runtime = 0
         retries = 0
         max_retries = 3
+        start_time = time.time()
+        job_stats = dict(uuid=job.get('uuid') if isinstance(job, dict) else None, elapsed_time=0, poll_count=0)
+        interval = min(initial_increment, increment)
         while keep_running:
-            # Will run every every <increment> seconds for <timeout> seconds
+            # sleep first, as most jobs complete in a few seconds
+            # runtime is the sum of the sleep intervals, so that timeout is never exceeded by more than a poll
+            sleep_time = max(min(interval, timeout - runtime), 0)
+            time.sleep(sleep_time)
+            runtime += sleep_time
+            interval = min(interval * backoff, increment)
             job_json, job_error = self.get(url, None)
+            job_stats['poll_count'] += 1
             if job_error:
                 error = job_error
                 retries += 1
@@ -701,7 +1181,9 @@ class OntapRestAPI(object):
                 message = job_json.get('message', '')
                 if job_json['state'] == 'failure':
                     # if the job has failed, return message as error
-                    return None, message
+                    job_stats['elapsed_time'] = round(time.time() - start_time, 3)
+                    record_job_stats(self.module, job_stats)
+                    return None, message, job_stats
                 if job_json['state'] not in ('queued', 'running'):
                     keep_running = False
                 else:
@@ -710,10 +1192,81 @@ class OntapRestAPI(object):
                         keep_running = False
                         if job_json['state'] != 'success':
                             self.log_error(0, 'Timeout error: Process still running')
-            if keep_running:
-                time.sleep(increment)
-                runtime += increment
-        return message, error
+        job_stats['elapsed_time'] = round(time.time() - start_time, 3)
+        record_job_stats(self.module, job_stats)
+        return message, error, job_stats
+
+    def wait_on_jobs(self, jobs, timeout=600, increment=60, initial_increment=0.25, backoff=2, chunk_size=50):
+        ''' poll several jobs together until they all complete, fail, or timeout seconds have elapsed.
+            Each poll is a single GET cluster/jobs request for up to chunk_size jobs, using a uuid query.
+            Polling starts after initial_increment seconds, with the same backoff as wait_on_job.
+            Return a list of (job, error) tuples in the same order as jobs, where job is the last record
+            received for the job (uuid, state, message, code), and error is set if the job failed or could not be polled,
+            and job_stats, the elapsed time and poll count for all the jobs, also added to job_stats in the module result.
+        '''
+        records = [None] * len(jobs)
+        errors = [None] * len(jobs)
+        # the same job may be reported more than once
+        pending = dict()
+        for index, job in enumerate(jobs):
+            uuid = job.get('uuid') if isinstance(job, dict) else None
+            if uuid is None:
+                errors[index] = 'Job uuid not found in: %s' % repr(job)
+                continue
+            pending.setdefault(uuid, list()).append(index)
+        retries = dict()
+        max_retries = 3
+        runtime = 0
+        start_time = time.time()
+        job_stats = dict(uuid=None, job_count=len(jobs), elapsed_time=0, poll_count=0)
+        interval = min(initial_increment, increment)
+
+        def set_result(uuid, record, error):
+            for index in pending.pop(uuid):
+                records[index] = record
+                errors[index] = error
+
+        while pending:
+            # sleep first, as most jobs complete in a few seconds
+            sleep_time = max(min(interval, timeout - runtime), 0)
+            time.sleep(sleep_time)
+            runtime += sleep_time
+            interval = min(interval * backoff, increment)
+            uuids = list(pending)
+            for start in range(0, len(uuids), chunk_size):
+                chunk = uuids[start:start + chunk_size]
+                params = dict(uuid='|'.join(chunk), fields='state,message,code', max_records=len(chunk))
+                response, error = self.get('cluster/jobs', params)
+                job_stats['poll_count'] += 1
+                if error:
+                    for uuid in chunk:
+                        retries[uuid] = retries.get(uuid, 0) + 1
+                        if retries[uuid] > max_retries:
+                            self.log_error(0, 'Job error: Reach max retries.')
+                            set_result(uuid, None, error)
+                    continue
+                received = dict((record.get('uuid'), record) for record in (response or dict()).get('records', []))
+                for uuid in chunk:
+                    retries[uuid] = 0
+                    record = received.get(uuid)
+                    if record is None:
+                        set_result(uuid, None, 'Job %s not found' % uuid)
+                    elif record.get('state') == 'failure':
+                        set_result(uuid, record, record.get('message', 'job failed'))
+                    elif record.get('state') not in ('queued', 'running'):
+                        set_result(uuid, record, None)
+                    else:
+                        for index in pending[uuid]:
+                            records[index] = record
+            if pending and runtime >= timeout:
+                self.log_error(0, 'Timeout error: Process still running')
+                for uuid in list(pending):
+                    record = records[pending[uuid][0]]
+                    state = record.get('state') if record else 'unknown'
+                    set_result(uuid, record, 'Timeout error: job still %s after %s seconds' % (state, timeout))
+        job_stats['elapsed_time'] = round(time.time() - start_time, 3)
+        record_job_stats(self.module, job_stats)
+        return list(zip(records, errors)), job_stats
 
     def get(self, api, params=None):
         method = 'GET'
@@ -766,6 +1319,12 @@ class OntapRestAPI(object):
     def get_ontap_version_using_rest(self):
         # using GET rather than HEAD because the error messages are different,
         # and we need the version as some REST options are not available in earlier versions
+        # the version is cached on disk when probe_cache_ttl is set, to skip this call in subsequent tasks
+        cached_version = read_probe_cache(self.module, 'cluster_version')
+        if cached_version is not None:
+            self.set_version(cached_version)
+            self.is_rest_error = None
+            return 200
         method = 'GET'
         api = 'cluster'
         params = {'fields': ['version']}
@@ -774,6 +1333,8 @@ class OntapRestAPI(object):
         self.is_rest_error = str(error) if error else None
         if error:
             self.log_error(status_code, str(error))
+        elif status_code == 200 and self.ontap_version['valid']:
+            write_probe_cache(self.module, 'cluster_version', dict(version=message['version']))
         return status_code
 
     def _is_rest(self, used_unsupported_rest_properties=None):
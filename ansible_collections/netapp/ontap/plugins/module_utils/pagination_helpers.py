@@ -0,0 +1,165 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2021, NetApp, Inc
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Support functions for NetApp ansible modules
+
+    Provides generators to iterate over the pages or the records of a ZAPI get-iter call or a REST collection.
+    Pages are requested one at a time, and records are yielded as each page is received, so that the caller can stop
+    as soon as a record is found, or process a large collection without holding all of it in memory.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import itertools
+
+from ansible.module_utils.six.moves.urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from ansible_collections.netapp.ontap.plugins.module_utils import netapp as netapp_utils
+
+
+def get_page_size(max_records, limit):
+    ''' no need to request more records than the limit '''
+    if limit is not None and (max_records is None or limit < max_records):
+        return limit
+    return max_records
+
+
+def iter_zapi_pages(server, build_request, enable_tunneling=True):
+    """yield each result of a get-iter ZAPI, following next-tag
+       :param server: ZAPI connection
+       :param build_request: function returning the NaElement to send, called with None for the first page,
+                             then with the next-tag value returned by the previous page
+       :return: generator of NaElement, the results for each page
+       NaApiError is raised as is, and is to be reported by the caller.
+    """
+    next_tag = None
+    while True:
+        result = server.invoke_successfully(build_request(next_tag), enable_tunneling)
+        yield result
+        next_tag = result.get_child_content('next-tag')
+        if next_tag is None:
+            return
+
+
+def iter_zapi_records(server, api, query=None, max_records=None, limit=None, desired_attributes=None, enable_tunneling=True):
+    """yield the records for a get-iter ZAPI, following next-tag
+       :param server: ZAPI connection
+       :param api: name of the get-iter ZAPI, eg volume-get-iter
+       :param query: optional query NaElement, eg <query><volume-attributes>...</volume-attributes></query>
+       :param max_records: number of records per page, or None for the ONTAP default
+       :param limit: stop after yielding this number of records, or None for all records
+       :param desired_attributes: optional desired-attributes NaElement
+       :return: generator of NaElement, the children of attributes-list
+       NaApiError is raised as is, and is to be reported by the caller.
+    """
+    page_size = get_page_size(max_records, limit)
+
+    def build_request(next_tag):
+        get_iter = netapp_utils.zapi.NaElement(api)
+        if query is not None:
+            get_iter.add_child_elem(query)
+        if desired_attributes is not None:
+            get_iter.add_child_elem(desired_attributes)
+        if page_size is not None:
+            get_iter.add_new_child('max-records', str(page_size))
+        if next_tag is not None:
+            get_iter.add_new_child('tag', next_tag, True)
+        return get_iter
+
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    for result in iter_zapi_pages(server, build_request, enable_tunneling):
+        attributes_list = result.get_child_by_name('attributes-list')
+        if attributes_list is not None:
+            for record in attributes_list.get_children():
+                yield record
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+
+def set_max_records(href, max_records):
+    ''' replace or add max_records in the query string of a next link '''
+    scheme, netloc, path, query, fragment = urlsplit(href)
+    query = [(key, value) for key, value in parse_qsl(query, keep_blank_values=True) if key != 'max_records']
+    query.append(('max_records', str(max_records)))
+    return urlunsplit((scheme, netloc, path, urlencode(query), fragment))
+
+
+def iter_rest_next_pages(rest_api, response, max_records=None, max_records_limit=None):
+    """yield the pages following response for a REST collection, following _links.next
+       :param rest_api: OntapRestAPI object
+       :param response: a page, as returned by rest_api.get
+       :param max_records: number of records per page for response
+       :param max_records_limit: if set, the page size doubles for each following page up to this limit, for fewer round trips
+       :return: generator of (response, None) tuples, or a final (None, error) tuple if a call fails.
+    """
+    while True:
+        next_link = response.get('_links', dict()).get('next') if isinstance(response, dict) else None
+        if not next_link:
+            return
+        href = next_link['href']
+        if max_records_limit is not None and max_records is not None and max_records < max_records_limit:
+            max_records = min(max_records * 2, max_records_limit)
+            href = set_max_records(href, max_records)
+        # the next link includes the query parameters
+        response, error = rest_api.get(href.replace('/api/', '', 1), None)
+        if error:
+            yield None, error
+            return
+        yield response, None
+
+
+def iter_rest_records(rest_api, api, params=None, max_records=None, limit=None):
+    """yield the records for a REST collection, following _links.next
+       :param rest_api: OntapRestAPI object
+       :param api: collection, eg storage/volumes
+       :param params: optional dict of query parameters, eg fields or filters
+       :param max_records: number of records per page, or None for the ONTAP default
+       :param limit: stop after yielding this number of records, or None for all records
+       :return: generator of (record, None) tuples, or a single (None, error) tuple if a call fails.
+       The generator stops after reporting an error.
+    """
+    if limit is not None and limit <= 0:
+        return
+    params = dict(params or dict())
+    page_size = get_page_size(max_records, limit)
+    if page_size is not None:
+        params['max_records'] = page_size
+    response, error = rest_api.get(api, params)
+    count = 0
+    for page, error in itertools.chain([(response, error)], iter_rest_next_pages(rest_api, response)):
+        if error:
+            yield None, error
+            return
+        for record in (page or dict()).get('records', []):
+            yield record, None
+            count += 1
+            if limit is not None and count >= limit:
+                return
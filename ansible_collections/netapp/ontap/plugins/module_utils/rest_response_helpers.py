@@ -107,6 +107,7 @@ def check_for_0_or_more_records(api, response, error):
 def check_for_error_and_job_results(api, response, error, rest_api, **kwargs):
     """report first error if present
        otherwise call wait_on_job and retrieve job response or error
+       elapsed time and poll count for the job are reported in response['job_stats'], and in job_stats in the module result
     """
     if error:
         error = api_error(api, error)
@@ -115,9 +116,10 @@ def check_for_error_and_job_results(api, response, error, rest_api, **kwargs):
     #   or a job response, for asynchronous calls
     # and it's possible to expect both when 'return_timeout' > 0
     elif isinstance(response, dict) and 'job' in response:
-        job_response, error = rest_api.wait_on_job(response['job'], **kwargs)
+        job_response, error, job_stats = rest_api.wait_on_job_with_stats(response['job'], **kwargs)
         if error:
             error = job_error(response, error)
         else:
             response['job_response'] = job_response
+        response['job_stats'] = job_stats
     return response, error
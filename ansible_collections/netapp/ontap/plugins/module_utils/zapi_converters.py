@@ -0,0 +1,106 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2021, NetApp, Inc
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Support functions for NetApp ansible modules
+
+    Provides a direct conversion of ZAPI NaElement trees to python dicts and lists.
+    The output matches xmltodict.parse(element.to_string(), xml_attribs=False) after a json round trip,
+    without serializing the element to XML and parsing it again.
+    With xml_attribs=True, XML attributes are reported with a '@' prefix as xmltodict does, except for
+    namespace declarations (xmlns).
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+def _local_name(tag):
+    """strip the namespace if present, eg {http://www.netapp.com/filer/admin}volume-info"""
+    if tag[0] == '{':
+        return tag.split('}', 1)[1]
+    return tag
+
+
+def _convert(element, translate_keys, xml_attribs=False):
+    """convert an lxml element to None, a str, or a dict
+       repeated tags are reported as a list
+       text mixed with child elements or attributes is reported with a '#text' key
+    """
+    out = None
+    if xml_attribs and element.attrib:
+        out = dict()
+        for key, value in element.attrib.items():
+            key = '@' + _local_name(key)
+            if translate_keys:
+                key = key.replace('-', '_')
+            out[key] = value
+    text = [element.text] if element.text else []
+    for child in element.iterchildren():
+        if child.tail:
+            text.append(child.tail)
+        if not isinstance(child.tag, str):
+            # comment or processing instruction
+            continue
+        key = _local_name(child.tag)
+        if translate_keys:
+            key = key.replace('-', '_')
+        value = _convert(child, translate_keys, xml_attribs)
+        if out is None:
+            out = dict()
+        if key not in out:
+            out[key] = value
+        elif isinstance(out[key], list):
+            out[key].append(value)
+        else:
+            out[key] = [out[key], value]
+    text = ''.join(text).strip()
+    if out is None:
+        return text or None
+    if text:
+        out['#text'] = text
+    return out
+
+
+def element_to_dict(element, translate_keys=False, xml_attribs=False):
+    """convert an lxml element to a dict, using the element tag as the top level key
+       if translate_keys is True, - is replaced with _ in keys
+       if xml_attribs is True, attributes are reported with a '@' prefix
+    """
+    key = _local_name(element.tag)
+    if translate_keys:
+        key = key.replace('-', '_')
+    return {key: _convert(element, translate_keys, xml_attribs)}
+
+
+def zapi_to_dict(na_element, translate_keys=False, xml_attribs=False):
+    """convert a NaElement to a dict, using the element name as the top level key
+       if translate_keys is True, - is replaced with _ in keys
+       if xml_attribs is True, attributes are reported with a '@' prefix
+    """
+    # NaElement does not expose the lxml element
+    return element_to_dict(na_element._element, translate_keys, xml_attribs)     # pylint: disable=protected-access
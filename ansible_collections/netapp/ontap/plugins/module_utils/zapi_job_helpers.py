@@ -0,0 +1,147 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is BSD licensed.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright (c) 2021, NetApp, Inc
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+""" Support functions for NetApp ansible modules
+
+    Provides functions to wait for an asynchronous ZAPI job, or for a condition, to complete.
+    The polling interval starts small and doubles up to a maximum, so that short jobs are reported
+    as soon as they complete, and long jobs are not polled more often than needed.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+from ansible.module_utils._text import to_native
+from ansible_collections.netapp.ontap.plugins.module_utils import netapp as netapp_utils
+
+# job-get reports this error code when the job does not exist, or is owned by another vserver
+JOB_NOT_FOUND = '15661'
+
+
+def iter_delays(initial_delay, max_delay):
+    ''' yield initial_delay, doubling it up to max_delay '''
+    delay = initial_delay
+    while True:
+        yield delay
+        delay = min(delay * 2, max_delay)
+
+
+def wait_for_condition(get, done, timeout=None, initial_delay=1, max_delay=10, wait_first=False):
+    """call get() until done(value) returns True, or timeout seconds have been spent sleeping
+       :param get: function returning the current state, eg the current aggregate
+       :param done: function returning True when the state is final
+       :param timeout: in seconds, or None to wait forever
+       :param initial_delay: first polling interval, doubled after each poll up to max_delay
+       :param wait_first: sleep initial_delay before the first call to get
+       :return: (value, timed_out) where value is the last value returned by get()
+    """
+    elapsed = 0
+    value = None
+    delays = iter_delays(initial_delay, max_delay)
+    if not wait_first:
+        value = get()
+        if done(value):
+            return value, False
+    while timeout is None or elapsed < timeout:
+        delay = next(delays)
+        if timeout is not None:
+            delay = min(delay, timeout - elapsed)
+        time.sleep(delay)
+        elapsed += delay
+        value = get()
+        if done(value):
+            return value, False
+    return value, True
+
+
+def get_job(server, jobid):
+    """report the state of a job
+       :return: None if the job is not found, or a dict with job-state, job-progress, job-completion
+       Other NaApiError errors are raised as is, and are to be reported by the caller.
+    """
+    job_get = netapp_utils.zapi.NaElement('job-get')
+    job_get.add_new_child('job-id', str(jobid))
+    try:
+        result = server.invoke_successfully(job_get, enable_tunneling=True)
+    except netapp_utils.zapi.NaApiError as error:
+        if to_native(error.code) == JOB_NOT_FOUND:
+            return None
+        raise
+    job_info = result.get_child_by_name('attributes').get_child_by_name('job-info')
+    return {
+        'job-progress': job_info.get_child_content('job-progress'),
+        'job-state': job_info.get_child_content('job-state'),
+        'job-completion': job_info.get_child_content('job-completion')
+    }
+
+
+def get_cserver_connection(module, server):
+    """ZAPI connection to the admin vserver, created once and cached in the module object
+       :return: None if the admin vserver is not found
+    """
+    connection = getattr(module, '_netapp_cserver_connection', None)
+    if connection is None:
+        cserver = netapp_utils.get_cserver(server)
+        if cserver is None:
+            return None
+        connection = netapp_utils.setup_na_ontap_zapi(module=module, vserver=cserver)
+        module._netapp_cserver_connection = connection
+    return connection
+
+
+def wait_for_job(module, server, jobid, timeout, initial_delay=1, max_delay=5):
+    """poll job-get until the job is no longer queued or running, or timeout seconds have been spent sleeping
+       When running as cluster admin, the job is owned by the admin vserver rather than the target vserver,
+       and the job is looked up with the admin vserver connection.
+       :return: None if the job is not found, or the last job-get result as a dict with job-state, job-progress,
+                job-completion, and job-progress-history, the distinct job-progress messages, oldest first.
+       NaApiError is raised as is, and is to be reported by the caller.
+    """
+    connections = [server]
+    history = list()
+
+    def get():
+        results = get_job(connections[0], jobid)
+        if results is None and connections[0] is server:
+            cserver_connection = get_cserver_connection(module, server)
+            if cserver_connection is not None:
+                connections[0] = cserver_connection
+                results = get_job(cserver_connection, jobid)
+        if results is not None and results['job-progress'] and results['job-progress'] not in history:
+            history.append(results['job-progress'])
+        return results
+
+    def done(results):
+        return results is None or results['job-state'] not in ('queued', 'running')
+
+    results, dummy = wait_for_condition(get, done, timeout, initial_delay, max_delay)
+    if results is not None:
+        results['job-progress-history'] = history
+    return results
@@ -247,13 +247,13 @@ EXAMPLES = """
 RETURN = """
 
 """
-import time
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+import ansible_collections.netapp.ontap.plugins.module_utils.zapi_job_helpers as zapi_job_helpers
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
@@ -544,15 +544,8 @@ class NetAppOntapAggregate(object):
         try:
             self.server.invoke_successfully(aggr_create, enable_tunneling=False)
             if self.parameters.get('wait_for_online'):
-                # round off time_out
-                retries = (self.parameters['time_out'] + 5) / 10
-                current = self.get_aggr()
-                status = None if current is None else current['service_state']
-                while status != 'online' and retries > 0:
-                    time.sleep(10)
-                    retries = retries - 1
-                    current = self.get_aggr()
-                    status = None if current is None else current['service_state']
+                current, dummy = zapi_job_helpers.wait_for_condition(
+                    self.get_aggr, lambda current: current is not None and current['service_state'] == 'online', self.parameters['time_out'])
             else:
                 current = self.get_aggr()
             if current is not None and current.get('disk_count') != self.parameters.get('disk_count'):
@@ -424,9 +424,7 @@ reminder,max-http-size,max-smtp-size,remove-private-data,ondemand-server-url,sup
         return sanitized_modify
 
     def ems_log_event(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_autosupport", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_autosupport", self.server, self.module)
 
     def apply(self):
         """
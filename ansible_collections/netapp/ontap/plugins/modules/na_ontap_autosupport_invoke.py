@@ -173,9 +173,7 @@ class NetAppONTAPasupInvoke(object):
                 self.send_zapi_message(params, name)
 
     def ems_log_event(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        return netapp_utils.ems_log_event("na_ontap_autosupport_invoke", cserver)
+        return netapp_utils.ems_log_event_cserver("na_ontap_autosupport_invoke", self.server, self.module)
 
     def apply(self):
         if not self.use_rest:
@@ -426,9 +426,7 @@ class NetAppOntapBroadcastDomain(object):
         :param event_name: Name of the event log
         :return: None
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event(event_name, cserver)
+        netapp_utils.ems_log_event_cserver(event_name, self.server, self.module)
 
 
 def main():
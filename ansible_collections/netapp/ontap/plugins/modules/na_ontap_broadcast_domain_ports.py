@@ -187,9 +187,7 @@ class NetAppOntapBroadcastDomainPorts(object):
         """
         changed = False
         broadcast_domain_details = self.get_broadcast_domain_ports()
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_broadcast_domain_ports", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_broadcast_domain_ports", self.server, self.module)
         if broadcast_domain_details is None:
             self.module.fail_json(msg='Error broadcast domain not found: %s' % self.broadcast_domain)
         if self.state == 'present':  # execute create
@@ -146,6 +146,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+import ansible_collections.netapp.ontap.plugins.module_utils.zapi_job_helpers as zapi_job_helpers
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
@@ -430,35 +431,35 @@ class NetAppONTAPCluster(object):
         query.add_child_elem(node_status_info)
         cluster_node_status.add_child_elem(query)
 
-        is_complete = None
-        failure_msg = None
-        retries = self.parameters['time_out']
         errors = list()
-        while is_complete != 'success' and is_complete != 'failure' and retries > 0:
-            retries = retries - 10
-            time.sleep(10)
+
+        def get_status():
             try:
                 result = self.server.invoke_successfully(cluster_node_status, enable_tunneling=True)
             except netapp_utils.zapi.NaApiError as error:
                 if error.message == "Unable to find API: cluster-add-node-status-get-iter":
-                    # This API is not supported for 9.3 or earlier releases, just wait a bit
-                    time.sleep(60)
-                    return
+                    return dict(status='unsupported')
                 # collecting errors, and retrying
                 errors.append(repr(error))
-                continue
-
+                return dict(status=None)
             attributes_list = result.get_child_by_name('attributes-list')
+            if attributes_list is None:
+                return dict(status=None)
             join_progress = attributes_list.get_child_by_name('cluster-create-add-node-status-info')
-            is_complete = join_progress.get_child_content('status')
-            failure_msg = join_progress.get_child_content('failure-msg')
+            return dict(status=join_progress.get_child_content('status'), failure_msg=join_progress.get_child_content('failure-msg'))
 
         if self.parameters['time_out'] == 0:
-            is_complete = 'success'
-        if is_complete != 'success':
-            if 'Node is already in a cluster' in failure_msg:
+            return
+        progress, timed_out = zapi_job_helpers.wait_for_condition(
+            get_status, lambda progress: progress['status'] in ('success', 'failure', 'unsupported'), self.parameters['time_out'], wait_first=True)
+        if progress['status'] == 'unsupported':
+            # This API is not supported for 9.3 or earlier releases, just wait a bit
+            time.sleep(60)
+            return
+        if progress['status'] != 'success':
+            if 'Node is already in a cluster' in (progress.get('failure_msg') or ''):
                 return
-            elif retries <= 0:
+            elif timed_out:
                 errors.append("Timeout after %s seconds" % self.parameters['time_out'])
             self.module.fail_json(msg='Error adding node with ip address %s: %s'
                                   % (self.parameters['cluster_ip_address'], str(errors)))
@@ -482,9 +483,7 @@ class NetAppONTAPCluster(object):
         Autosupport log for cluster
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_cluster", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_cluster", self.server, self.module)
 
     def apply(self):
         """
@@ -196,10 +196,7 @@ class NetAppOntapDisks(object):
     def apply(self):
         '''Apply action to disks'''
         changed = False
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(
-            module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_disks", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_disks", self.server, self.module)
 
         # check if anything needs to be changed (add/delete/update)
         unowned_disks = self.get_unassigned_disk_count(disk_type=self.parameters.get('disk_type'))
@@ -105,6 +105,59 @@ options:
     required: true
     type: str
 
+  rules:
+    description:
+    - The complete, ordered list of rules for the export policy.
+    - The rules of the policy are read once, and a plan is computed to create, modify, delete, and reorder rules.
+    - Rules are matched on client_match, rules that are not in the list are deleted.
+    - Rules are numbered from 1 in the order of the list.
+    - Options that are not set for a rule default to the values set for the task.
+    - An empty list deletes all the rules of the policy.
+    - Requires state to be present, and is mutually exclusive with client_match and rule_index.
+    - The plan is reported in C(plan), and is not applied in check mode.
+    type: list
+    elements: dict
+    version_added: '21.7.0'
+    suboptions:
+      client_match:
+        description:
+        - List of Client Match host names, IP Addresses, Netgroups, or Domains.
+        required: true
+        type: list
+        elements: str
+      anonymous_user_id:
+        description:
+        - User name or ID to which anonymous users are mapped.
+        type: int
+      ro_rule:
+        description:
+        - List of Read only access specifications for the rule.
+        choices: ['any','none','never','krb5','krb5i','krb5p','ntlm','sys']
+        type: list
+        elements: str
+      rw_rule:
+        description:
+        - List of Read Write access specifications for the rule.
+        choices: ['any','none','never','krb5','krb5i','krb5p','ntlm','sys']
+        type: list
+        elements: str
+      super_user_security:
+        description:
+        - List of Read Write access specifications for the rule.
+        choices: ['any','none','never','krb5','krb5i','krb5p','ntlm','sys']
+        type: list
+        elements: str
+      allow_suid:
+        description:
+        - If 'true', NFS server will honor SetUID bits in SETATTR operation.
+        type: bool
+      protocol:
+        description:
+        - List of Client access protocols.
+        choices: [any,nfs,nfs3,nfs4,cifs,flexcache]
+        type: list
+        elements: str
+
 '''
 
 EXAMPLES = """
@@ -149,11 +202,35 @@ EXAMPLES = """
         username: "{{ netapp_username }}"
         password: "{{ netapp_password }}"
 
+    - name: Set all the rules of an export policy
+      na_ontap_export_policy_rule:
+        state: present
+        name: default123
+        vserver: ci_dev
+        ro_rule: sys
+        rw_rule: sys
+        protocol: nfs
+        rules:
+          - client_match: 10.10.10.0/24
+            rw_rule: krb5
+          - client_match: 10.10.20.0/24
+          - client_match: 0.0.0.0/0
+            rw_rule: never
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+
 """
 
 RETURN = """
-
-
+plan:
+  description:
+  - The actions to reconcile the export policy with C(rules), in the order they are applied.
+  - action is one of delete, modify, create, or move.  A move changes the rule index from C(from_index) to C(rule_index).
+  returned: when rules is set
+  type: list
+  elements: dict
+  sample: '[{"action": "create", "client_match": "10.10.20.0/24", "rule_index": 2}]'
 """
 import traceback
 
@@ -161,10 +238,15 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_zapi_records
 
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
+# number of rules per export-rule-get-iter call
+RULES_PAGE_SIZE = 1000
+RULE_ATTRIBUTES = ['anonymous_user_id', 'ro_rule', 'rw_rule', 'super_user_security', 'allow_suid', 'protocol']
+
 
 class NetAppontapExportRule(object):
     ''' object initialize and class methods '''
@@ -192,10 +274,21 @@ class NetAppontapExportRule(object):
             rule_index=dict(required=False, type='int'),
             anonymous_user_id=dict(required=False, type='int'),
             vserver=dict(required=True, type='str'),
+            rules=dict(required=False, type='list', elements='dict', options=dict(
+                client_match=dict(required=True, type='list', elements='str'),
+                protocol=dict(type='list', elements='str', choices=['any', 'nfs', 'nfs3', 'nfs4', 'cifs', 'flexcache']),
+                ro_rule=dict(type='list', elements='str', choices=['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']),
+                rw_rule=dict(type='list', elements='str', choices=['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']),
+                super_user_security=dict(type='list', elements='str',
+                                         choices=['any', 'none', 'never', 'krb5', 'krb5i', 'krb5p', 'ntlm', 'sys']),
+                allow_suid=dict(type='bool'),
+                anonymous_user_id=dict(type='int'),
+            )),
         ))
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
+            mutually_exclusive=[['rules', 'client_match'], ['rules', 'rule_index']],
             supports_check_mode=True
         )
 
@@ -274,25 +367,49 @@ class NetAppontapExportRule(object):
                                   exception=traceback.format_exc())
         if result is not None and \
                 result.get_child_by_name('num-records') and int(result.get_child_content('num-records')) >= 1:
-            current = dict()
             rule_info = result.get_child_by_name('attributes-list').get_child_by_name('export-rule-info')
-            for item_key, zapi_key in self.na_helper.zapi_string_keys.items():
-                current[item_key] = rule_info.get_child_content(zapi_key)
-            for item_key, zapi_key in self.na_helper.zapi_bool_keys.items():
-                current[item_key] = self.na_helper.get_value_for_bool(from_zapi=True,
-                                                                      value=rule_info[zapi_key])
-            for item_key, zapi_key in self.na_helper.zapi_int_keys.items():
-                current[item_key] = self.na_helper.get_value_for_int(from_zapi=True,
-                                                                     value=rule_info[zapi_key])
-            for item_key, zapi_key in self.na_helper.zapi_list_keys.items():
-                parent, dummy = zapi_key
-                current[item_key] = self.na_helper.get_value_for_list(from_zapi=True,
-                                                                      zapi_parent=rule_info.get_child_by_name(parent))
+            current = self.get_rule_details(rule_info)
             current['num_records'] = int(result.get_child_content('num-records'))
             if not self.parameters.get('rule_index'):
                 self.parameters['rule_index'] = current['rule_index']
         return current
 
+    def get_rule_details(self, rule_info):
+        """
+        Convert an export-rule-info element into a dictionary
+        """
+        current = dict()
+        for item_key, zapi_key in self.na_helper.zapi_string_keys.items():
+            current[item_key] = rule_info.get_child_content(zapi_key)
+        for item_key, zapi_key in self.na_helper.zapi_bool_keys.items():
+            current[item_key] = self.na_helper.get_value_for_bool(from_zapi=True,
+                                                                  value=rule_info[zapi_key])
+        for item_key, zapi_key in self.na_helper.zapi_int_keys.items():
+            current[item_key] = self.na_helper.get_value_for_int(from_zapi=True,
+                                                                 value=rule_info[zapi_key])
+        for item_key, zapi_key in self.na_helper.zapi_list_keys.items():
+            parent, dummy = zapi_key
+            current[item_key] = self.na_helper.get_value_for_list(from_zapi=True,
+                                                                  zapi_parent=rule_info.get_child_by_name(parent))
+        return current
+
+    def get_export_policy_rules(self):
+        """
+        Return all the rules of the export policy, following next-tag
+        :return: list of rules, ordered by rule index
+        """
+        query = netapp_utils.zapi.NaElement('query')
+        query.add_child_elem(netapp_utils.zapi.NaElement.create_node_with_children(
+            'export-rule-info', **{'policy-name': self.parameters['name'], 'vserver': self.parameters['vserver']}))
+        try:
+            rules = [self.get_rule_details(rule_info)
+                     for rule_info in iter_zapi_records(self.server, 'export-rule-get-iter', query, RULES_PAGE_SIZE)]
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error getting export policy rules %s: %s'
+                                  % (self.parameters['name'], to_native(error)),
+                                  exception=traceback.format_exc())
+        return sorted(rules, key=lambda rule: rule['rule_index'])
+
     def get_export_policy(self):
         """
         Return details about the export-policy
@@ -351,15 +468,21 @@ class NetAppontapExportRule(object):
                 na_element_object[zapi_key] = self.na_helper.get_value_for_bool(from_zapi=False,
                                                                                 value=values[key])
 
-    def create_export_policy_rule(self):
+    def check_create_parameters(self, rule):
+        for key in ['client_match', 'ro_rule', 'rw_rule']:
+            if rule.get(key) is None:
+                self.module.fail_json(msg='Error: Missing required param for creating export policy rule %s' % key)
+
+    def create_export_policy_rule(self, rule=None):
         """
         create rule for the export policy.
+        :param rule: rule parameters, defaults to the module parameters
         """
-        for key in ['client_match', 'ro_rule', 'rw_rule']:
-            if self.parameters.get(key) is None:
-                self.module.fail_json(msg='Error: Missing required param for creating export policy rule %s' % key)
+        if rule is None:
+            rule = self.parameters
+        self.check_create_parameters(rule)
         export_rule_create = netapp_utils.zapi.NaElement('export-rule-create')
-        self.add_parameters_for_create_or_modify(export_rule_create, self.parameters)
+        self.add_parameters_for_create_or_modify(export_rule_create, rule)
         try:
             self.server.invoke_successfully(export_rule_create, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
@@ -396,33 +519,149 @@ class NetAppontapExportRule(object):
                                   % (self.parameters['name'], to_native(error)),
                                   exception=traceback.format_exc())
 
-    def modify_export_policy_rule(self, params):
+    def modify_export_policy_rule(self, params, rule_index=None):
         '''
         Modify an existing export policy rule
         :param params: dict() of attributes with desired values
+        :param rule_index: index of the rule, defaults to the rule_index option
         :return: None
         '''
+        if rule_index is None:
+            rule_index = self.parameters['rule_index']
         export_rule_modify = netapp_utils.zapi.NaElement.create_node_with_children(
             'export-rule-modify', **{'policy-name': self.parameters['name'],
-                                     'rule-index': str(self.parameters['rule_index'])})
+                                     'rule-index': str(rule_index)})
         self.add_parameters_for_create_or_modify(export_rule_modify, params)
         try:
             self.server.invoke_successfully(export_rule_modify, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
-            self.module.fail_json(msg='Error modifying allow_suid %s: %s'
-                                  % (self.parameters['allow_suid'], to_native(error)),
+            self.module.fail_json(msg='Error modifying export policy rule %s index %s: %s'
+                                  % (self.parameters['name'], rule_index, to_native(error)),
+                                  exception=traceback.format_exc())
+
+    def set_export_policy_rule_index(self, rule_index, new_rule_index):
+        """
+        Move a rule, rules at or after the new index are shifted by ONTAP
+        """
+        export_rule_set_index = netapp_utils.zapi.NaElement.create_node_with_children(
+            'export-rule-set-index', **{'policy-name': self.parameters['name'],
+                                        'rule-index': str(rule_index),
+                                        'new-rule-index': str(new_rule_index)})
+        try:
+            self.server.invoke_successfully(export_rule_set_index, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error moving export policy rule %s from %d to %d: %s'
+                                  % (self.parameters['name'], rule_index, new_rule_index, to_native(error)),
                                   exception=traceback.format_exc())
 
     def autosupport_log(self):
         netapp_utils.ems_log_event("na_ontap_export_policy_rules", self.server)
 
+    @staticmethod
+    def format_client_match(client_match):
+        """
+        convert client_match list to comma-separated string
+        """
+        return ','.join(client_match).replace(' ', '')
+
+    def get_rules_parameters(self):
+        """
+        Merge the options set for each rule with the options set for the task, and number the rules from 1
+        """
+        rules = list()
+        for rule_index, rule in enumerate(self.parameters['rules'], start=1):
+            parameters = dict((key, self.parameters[key]) for key in RULE_ATTRIBUTES if key in self.parameters)
+            parameters.update(self.na_helper.filter_out_none_entries(rule))
+            parameters['client_match'] = self.format_client_match(rule['client_match'])
+            parameters['name'] = self.parameters['name']
+            parameters['rule_index'] = rule_index
+            rules.append(parameters)
+        clients = [rule['client_match'] for rule in rules]
+        duplicates = sorted(set(client for client in clients if clients.count(client) > 1))
+        if duplicates:
+            self.module.fail_json(msg='Error: duplicate client_match in rules: %s' % ', '.join(duplicates))
+        return rules
+
+    def get_rules_plan(self, current_rules, rules):
+        """
+        Compute the actions to go from the current rules to the desired rules:
+        - delete the rules that do not match any client_match (or are duplicates), in decreasing index order,
+        - modify the attributes of matched rules,
+        - create or move rules, in increasing index order, so that the rule at position N in the list is at index N.
+        ONTAP does not renumber the rules on delete, and shifts the rules at or after the target index on create or move.
+        Rules already in place are not moved.
+        :return: list of actions
+        """
+        matched = dict()
+        extra = list()
+        clients = set(rule['client_match'] for rule in rules)
+        for current in current_rules:
+            if current['client_match'] in clients and current['client_match'] not in matched:
+                matched[current['client_match']] = current
+            else:
+                extra.append(current)
+        plan = [dict(action='delete', client_match=current['client_match'], rule_index=current['rule_index'])
+                for current in reversed(extra)]
+        for rule in rules:
+            current = matched.get(rule['client_match'])
+            if current is None:
+                self.check_create_parameters(rule)
+                continue
+            modify = self.na_helper.get_modified_attributes(
+                dict((key, current.get(key)) for key in RULE_ATTRIBUTES if key in rule),
+                dict((key, rule[key]) for key in RULE_ATTRIBUTES if key in rule))
+            if modify:
+                plan.append(dict(action='modify', client_match=rule['client_match'], rule_index=current['rule_index'], modify=modify))
+        # model of the rule indexes, updated as rules are created or moved
+        indexes = dict((client, current['rule_index']) for client, current in matched.items())
+        for rule in rules:
+            client, rule_index = rule['client_match'], rule['rule_index']
+            from_index = indexes.pop(client, None)
+            if from_index == rule_index:
+                indexes[client] = rule_index
+                continue
+            if rule_index in indexes.values():
+                for other, other_index in indexes.items():
+                    if other_index >= rule_index and (from_index is None or other_index < from_index):
+                        indexes[other] = other_index + 1
+            indexes[client] = rule_index
+            if from_index is None:
+                plan.append(dict(action='create', client_match=client, rule_index=rule_index))
+            else:
+                plan.append(dict(action='move', client_match=client, from_index=from_index, rule_index=rule_index))
+        return plan
+
+    def apply_rules(self):
+        """
+        Reconcile all the rules of the export policy with the rules option
+        """
+        if self.parameters['state'] != 'present':
+            self.module.fail_json(msg='Error: rules requires state: present, use an empty list to delete all the rules.')
+        rules = self.get_rules_parameters()
+        plan = self.get_rules_plan(self.get_export_policy_rules(), rules)
+        if plan and not self.module.check_mode:
+            rules_by_client = dict((rule['client_match'], rule) for rule in rules)
+            if any(action['action'] == 'create' for action in plan) and not self.get_export_policy():
+                self.create_export_policy()
+            for action in plan:
+                if action['action'] == 'delete':
+                    self.delete_export_policy_rule(action['rule_index'])
+                elif action['action'] == 'modify':
+                    self.modify_export_policy_rule(action['modify'], action['rule_index'])
+                elif action['action'] == 'create':
+                    self.create_export_policy_rule(rules_by_client[action['client_match']])
+                elif action['action'] == 'move':
+                    self.set_export_policy_rule_index(action['from_index'], action['rule_index'])
+        self.module.exit_json(changed=bool(plan), plan=plan)
+
     def apply(self):
         ''' Apply required action from the play'''
         self.autosupport_log()
-        # convert client_match list to comma-separated string
+        if 'rules' in self.parameters:
+            self.apply_rules()
+            return
         if self.parameters.get('client_match') is not None:
-            self.parameters['client_match'] = ','.join(self.parameters['client_match'])
-            self.parameters['client_match'] = self.parameters['client_match'].replace(' ', '')
+            self.parameters['client_match'] = self.format_client_match(self.parameters['client_match'])
 
         current, modify = self.get_export_policy_rule(), None
         action = self.na_helper.get_cd_action(current, self.parameters)
@@ -237,7 +237,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
-import time
+import ansible_collections.netapp.ontap.plugins.module_utils.zapi_job_helpers as zapi_job_helpers
 
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
@@ -641,9 +641,9 @@ class NetAppONTAPFirmwareUpgrade(object):
         progress = self.download_sp_image_progress()
         # progress only show the current or most recent update/install operation.
         if progress['phase'] == 'Download':
-            while progress['run_status'] is not None and progress['run_status'] != 'Exited':
-                time.sleep(10)
-                progress = self.download_sp_image_progress()
+            if progress['run_status'] is not None and progress['run_status'] != 'Exited':
+                progress, dummy = zapi_job_helpers.wait_for_condition(
+                    self.download_sp_image_progress, lambda progress: progress['run_status'] in (None, 'Exited'), wait_first=True)
             if progress['exit_status'] != 'Success':
                 self.module.fail_json(msg=progress['exit_message'], exception=traceback.format_exc())
             return MSGS['dl_completed']
@@ -654,9 +654,7 @@ class NetAppONTAPFirmwareUpgrade(object):
         Autosupport log for software_update
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_firmware_upgrade", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_firmware_upgrade", self.server, self.module)
 
     def apply(self):
         """
@@ -688,10 +686,9 @@ class NetAppONTAPFirmwareUpgrade(object):
                 if not self.module.check_mode:
                     if self.sp_firmware_image_update():
                         changed = True
-                    firmware_update_progress = self.sp_firmware_image_update_progress_get(self.parameters['node'])
-                    while firmware_update_progress.get('is-in-progress') == 'true':
-                        time.sleep(25)
-                        firmware_update_progress = self.sp_firmware_image_update_progress_get(self.parameters['node'])
+                    firmware_update_progress, dummy = zapi_job_helpers.wait_for_condition(
+                        lambda: self.sp_firmware_image_update_progress_get(self.parameters['node']),
+                        lambda progress: progress.get('is-in-progress') != 'true', max_delay=25)
                 else:
                     # we don't know until we try the upgrade
                     changed = True
@@ -25,6 +25,7 @@ author: NetApp Ansible Team (@carchi8py) <ng-ansibleteam@netapp.com>
 
 description:
     - Add/Remove initiators from an igroup
+    - With REST, missing initiators are added with a single request.
 
 options:
   state:
@@ -62,6 +63,16 @@ options:
     required: true
     type: str
 
+  max_concurrency:
+    description:
+    - Maximum number of initiators added or removed in parallel with ZAPI.
+    - Each worker uses its own connection to ONTAP.
+    - With the default value of 1, initiators are added or removed one at a time.
+    - Ignored with REST, where missing initiators are added with a single request.
+    type: int
+    default: 1
+    version_added: '21.7.0'
+
 '''
 
 EXAMPLES = '''
@@ -84,6 +95,17 @@ EXAMPLES = '''
         username: "{{ netapp_username }}"
         password: "{{ netapp_password }}"
 
+    - name: Add initiators to an igroup, using up to 8 ZAPI connections
+      na_ontap_igroup_initiator:
+        names: 20:00:00:50:56:9f:00:01,20:00:00:50:56:9f:00:02,20:00:00:50:56:9f:00:03
+        initiator_group: esx_cluster
+        vserver: ansibleVServer
+        max_concurrency: 8
+        use_rest: never
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
+
 '''
 
 RETURN = '''
@@ -94,7 +116,9 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently, ThreadConnections
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+import ansible_collections.netapp.ontap.plugins.module_utils.rest_response_helpers as rrh
 
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
@@ -111,6 +135,7 @@ class NetAppOntapIgroupInitiator(object):
             initiator_group=dict(required=True, type='str'),
             force_remove=dict(required=False, type='bool', default=False),
             vserver=dict(required=True, type='str'),
+            max_concurrency=dict(required=False, type='int', default=1),
         ))
 
         self.module = AnsibleModule(
@@ -120,17 +145,43 @@ class NetAppOntapIgroupInitiator(object):
 
         self.na_helper = NetAppModule()
         self.parameters = self.na_helper.set_parameters(self.module.params)
-
-        if HAS_NETAPP_LIB is False:
-            self.module.fail_json(msg="the python NetApp-Lib module is required")
-        else:
-            self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.parameters['vserver'])
+        self.uuid = None
+
+        self.rest_api = netapp_utils.OntapRestAPI(self.module)
+        self.use_rest = self.rest_api.is_rest()
+
+        if not self.use_rest:
+            if HAS_NETAPP_LIB is False:
+                self.module.fail_json(msg="the python NetApp-Lib module is required")
+            else:
+                self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.parameters['vserver'])
+        self.connections = None
+
+    def get_server(self):
+        ''' return the connection for the current thread '''
+        return self.server if self.connections is None else self.connections.get()
+
+    def get_initiators_rest(self):
+        api = 'protocols/san/igroups'
+        query = {'name': self.parameters['initiator_group'],
+                 'svm.name': self.parameters['vserver'],
+                 'fields': 'uuid,initiators'}
+        response, error = self.rest_api.get(api, query)
+        igroup, error = rrh.check_for_0_or_1_records(api, response, error)
+        if error:
+            self.module.fail_json(msg='Error fetching igroup info %s: %s' % (self.parameters['initiator_group'], error))
+        if igroup is None:
+            return []
+        self.uuid = igroup['uuid']
+        return [initiator['name'] for initiator in igroup.get('initiators', [])]
 
     def get_initiators(self):
         """
         Get the existing list of initiators from an igroup
         :rtype: list() or None
         """
+        if self.use_rest:
+            return self.get_initiators_rest()
         igroup_info = netapp_utils.zapi.NaElement('igroup-get-iter')
         attributes = dict(query={'initiator-group-info': {'initiator-group-name': self.parameters['initiator_group'],
                                                           'vserver': self.parameters['vserver']}})
@@ -150,9 +201,11 @@ class NetAppOntapIgroupInitiator(object):
                 current = [initiator['initiator-name'] for initiator in igroup_info['initiators'].get_children()]
         return current
 
-    def modify_initiator(self, initiator_name, zapi):
+    def invoke_modify_initiator(self, initiator_name, zapi):
         """
-        Add or remove an initiator to/from an igroup
+        Add or remove an initiator to/from an igroup, using the connection for the current thread
+        This is safe to call from a worker thread, as errors are returned rather than reported.
+        :return: None or error message
         """
         options = {'initiator-group-name': self.parameters['initiator_group'],
                    'initiator': initiator_name,
@@ -160,32 +213,87 @@ class NetAppOntapIgroupInitiator(object):
         initiator_modify = netapp_utils.zapi.NaElement.create_node_with_children(zapi, **options)
 
         try:
-            self.server.invoke_successfully(initiator_modify, enable_tunneling=True)
+            self.get_server().invoke_successfully(initiator_modify, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
-            self.module.fail_json(msg='Error modifying igroup initiator %s: %s' % (initiator_name,
-                                                                                   to_native(error)),
-                                  exception=traceback.format_exc())
+            return 'Error modifying igroup initiator %s: %s' % (initiator_name, to_native(error))
+        return None
+
+    def modify_initiator(self, initiator_name, zapi):
+        """
+        Add or remove an initiator to/from an igroup
+        """
+        error = self.invoke_modify_initiator(initiator_name, zapi)
+        if error:
+            self.module.fail_json(msg=error, exception=traceback.format_exc())
+
+    def modify_initiators(self, initiator_names, zapi):
+        """
+        Add or remove initiators to/from an igroup, using up to max_concurrency connections
+        """
+        args_list = [(initiator_name, zapi) for initiator_name in initiator_names]
+        with ThreadConnections(self.server, netapp_utils.clone_zapi_server) as self.connections:
+            errors = [error for error in iter_concurrently(self.invoke_modify_initiator, args_list, self.parameters['max_concurrency']) if error]
+        if errors:
+            self.module.fail_json(msg='  '.join(errors), changed=len(errors) < len(args_list))
+
+    def add_initiators_rest(self, initiator_names):
+        """
+        Add all missing initiators to an igroup with a single request
+        """
+        if self.uuid is None:
+            self.module.fail_json(msg='Error: igroup %s not found in vserver %s' % (self.parameters['initiator_group'], self.parameters['vserver']))
+        api = 'protocols/san/igroups/%s/initiators' % self.uuid
+        body = dict(records=[dict(name=initiator_name) for initiator_name in initiator_names])
+        dummy, error = self.rest_api.post(api, body)
+        if error:
+            self.module.fail_json(msg='Error adding igroup initiators %s: %s' % (', '.join(initiator_names), error))
+
+    def remove_initiators_rest(self, initiator_names):
+        query = dict(allow_delete_while_mapped=True) if self.parameters['force_remove'] else None
+        for index, initiator_name in enumerate(initiator_names):
+            api = 'protocols/san/igroups/%s/initiators/%s' % (self.uuid, initiator_name)
+            dummy, error = self.rest_api.delete(api, params=query)
+            if error:
+                self.module.fail_json(msg='Error removing igroup initiator %s: %s' % (initiator_name, error), changed=index > 0)
+
+    def add_initiators(self, initiator_names):
+        if self.use_rest:
+            self.add_initiators_rest(initiator_names)
+        else:
+            self.modify_initiators(initiator_names, 'igroup-add')
+
+    def remove_initiators(self, initiator_names):
+        if self.use_rest:
+            self.remove_initiators_rest(initiator_names)
+        else:
+            self.modify_initiators(initiator_names, 'igroup-remove')
 
     def autosupport_log(self):
         netapp_utils.ems_log_event("na_ontap_igroup_initiator", self.server)
 
     def apply(self):
-        self.autosupport_log()
-        initiators = self.get_initiators()
+        if not self.use_rest:
+            self.autosupport_log()
+        current = set(self.get_initiators())
+        initiators = list()
         for initiator in self.parameters['names']:
-            present = None
             initiator = self.na_helper.sanitize_wwn(initiator)
-            if initiator in initiators:
-                present = True
-            cd_action = self.na_helper.get_cd_action(present, self.parameters)
-            if self.na_helper.changed:
-                if self.module.check_mode:
-                    pass
-                else:
-                    if cd_action == 'create':
-                        self.modify_initiator(initiator, 'igroup-add')
-                    elif cd_action == 'delete':
-                        self.modify_initiator(initiator, 'igroup-remove')
+            if initiator not in initiators:
+                initiators.append(initiator)
+        # compute the differences once, so that all changes can be applied together
+        if self.parameters['state'] == 'present':
+            to_add = [initiator for initiator in initiators if initiator not in current]
+            to_remove = []
+        else:
+            to_add = []
+            to_remove = [initiator for initiator in initiators if initiator in current]
+        if to_add or to_remove:
+            self.na_helper.changed = True
+            if not self.module.check_mode:
+                if to_add:
+                    self.add_initiators(to_add)
+                if to_remove:
+                    self.remove_initiators(to_remove)
         self.module.exit_json(changed=self.na_helper.changed)
 
 
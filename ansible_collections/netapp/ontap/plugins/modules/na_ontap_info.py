@@ -222,6 +222,15 @@ options:
         type: list
         elements: str
         default: never
+    max_concurrency:
+        description:
+        - Maximum number of subsets collected in parallel.
+        - Each worker uses its own connection to ONTAP.
+        - Subsets depending on other subsets, like net_ifgrp_info which requires net_port_info, are collected last.
+        - With the default value of 1, subsets are collected one at a time.
+        type: int
+        default: 1
+        version_added: '21.7.0'
 '''
 
 EXAMPLES = '''
@@ -322,6 +331,14 @@ EXAMPLES = '''
           state:
   register: ontap
 - debug: var=ontap
+
+- name: Get NetApp info as Cluster Admin, collecting up to 8 subsets in parallel
+  na_ontap_info:
+    hostname: "na-vsim"
+    username: "admin"
+    password: "admins_password"
+    max_concurrency: 8
+  register: ontap_info
 '''
 
 RETURN = '''
@@ -374,29 +391,22 @@ ontap_info:
 '''
 
 import copy
+import threading
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
-
-IMPORT_ERRORS = list()
-try:
-    import xmltodict
-    HAS_XMLTODICT = True
-except ImportError as exc:
-    HAS_XMLTODICT = False
-    IMPORT_ERRORS.append(str(exc))
-
-try:
-    import json
-    HAS_JSON = True
-except ImportError as exc:
-    HAS_JSON = False
-    IMPORT_ERRORS.append(str(exc))
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently, ThreadConnections
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_zapi_pages
+from ansible_collections.netapp.ontap.plugins.module_utils.zapi_converters import zapi_to_dict
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
 
+class WorkerError(Exception):
+    ''' fail_json arguments raised in a worker thread, to be reported from the main thread '''
+
+
 class NetAppONTAPGatherInfo(object):
     '''Class with gather info methods'''
 
@@ -658,6 +668,7 @@ class NetAppONTAPGatherInfo(object):
                 'method': self.get_ifgrp_info,
                 'kwargs': {},
                 'min_version': '0',
+                'depends_on': ['net_port_info'],
             },
             'ontap_system_version': {
                 'method': self.get_generic_get_iter,
@@ -1370,26 +1381,42 @@ class NetAppONTAPGatherInfo(object):
 
         # use vserver tunneling if vserver is present (not None)
         self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=module.params['vserver'])
+        self.owner_thread = threading.current_thread()
+        self.connections = None
+
+    def get_server(self):
+        ''' return the connection for the current thread '''
+        return self.server if self.connections is None else self.connections.get()
+
+    def clone_server(self):
+        ''' new connection with the same settings as self.server '''
+        return netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.module.params['vserver'])
+
+    def fail_json(self, **kwargs):
+        ''' module.fail_json exits the process, it can only be called from the main thread '''
+        if threading.current_thread() is self.owner_thread:
+            self.module.fail_json(**kwargs)
+        raise WorkerError(kwargs)
 
     def ontapi(self):
-        '''Method to get ontapi version'''
+        '''Method to get ontapi version, the ontap_version and ontapi_version subsets reuse the version read by get_all'''
 
+        if self.netapp_info.get('ontapi_version') is not None:
+            return self.netapp_info['ontapi_version']
         api = 'system-get-ontapi-version'
         api_call = netapp_utils.zapi.NaElement(api)
         try:
-            results = self.server.invoke_successfully(api_call, enable_tunneling=True)
+            results = self.get_server().invoke_successfully(api_call, enable_tunneling=True)
             ontapi_version = results.get_child_content('minor-version')
             return ontapi_version if ontapi_version is not None else '0'
         except netapp_utils.zapi.NaApiError as error:
-            self.module.fail_json(msg="Error calling API %s: %s" %
-                                  (api, to_native(error)), exception=traceback.format_exc())
+            self.fail_json(msg="Error calling API %s: %s" %
+                           (api, to_native(error)), exception=traceback.format_exc())
 
-    def call_api(self, call, attributes_list_tag='attributes-list', query=None, fail_on_error=True):
-        '''Main method to run an API call'''
+    def iter_pages(self, call, attributes_list_tag='attributes-list', query=None):
+        '''Run an API call, and return a generator yielding each page of results as it is received, following next-tag'''
 
         api_call = netapp_utils.zapi.NaElement(call)
-        initial_result = None
-        result = None
 
         if query:
             for key, val in query.items():
@@ -1400,27 +1427,46 @@ class NetAppONTAPGatherInfo(object):
             api_call.translate_struct(self.desired_attributes)
         if self.query is not None:
             api_call.translate_struct(self.query)
-        try:
-            initial_result = self.server.invoke_successfully(api_call, enable_tunneling=True)
-            next_tag = initial_result.get_child_by_name('next-tag')
-            result = copy.copy(initial_result)
 
-            while next_tag:
-                next_tag_call = netapp_utils.zapi.NaElement(call)
-                if query:
-                    for key, val in query.items():
-                        next_tag_call.add_new_child(key, val)
-
-                next_tag_call.add_new_child("tag", next_tag.get_content(), True)
-                next_result = self.server.invoke_successfully(next_tag_call, enable_tunneling=True)
+        def build_request(next_tag):
+            if next_tag is None:
+                return api_call
+            if attributes_list_tag is None:
+                self.fail_json(msg="Error calling API %s: %s" %
+                               (api_call.to_string(), "'next-tag' is not expected for this API"))
+            next_tag_call = netapp_utils.zapi.NaElement(call)
+            if query:
+                for key, val in query.items():
+                    next_tag_call.add_new_child(key, val)
+
+            next_tag_call.add_new_child("tag", next_tag, True)
+            return next_tag_call
+
+        return iter_zapi_pages(self.get_server(), build_request)
+
+    def get_api_error(self, call, error, fail_on_error):
+        '''Report or return an error message for a failed API call'''
+        kind, error_message = netapp_utils.classify_zapi_exception(error)
+        if kind == 'missing_vserver_api_error':
+            # for missing_vserver_api_error, the API is already in error_message
+            error_message = "Error invalid API.  %s" % error_message
+        else:
+            error_message = "Error calling API %s: %s" % (call, error_message)
+        if self.error_flags[kind] and fail_on_error:
+            self.fail_json(msg=error_message, exception=traceback.format_exc())
+        return error_message
 
-                next_tag = next_result.get_child_by_name('next-tag')
-                if attributes_list_tag is None:
-                    self.module.fail_json(msg="Error calling API %s: %s" %
-                                          (api_call.to_string(), "'next-tag' is not expected for this API"))
+    def call_api(self, call, attributes_list_tag='attributes-list', query=None, fail_on_error=True):
+        '''Main method to run an API call, returns all records in a single NaElement'''
 
+        result = None
+        try:
+            for page in self.iter_pages(call, attributes_list_tag, query):
+                if result is None:
+                    result = copy.copy(page)
+                    continue
                 result_attr = result.get_child_by_name(attributes_list_tag)
-                new_records = next_result.get_child_by_name(attributes_list_tag)
+                new_records = page.get_child_by_name(attributes_list_tag)
                 if new_records:
                     for record in new_records.get_children():
                         result_attr.add_child_elem(record)
@@ -1430,15 +1476,7 @@ class NetAppONTAPGatherInfo(object):
         except netapp_utils.zapi.NaApiError as error:
             if call in ['security-key-manager-key-get-iter']:
                 return result, None
-            kind, error_message = netapp_utils.classify_zapi_exception(error)
-            if kind == 'missing_vserver_api_error':
-                # for missing_vserver_api_error, the API is already in error_message
-                error_message = "Error invalid API.  %s" % error_message
-            else:
-                error_message = "Error calling API %s: %s" % (call, error_message)
-            if self.error_flags[kind] and fail_on_error:
-                self.module.fail_json(msg=error_message, exception=traceback.format_exc())
-            return None, error_message
+            return None, self.get_api_error(call, error, fail_on_error)
 
     def get_ifgrp_info(self):
         '''Method to get network port ifgroups info'''
@@ -1463,28 +1501,45 @@ class NetAppONTAPGatherInfo(object):
             tmp = self.get_generic_get_iter('net-port-ifgrp-get', key_fields=('node', 'ifgrp-name'),
                                             attribute='net-ifgrp-info', query=query,
                                             attributes_list_tag='attributes')
-            net_ifgrp_info = net_ifgrp_info.copy()
             net_ifgrp_info.update(tmp)
         return net_ifgrp_info
 
-    def get_generic_get_iter(self, call, attribute=None, key_fields=None, query=None, attributes_list_tag='attributes-list', fail_on_error=True):
-        '''Method to run a generic get-iter call'''
+    def key_name(self, key):
+        '''ZAPI tag as reported in the output'''
+        return key.replace('-', '_') if self.translate_keys else key
 
-        generic_call, error = self.call_api(call, attributes_list_tag, query, fail_on_error=fail_on_error)
+    def convert_record(self, record, attribute=None):
+        '''Convert a NaElement record to a dict, keys are translated in the same pass if requested'''
+        info = zapi_to_dict(record, self.translate_keys)
 
-        if error is not None:
-            return {'error': error}
+        if attribute is not None:
+            try:
+                info = info[self.key_name(attribute)]
+            except KeyError:
+                # report the ZAPI tag, rather than the translated key
+                raise KeyError(attribute)
+        return info
 
-        if generic_call is None:
+    def get_unique_key(self, call, info, key_fields, iteration):
+        '''Build the key identifying a record, or return None if key_fields is None'''
+        if key_fields is None:
             return None
+        try:
+            if isinstance(key_fields, str):
+                return _finditem(info, self.key_name(key_fields))
+            if isinstance(key_fields, tuple):
+                return ':'.join([_finditem(info, self.key_name(el)) for el in key_fields])
+        except KeyError as exc:
+            error_message = 'Error: key %s not found for %s, got: %s' % (str(exc), call, repr(info))
+            if self.error_flags['key_error']:
+                self.fail_json(msg=error_message, exception=traceback.format_exc())
+            return 'Error_%d_key_not_found_%s' % (iteration, exc.args[0])
+        return None
 
-        if attributes_list_tag is None:
-            attributes_list = generic_call
-        else:
-            attributes_list = generic_call.get_child_by_name(attributes_list_tag)
-
-        if attributes_list is None:
-            return None
+    def get_generic_get_iter(self, call, attribute=None, key_fields=None, query=None, attributes_list_tag='attributes-list', fail_on_error=True):
+        '''Method to run a generic get-iter call
+           Records are converted one page at a time, as they are received, so that only one page of XML is kept in memory.
+        '''
 
         if key_fields is None:
             out = []
@@ -1492,39 +1547,33 @@ class NetAppONTAPGatherInfo(object):
             out = {}
 
         iteration = 0
-        for child in attributes_list.get_children():
-            iteration += 1
-            dic = xmltodict.parse(child.to_string(), xml_attribs=False)
+        found_attributes_list = False
+        try:
+            for page in self.iter_pages(call, attributes_list_tag, query):
+                if attributes_list_tag is None:
+                    attributes_list = page
+                else:
+                    attributes_list = page.get_child_by_name(attributes_list_tag)
+
+                if attributes_list is None:
+                    continue
+                found_attributes_list = True
+
+                for child in attributes_list.get_children():
+                    iteration += 1
+                    info = self.convert_record(child, attribute)
+                    unique_key = self.get_unique_key(call, info, key_fields, iteration)
+                    if unique_key is not None:
+                        out[unique_key] = info
+                    else:
+                        out.append(info)
 
-            if attribute is not None:
-                dic = dic[attribute]
+        except netapp_utils.zapi.NaApiError as error:
+            if call not in ['security-key-manager-key-get-iter']:
+                return {'error': self.get_api_error(call, error, fail_on_error)}
 
-            info = json.loads(json.dumps(dic))
-            if self.translate_keys:
-                info = convert_keys(info)
-            if isinstance(key_fields, str):
-                try:
-                    unique_key = _finditem(dic, key_fields)
-                except KeyError as exc:
-                    error_message = 'Error: key %s not found for %s, got: %s' % (str(exc), call, repr(info))
-                    if self.error_flags['key_error']:
-                        self.module.fail_json(msg=error_message, exception=traceback.format_exc())
-                    unique_key = 'Error_%d_key_not_found_%s' % (iteration, exc.args[0])
-            elif isinstance(key_fields, tuple):
-                try:
-                    unique_key = ':'.join([_finditem(dic, el) for el in key_fields])
-                except KeyError as exc:
-                    error_message = 'Error: key %s not found for %s, got: %s' % (str(exc), call, repr(info))
-                    if self.error_flags['key_error']:
-                        self.module.fail_json(msg=error_message, exception=traceback.format_exc())
-                    unique_key = 'Error_%d_key_not_found_%s' % (iteration, exc.args[0])
-            else:
-                unique_key = None
-            if unique_key is not None:
-                out = out.copy()
-                out.update({unique_key: info})
-            else:
-                out.append(info)
+        if not found_attributes_list:
+            return None
 
         if attributes_list_tag is None and key_fields is None:
             if len(out) == 1:
@@ -1584,15 +1633,32 @@ class NetAppONTAPGatherInfo(object):
                 if len(run_subset) > 1:
                     self.module.fail_json(msg="query option is only supported with a single subset")
                 self.sanitize_query()
-            for subset in run_subset:
-                call = self.info_subsets[subset]
-                self.netapp_info[subset] = call['method'](**call['kwargs'])
+            # subsets depending on other subsets are collected once their dependencies are available
+            independent_subsets = sorted(subset for subset in run_subset if not self.info_subsets[subset].get('depends_on'))
+            dependent_subsets = sorted(subset for subset in run_subset if self.info_subsets[subset].get('depends_on'))
+            for subsets in (independent_subsets, dependent_subsets):
+                self.run_subsets(subsets)
 
         if self.warnings:
             self.netapp_info['module_warnings'] = self.warnings
 
         return self.netapp_info
 
+    def run_subsets(self, subsets):
+        ''' collect a list of independent subsets, using up to max_concurrency workers '''
+        max_concurrency = self.module.params.get('max_concurrency')
+        args_list = [(subset,) for subset in subsets]
+        try:
+            with ThreadConnections(self.server, lambda server: self.clone_server()) as self.connections:
+                for subset, info in zip(subsets, iter_concurrently(self.run_subset, args_list, max_concurrency)):
+                    self.netapp_info[subset] = info
+        except WorkerError as exc:
+            self.module.fail_json(**exc.args[0])
+
+    def run_subset(self, subset):
+        call = self.info_subsets[subset]
+        return call['method'](**call['kwargs'])
+
     def get_subset(self, gather_subset, version):
         '''Method to get a single subset'''
 
@@ -1760,6 +1826,7 @@ def main():
         use_native_zapi_tags=dict(type='bool', required=False, default=False),
         continue_on_error=dict(type='list', required=False, elements='str', default=['never']),
         query=dict(type='dict', required=False),
+        max_concurrency=dict(type='int', required=False, default=1),
     ))
 
     module = AnsibleModule(
@@ -1769,10 +1836,6 @@ def main():
 
     if not HAS_NETAPP_LIB:
         module.fail_json(msg=netapp_utils.netapp_lib_is_required())
-    if not HAS_XMLTODICT:
-        module.fail_json(msg="the python xmltodict module is required.  Import error: %s" % str(IMPORT_ERRORS))
-    if not HAS_JSON:
-        module.fail_json(msg="the python json module is required.  Import error: %s" % str(IMPORT_ERRORS))
 
     gather_subset = module.params['gather_subset']
     summary = module.params['summary']
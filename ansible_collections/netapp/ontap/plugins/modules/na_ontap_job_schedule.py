@@ -357,9 +357,7 @@ class NetAppONTAPJob(object):
         Autosupport log for job_schedule
         :return: None
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_job_schedule", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_job_schedule", self.server, self.module)
 
     def apply(self):
         """
@@ -281,10 +281,7 @@ class NetAppOntapLicense(object):
         changed = False
         create_license = False
         remove_license = False
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(
-            module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_license", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_license", self.server, self.module)
         # Add / Update licenses.
         license_status = self.get_licensing_status()
 
@@ -311,6 +311,7 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_zapi_records
 from ansible_collections.netapp.ontap.plugins.module_utils.rest_application import RestApplication
 import ansible_collections.netapp.ontap.plugins.module_utils.rest_volume as rest_volume
 
@@ -383,6 +384,7 @@ class NetAppOntapLUN(object):
 
         self.debug = dict()
         # self.debug['got'] = 'empty'     # uncomment to enable collecting data
+        self.lun_snapshot = None
 
         if HAS_NETAPP_LIB is False:
             self.module.fail_json(msg="the python NetApp-Lib module is required")
@@ -409,45 +411,87 @@ class NetAppOntapLUN(object):
             self.module.fail_json(msg="flexvol_name option is required when san_application_template is not present")
         return rest_api, rest_app
 
-    def get_luns(self, lun_path=None):
+    def get_luns(self, lun_path=None, names=None):
         """
         Return list of LUNs matching vserver and volume names.
+        If names is set, only LUNs matching one of the names, directly in the volume or in a qtree, are returned.
 
         :return: list of LUNs in XML format.
         :rtype: list
         """
-        luns = []
-        tag = None
         if lun_path is None and self.parameters.get('flexvol_name') is None:
-            return luns
+            return []
 
         query_details = netapp_utils.zapi.NaElement('lun-info')
         query_details.add_new_child('vserver', self.parameters['vserver'])
         if lun_path is not None:
-            query_details.add_new_child('lun_path', lun_path)
+            query_details.add_new_child('path', lun_path)
         else:
             query_details.add_new_child('volume', self.parameters['flexvol_name'])
+            if names:
+                # let ONTAP filter the LUNs, rather than reading all LUNs in the volume
+                patterns = list()
+                for name in names:
+                    if name.startswith('/vol/'):
+                        patterns.append(name)
+                    else:
+                        patterns.append('/vol/%s/%s' % (self.parameters['flexvol_name'], name))
+                        patterns.append('/vol/%s/*/%s' % (self.parameters['flexvol_name'], name))
+                query_details.add_new_child('path', '|'.join(patterns))
+        query = netapp_utils.zapi.NaElement('query')
+        query.add_child_elem(query_details)
+        return list(iter_zapi_records(self.server, 'lun-get-iter', query))
+
+    def get_lun_maps(self, paths):
+        """
+        Return LUN maps for a list of LUN paths, using a single lun-map-get-iter query
+
+        :return: list of (igroup name, lun id) tuples, indexed by LUN path
+        :rtype: dict
+        """
+        lun_maps = dict()
+        query_details = netapp_utils.zapi.NaElement('lun-map-info')
+        query_details.add_new_child('vserver', self.parameters['vserver'])
+        query_details.add_new_child('path', '|'.join(paths))
         query = netapp_utils.zapi.NaElement('query')
         query.add_child_elem(query_details)
 
-        while True:
-            lun_info = netapp_utils.zapi.NaElement('lun-get-iter')
-            lun_info.add_child_elem(query)
-            if tag:
-                lun_info.add_new_child('tag', tag, True)
-
-            result = self.server.invoke_successfully(lun_info, True)
-            if result.get_child_by_name('num-records') and int(result.get_child_content('num-records')) >= 1:
-                attr_list = result.get_child_by_name('attributes-list')
-                luns.extend(attr_list.get_children())
-            tag = result.get_child_content('next-tag')
-            if tag is None:
-                break
-        return luns
-
-    def get_lun_details(self, lun):
+        for lun_map in iter_zapi_records(self.server, 'lun-map-get-iter', query):
+            lun_maps.setdefault(lun_map.get_child_content('path'), list()).append(
+                (lun_map.get_child_content('initiator-group'), lun_map.get_child_content('lun-id')))
+        return lun_maps
+
+    def get_lun_snapshot(self):
+        """
+        Read the LUNs matching name or from_name, and their maps, with one lun-get-iter and one lun-map-get-iter query.
+        LUNs are indexed by path and by name, the snapshot reflects the state before any change is made.
+
+        :return: dict with names, by_path, by_name, and lun_maps keys
+        :rtype: dict
+        """
+        if self.lun_snapshot is None:
+            names = [self.parameters['name']]
+            if self.parameters.get('from_name') is not None:
+                names.append(self.parameters['from_name'])
+            by_path = dict()
+            by_name = dict()
+            for lun in self.get_luns(names=names):
+                path = lun.get_child_content('path')
+                by_path[path] = lun
+                by_name.setdefault(path.rpartition('/')[2], list()).append(lun)
+            mapped_paths = [path for path, lun in by_path.items() if lun.get_child_content('mapped') == 'true']
+            self.lun_snapshot = dict(
+                names=names,
+                by_path=by_path,
+                by_name=by_name,
+                lun_maps=self.get_lun_maps(mapped_paths) if mapped_paths else dict()
+            )
+        return self.lun_snapshot
+
+    def get_lun_details(self, lun, lun_maps=None):
         """
         Extract LUN details, from XML to python dict
+        lun_maps, if present, is used to find the igroup and lun id rather than querying ONTAP
 
         :return: Details about the lun
         :rtype: dict
@@ -481,17 +525,12 @@ class NetAppOntapLUN(object):
         attached_to = None
         lun_id = None
         if lun.get_child_content('mapped') == 'true':
-            lun_map_list = netapp_utils.zapi.NaElement.create_node_with_children(
-                'lun-map-list-info', **{'path': lun.get_child_content('path')})
-            result = self.server.invoke_successfully(
-                lun_map_list, enable_tunneling=True)
-            igroups = result.get_child_by_name('initiator-groups')
-            if igroups:
-                for igroup_info in igroups.get_children():
-                    igroup = igroup_info.get_child_content(
-                        'initiator-group-name')
-                    attached_to = igroup
-                    lun_id = igroup_info.get_child_content('lun-id')
+            path = lun.get_child_content('path')
+            if lun_maps is None:
+                lun_maps = self.get_lun_maps([path])
+            for igroup, igroup_lun_id in lun_maps.get(path, []):
+                attached_to = igroup
+                lun_id = igroup_lun_id
 
         return_value.update({
             'attached_to': attached_to,
@@ -526,10 +565,23 @@ class NetAppOntapLUN(object):
         :return: Details about the lun
         :rtype: dict
         """
-        luns = self.get_luns(lun_path)
-        lun = self.find_lun(luns, name, lun_path)
+        if lun_path is not None:
+            luns = self.get_luns(lun_path)
+            lun = self.find_lun(luns, name, lun_path)
+            if lun is not None:
+                return self.get_lun_details(lun)
+            return None
+        if self.parameters.get('flexvol_name') is None:
+            return None
+        snapshot = self.get_lun_snapshot()
+        if name not in snapshot['names']:
+            lun = self.find_lun(self.get_luns(names=[name]), name)
+            return self.get_lun_details(lun) if lun is not None else None
+        lun = snapshot['by_path'].get(name)
+        if lun is None and snapshot['by_name'].get(name):
+            lun = snapshot['by_name'][name][0]
         if lun is not None:
-            return self.get_lun_details(lun)
+            return self.get_lun_details(lun, snapshot['lun_maps'])
         return None
 
     def get_luns_from_app(self):
@@ -201,9 +201,7 @@ class NetAppOntapNetPort(object):
         AutoSupport log for na_ontap_net_port
         :return: None
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_net_port", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_net_port", self.server, self.module)
 
     def apply(self):
         """
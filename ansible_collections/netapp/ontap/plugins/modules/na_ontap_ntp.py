@@ -186,10 +186,7 @@ class NetAppOntapNTPServer(object):
 
         changed = False
         ntp_modify = False
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(
-            module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_ntp", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_ntp", self.server, self.module)
         ntp_server_details = self.get_ntp_server()
         if ntp_server_details is not None:
             if self.state == 'absent':  # delete
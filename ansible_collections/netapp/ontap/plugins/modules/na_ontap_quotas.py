@@ -100,6 +100,58 @@ options:
     default: resize
     type: str
     version_added: 20.12.0
+  quotas:
+    description:
+    - Manage several quota rules in a single task.
+    - The quota rules of each volume are read once, following next-tag, and indexed by type, target, qtree, and policy.
+    - Each element describes a rule, options that are not set for a rule default to the values set for the task.
+    - The quota status is updated, and quotas are resized or reinitialized, once per volume after all rules are applied.
+    - Mutually exclusive with C(quota_target) and C(type).
+    - The result reports the action and any modified limits for each rule in C(quotas).
+    type: list
+    elements: dict
+    version_added: '21.7.0'
+    suboptions:
+      quota_target:
+        description: The quota target of the type specified.
+        type: str
+        required: true
+      type:
+        description: The type of quota rule.
+        choices: ['user', 'group', 'tree']
+        type: str
+        required: true
+      volume:
+        description: The name of the volume that the quota resides on.
+        type: str
+      qtree:
+        description: Name of the qtree for the quota.
+        type: str
+      policy:
+        description: Name of the quota policy from which the quota rule should be obtained.
+        type: str
+      state:
+        description: Whether the quota rule should exist or not.
+        choices: ['present', 'absent']
+        type: str
+      perform_user_mapping:
+        description: Whether quota management will perform user mapping for the user specified in quota-target.
+        type: bool
+      file_limit:
+        description: The number of files that the target can have.
+        type: str
+      disk_limit:
+        description: The amount of disk space that is reserved for the target.
+        type: str
+      soft_file_limit:
+        description: The number of files the target would have to exceed before a message is logged and an SNMP trap is generated.
+        type: str
+      soft_disk_limit:
+        description: The amount of disk space the target would have to exceed before a message is logged and an SNMP trap is generated.
+        type: str
+      threshold:
+        description: The amount of disk space the target would have to exceed before a message is logged.
+        type: str
 '''
 
 EXAMPLES = """
@@ -162,6 +214,25 @@ EXAMPLES = """
         hostname: "{{ netapp_hostname }}"
         username: "{{ netapp_username }}"
         password: "{{ netapp_password }}"
+    - name: Add/Set several quotas, and resize once
+      na_ontap_quotas:
+        state: present
+        vserver: ansible
+        volume: ansible
+        policy: ansible
+        disk_limit: 10G
+        quotas:
+          - quota_target: user1
+            type: user
+          - quota_target: user2
+            type: user
+            disk_limit: 20G
+          - quota_target: user3
+            type: user
+            state: absent
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
     - name: Delete quota
       na_ontap_quotas:
         state: absent
@@ -176,7 +247,14 @@ EXAMPLES = """
 """
 
 RETURN = """
-
+quotas:
+  description:
+  - Per rule results when C(quotas) is set, in the same order.
+  - Each element reports volume, type, quota_target, qtree, and changed, and action or modify when applicable.
+  returned: when quotas is set
+  type: list
+  elements: dict
+  sample: '[{"volume": "ansible", "type": "user", "quota_target": "user1", "qtree": "", "changed": true, "action": "create"}]'
 """
 
 import time
@@ -185,9 +263,16 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_zapi_records
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
+# number of quota entries per quota-list-entries-iter call, ONTAP returns 20 by default
+QUOTA_PAGE_SIZE = 1000
+# options that require quota_target and type, or that provide default values for the rules in quotas
+QUOTA_ENTRY_OPTIONS = ['policy', 'perform_user_mapping', 'file_limit', 'disk_limit', 'soft_file_limit', 'soft_disk_limit', 'threshold']
+QUOTA_RULE_OPTIONS = ['volume', 'qtree', 'state'] + QUOTA_ENTRY_OPTIONS
+
 
 class NetAppONTAPQuotas(object):
     '''Class with quotas methods'''
@@ -210,21 +295,27 @@ class NetAppONTAPQuotas(object):
             soft_file_limit=dict(required=False, type='str'),
             soft_disk_limit=dict(required=False, type='str'),
             threshold=dict(required=False, type='str'),
-            activate_quota_on_change=dict(required=False, type='str', choices=['resize', 'reinitialize', 'none'], default='resize')
+            activate_quota_on_change=dict(required=False, type='str', choices=['resize', 'reinitialize', 'none'], default='resize'),
+            quotas=dict(required=False, type='list', elements='dict', options=dict(
+                quota_target=dict(required=True, type='str'),
+                type=dict(required=True, type='str', choices=['user', 'group', 'tree']),
+                volume=dict(type='str'),
+                qtree=dict(type='str'),
+                policy=dict(type='str'),
+                state=dict(type='str', choices=['present', 'absent']),
+                perform_user_mapping=dict(type='bool'),
+                file_limit=dict(type='str'),
+                disk_limit=dict(type='str'),
+                soft_file_limit=dict(type='str'),
+                soft_disk_limit=dict(type='str'),
+                threshold=dict(type='str'),
+            )),
         ))
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
-            required_by={
-                'policy': ['quota_target', 'type'],
-                'perform_user_mapping': ['quota_target', 'type'],
-                'file_limit': ['quota_target', 'type'],
-                'disk_limit': ['quota_target', 'type'],
-                'soft_file_limit': ['quota_target', 'type'],
-                'soft_disk_limit': ['quota_target', 'type'],
-                'threshold': ['quota_target', 'type'],
-            },
             required_together=[['quota_target', 'type']],
+            mutually_exclusive=[['quotas', 'quota_target'], ['quotas', 'type']],
             supports_check_mode=True
         )
 
@@ -235,23 +326,28 @@ class NetAppONTAPQuotas(object):
         if self.parameters.get('quota_target') == "":
             self.parameters['quota_target'] = '*'
 
+        if 'quotas' not in self.parameters and 'quota_target' not in self.parameters:
+            for option in QUOTA_ENTRY_OPTIONS:
+                if option in self.parameters:
+                    self.module.fail_json(msg="missing parameter(s) required by '%s': quota_target, type" % option)
+
         if HAS_NETAPP_LIB is False:
             self.module.fail_json(
                 msg="the python NetApp-Lib module is required")
         else:
             self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.parameters['vserver'])
 
-    def get_quota_status(self):
+    def get_quota_status(self, volume=None):
         """
         Return details about the quota status
         :param:
-            name : volume name
+            volume : volume name, defaults to the volume option
         :return: status of the quota. None if not found.
         :rtype: dict
         """
         quota_status_get = netapp_utils.zapi.NaElement('quota-status')
         quota_status_get.translate_struct({
-            'volume': self.parameters['volume']
+            'volume': volume or self.parameters['volume']
         })
         try:
             result = self.server.invoke_successfully(quota_status_get, enable_tunneling=True)
@@ -262,6 +358,61 @@ class NetAppONTAPQuotas(object):
             return result['status']
         return None
 
+    def get_quota_index(self, volume, quota_type=None, quota_target=None, policy=None):
+        """
+        Read the quota rules for a volume, following next-tag, optionally filtered by type, target, and policy
+        If quota-target is '*', the query treats it as a wildcard.  But a blank entry is represented as '*'.
+        Hence the need to index the records for an exact match.
+        :return: dict of {policy: quota details}, indexed by (type, target, qtree)
+        """
+        options = {'volume': volume, 'vserver': self.parameters['vserver']}
+        if quota_type is not None:
+            options['quota-type'] = quota_type
+        if quota_target is not None:
+            options['quota-target'] = quota_target
+        if policy:
+            options['policy'] = policy
+        query = netapp_utils.zapi.NaElement('query')
+        query.add_child_elem(netapp_utils.zapi.NaElement.create_node_with_children('quota-entry', **options))
+        quota_index = dict()
+        try:
+            for quota_entry in iter_zapi_records(self.server, 'quota-list-entries-iter', query, QUOTA_PAGE_SIZE):
+                key = (quota_entry.get_child_content('quota-type'), quota_entry.get_child_content('quota-target'),
+                       quota_entry.get_child_content('qtree') or '')
+                quota_index.setdefault(key, dict())[quota_entry.get_child_content('policy')] = self.get_quota_details(quota_entry)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching quotas info: %s' % to_native(error),
+                                  exception=traceback.format_exc())
+        return quota_index
+
+    def get_quota_details(self, quota_entry):
+        """
+        Convert a quota-entry element into a dictionary
+        """
+        return_values = {'volume': quota_entry.get_child_content('volume'),
+                         'file_limit': quota_entry.get_child_content('file-limit'),
+                         'disk_limit': quota_entry.get_child_content('disk-limit'),
+                         'soft_file_limit': quota_entry.get_child_content('soft-file-limit'),
+                         'soft_disk_limit': quota_entry.get_child_content('soft-disk-limit'),
+                         'threshold': quota_entry.get_child_content('threshold')}
+        value = self.na_helper.safe_get(quota_entry, ['perform-user-mapping'])
+        if value is not None:
+            return_values['perform_user_mapping'] = self.na_helper.get_value_for_bool(True, value)
+        return return_values
+
+    @staticmethod
+    def find_quota(quota_index, rule):
+        """
+        Find a rule in the index, if policy is not set, the rule may belong to any policy
+        :return: quota details, or None if not found
+        """
+        rules = quota_index.get((rule['type'], rule['quota_target'], rule['qtree']))
+        if not rules:
+            return None
+        if rule.get('policy'):
+            return rules.get(rule['policy'])
+        return rules[sorted(rules, key=str)[0]]
+
     def get_quotas(self):
         """
         Get quota details
@@ -269,132 +420,104 @@ class NetAppONTAPQuotas(object):
         """
         if self.parameters.get('type') is None:
             return None
-        quota_get = netapp_utils.zapi.NaElement('quota-list-entries-iter')
-        query = {
-            'query': {
-                'quota-entry': {
-                    'volume': self.parameters['volume'],
-                    'quota-target': self.parameters['quota_target'],
-                    'quota-type': self.parameters['type'],
-                    'vserver': self.parameters['vserver']
-                }
-            }
-        }
-        quota_get.translate_struct(query)
-        if self.parameters.get('policy'):
-            quota_get['query']['quota-entry'].add_new_child('policy', self.parameters['policy'])
-        try:
-            result = self.server.invoke_successfully(quota_get, enable_tunneling=True)
-        except netapp_utils.zapi.NaApiError as error:
-            self.module.fail_json(msg='Error fetching quotas info: %s' % to_native(error),
-                                  exception=traceback.format_exc())
-        if result.get_child_by_name('num-records') and int(result.get_child_content('num-records')) >= 1:
-            # if quota-target is '*', the query treats it as a wildcard. But a blank entry is represented as '*'.
-            # Hence the need to loop through all records to find a match.
-            for quota_entry in result.get_child_by_name('attributes-list').get_children():
-                quota_target = quota_entry.get_child_content('quota-target')
-                if quota_target == self.parameters['quota_target']:
-                    return_values = {'volume': quota_entry.get_child_content('volume'),
-                                     'file_limit': quota_entry.get_child_content('file-limit'),
-                                     'disk_limit': quota_entry.get_child_content('disk-limit'),
-                                     'soft_file_limit': quota_entry.get_child_content('soft-file-limit'),
-                                     'soft_disk_limit': quota_entry.get_child_content('soft-disk-limit'),
-                                     'threshold': quota_entry.get_child_content('threshold')}
-                    value = self.na_helper.safe_get(quota_entry, ['perform-user-mapping'])
-                    if value is not None:
-                        return_values['perform_user_mapping'] = self.na_helper.get_value_for_bool(True, value)
-                    return return_values
-        return None
+        quota_index = self.get_quota_index(self.parameters['volume'], self.parameters['type'],
+                                           self.parameters['quota_target'], self.parameters.get('policy'))
+        return self.find_quota(quota_index, self.parameters)
 
-    def quota_entry_set(self):
+    @staticmethod
+    def get_quota_entry_options(rule):
+        """
+        ZAPI options for the limits of a rule
+        """
+        options = dict()
+        if rule.get('file_limit'):
+            options['file-limit'] = rule['file_limit']
+        if rule.get('disk_limit'):
+            options['disk-limit'] = rule['disk_limit']
+        if rule.get('perform_user_mapping') is not None:
+            options['perform-user-mapping'] = str(rule['perform_user_mapping'])
+        if rule.get('soft_file_limit'):
+            options['soft-file-limit'] = rule['soft_file_limit']
+        if rule.get('soft_disk_limit'):
+            options['soft-disk-limit'] = rule['soft_disk_limit']
+        if rule.get('threshold'):
+            options['threshold'] = rule['threshold']
+        if rule.get('policy'):
+            options['policy'] = str(rule['policy'])
+        return options
+
+    def quota_entry_set(self, rule=None):
         """
         Adds a quota entry
+        :param rule: rule parameters, defaults to the module parameters
         """
-        options = {'volume': self.parameters['volume'],
-                   'quota-target': self.parameters['quota_target'],
-                   'quota-type': self.parameters['type'],
-                   'qtree': self.parameters['qtree']}
-
-        if self.parameters.get('file_limit'):
-            options['file-limit'] = self.parameters['file_limit']
-        if self.parameters.get('disk_limit'):
-            options['disk-limit'] = self.parameters['disk_limit']
-        if self.parameters.get('perform_user_mapping') is not None:
-            options['perform-user-mapping'] = str(self.parameters['perform_user_mapping'])
-        if self.parameters.get('soft_file_limit'):
-            options['soft-file-limit'] = self.parameters['soft_file_limit']
-        if self.parameters.get('soft_disk_limit'):
-            options['soft-disk-limit'] = self.parameters['soft_disk_limit']
-        if self.parameters.get('threshold'):
-            options['threshold'] = self.parameters['threshold']
-        if self.parameters.get('policy'):
-            options['policy'] = self.parameters['policy']
+        if rule is None:
+            rule = self.parameters
+        options = {'volume': rule['volume'],
+                   'quota-target': rule['quota_target'],
+                   'quota-type': rule['type'],
+                   'qtree': rule['qtree']}
+        options.update(self.get_quota_entry_options(rule))
         set_entry = netapp_utils.zapi.NaElement.create_node_with_children(
             'quota-set-entry', **options)
         try:
             self.server.invoke_successfully(set_entry, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
             self.module.fail_json(msg='Error adding/modifying quota entry %s: %s'
-                                  % (self.parameters['volume'], to_native(error)),
+                                  % (rule['volume'], to_native(error)),
                                   exception=traceback.format_exc())
 
-    def quota_entry_delete(self):
+    def quota_entry_delete(self, rule=None):
         """
         Deletes a quota entry
+        :param rule: rule parameters, defaults to the module parameters
         """
-        options = {'volume': self.parameters['volume'],
-                   'quota-target': self.parameters['quota_target'],
-                   'quota-type': self.parameters['type'],
-                   'qtree': self.parameters['qtree']}
+        if rule is None:
+            rule = self.parameters
+        options = {'volume': rule['volume'],
+                   'quota-target': rule['quota_target'],
+                   'quota-type': rule['type'],
+                   'qtree': rule['qtree']}
         set_entry = netapp_utils.zapi.NaElement.create_node_with_children(
             'quota-delete-entry', **options)
-        if self.parameters.get('policy'):
-            set_entry.add_new_child('policy', self.parameters['policy'])
+        if rule.get('policy'):
+            set_entry.add_new_child('policy', rule['policy'])
         try:
             self.server.invoke_successfully(set_entry, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
             self.module.fail_json(msg='Error deleting quota entry %s: %s'
-                                  % (self.parameters['volume'], to_native(error)),
+                                  % (rule['volume'], to_native(error)),
                                   exception=traceback.format_exc())
 
-    def quota_entry_modify(self, modify_attrs):
+    def quota_entry_modify(self, modify_attrs, rule=None):
         """
         Modifies a quota entry
+        :param rule: rule parameters, defaults to the module parameters
         """
-        options = {'volume': self.parameters['volume'],
-                   'quota-target': self.parameters['quota_target'],
-                   'quota-type': self.parameters['type'],
-                   'qtree': self.parameters['qtree']}
+        if rule is None:
+            rule = self.parameters
+        options = {'volume': rule['volume'],
+                   'quota-target': rule['quota_target'],
+                   'quota-type': rule['type'],
+                   'qtree': rule['qtree']}
         options.update(modify_attrs)
-        if self.parameters.get('file_limit'):
-            options['file-limit'] = self.parameters['file_limit']
-        if self.parameters.get('disk_limit'):
-            options['disk-limit'] = self.parameters['disk_limit']
-        if self.parameters.get('perform_user_mapping') is not None:
-            options['perform-user-mapping'] = str(self.parameters['perform_user_mapping'])
-        if self.parameters.get('soft_file_limit'):
-            options['soft-file-limit'] = self.parameters['soft_file_limit']
-        if self.parameters.get('soft_disk_limit'):
-            options['soft-disk-limit'] = self.parameters['soft_disk_limit']
-        if self.parameters.get('threshold'):
-            options['threshold'] = self.parameters['threshold']
-        if self.parameters.get('policy'):
-            options['policy'] = str(self.parameters['policy'])
+        options.update(self.get_quota_entry_options(rule))
         modify_entry = netapp_utils.zapi.NaElement.create_node_with_children(
             'quota-modify-entry', **options)
         try:
             self.server.invoke_successfully(modify_entry, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
             self.module.fail_json(msg='Error modifying quota entry %s: %s'
-                                  % (self.parameters['volume'], to_native(error)),
+                                  % (rule['volume'], to_native(error)),
                                   exception=traceback.format_exc())
 
-    def on_or_off_quota(self, status, cd_action=None):
+    def on_or_off_quota(self, status, cd_action=None, volume=None):
         """
         on or off quota
         """
+        volume = volume or self.parameters['volume']
         quota = netapp_utils.zapi.NaElement.create_node_with_children(
-            status, **{'volume': self.parameters['volume']})
+            status, **{'volume': volume})
         try:
             self.server.invoke_successfully(quota,
                                             enable_tunneling=True)
@@ -404,15 +527,16 @@ class NetAppONTAPQuotas(object):
                 self.module.warn('Last rule deleted, quota is off.')
                 return
             self.module.fail_json(msg='Error setting %s for %s: %s'
-                                  % (status, self.parameters['volume'], to_native(error)),
+                                  % (status, volume, to_native(error)),
                                   exception=traceback.format_exc())
 
-    def resize_quota(self, cd_action=None):
+    def resize_quota(self, cd_action=None, volume=None):
         """
         resize quota
         """
+        volume = volume or self.parameters['volume']
         quota = netapp_utils.zapi.NaElement.create_node_with_children(
-            'quota-resize', **{'volume': self.parameters['volume']})
+            'quota-resize', **{'volume': volume})
         try:
             self.server.invoke_successfully(quota,
                                             enable_tunneling=True)
@@ -422,32 +546,118 @@ class NetAppONTAPQuotas(object):
                 self.module.warn('Last rule deleted, but quota is on as resize is not allowed.')
                 return
             self.module.fail_json(msg='Error setting %s for %s: %s'
-                                  % ('quota-resize', self.parameters['volume'], to_native(error)),
+                                  % ('quota-resize', volume, to_native(error)),
                                   exception=traceback.format_exc())
 
+    def get_quota_status_action(self, na_helper, volume, rules_changed):
+        """
+        Whether to turn quota on or off for set_quota_status, or to resize or reinitialize quota after a rule change
+        :return: None, 'quota-on', 'quota-off', 'resize', or 'reinitialize'
+        """
+        modify_quota_status = None
+        quota_status = self.get_quota_status(volume)
+        if 'set_quota_status' in self.parameters and quota_status is not None:
+            quota_status_action = na_helper.get_modified_attributes(
+                {'set_quota_status': True if quota_status == 'on' else False}, self.parameters)
+            if quota_status_action:
+                modify_quota_status = 'quota-on' if quota_status_action['set_quota_status'] else 'quota-off'
+        if rules_changed and modify_quota_status is None and quota_status in ('on', None):
+            # do we need to resize or reinitialize:
+            if self.parameters['activate_quota_on_change'] in ['resize', 'reinitialize']:
+                modify_quota_status = self.parameters['activate_quota_on_change']
+        return modify_quota_status
+
+    def activate_quota(self, modify_quota_status, cd_action, volume):
+        """
+        Turn quota on or off, or resize or reinitialize quota
+        """
+        if modify_quota_status in ['quota-off', 'quota-on']:
+            self.on_or_off_quota(modify_quota_status, volume=volume)
+        elif modify_quota_status == 'resize':
+            self.resize_quota(cd_action, volume)
+        elif modify_quota_status == 'reinitialize':
+            self.on_or_off_quota('quota-off', volume=volume)
+            time.sleep(10)  # status switch interval
+            self.on_or_off_quota('quota-on', cd_action, volume)
+
+    def get_rule_parameters(self, rule):
+        """
+        Merge the options set for a rule with the options set for the task
+        """
+        parameters = dict((option, self.parameters[option]) for option in QUOTA_RULE_OPTIONS if option in self.parameters)
+        parameters.update(self.na_helper.filter_out_none_entries(rule))
+        # converted blank parameter to * as shown in vsim
+        if parameters['quota_target'] == "":
+            parameters['quota_target'] = '*'
+        return parameters
+
+    def apply_quotas(self):
+        """
+        Create, modify, or delete several quota rules
+        The rules of each volume are read once, quota is resized or reinitialized once per volume
+        """
+        rules = [self.get_rule_parameters(rule) for rule in self.parameters['quotas']]
+        keys = [(rule['volume'], rule['type'], rule['quota_target'], rule['qtree'], rule.get('policy')) for rule in rules]
+        duplicates = sorted(set(key for key in keys if keys.count(key) > 1))
+        if duplicates:
+            self.module.fail_json(msg='Error: duplicate rules in quotas: %s' % ', '.join(repr(key) for key in duplicates))
+        volumes = list()
+        for rule in rules:
+            if rule['volume'] not in volumes:
+                volumes.append(rule['volume'])
+        quota_indexes = dict((volume, self.get_quota_index(volume)) for volume in volumes)
+        results = list()
+        volume_actions = dict()
+        for rule in rules:
+            na_helper = NetAppModule()
+            current = self.find_quota(quota_indexes[rule['volume']], rule)
+            cd_action = na_helper.get_cd_action(current, rule)
+            modify_quota = na_helper.get_modified_attributes(current, rule) if cd_action is None else None
+            result = dict((option, rule[option]) for option in ('volume', 'type', 'quota_target', 'qtree'))
+            result['changed'] = na_helper.changed
+            if cd_action is not None:
+                result['action'] = cd_action
+            elif modify_quota:
+                result['action'] = 'modify'
+                result['modify'] = dict(modify_quota)
+            results.append(result)
+            if na_helper.changed:
+                # a delete allows for quota-on and quota-resize to fail when the last rule is deleted
+                if volume_actions.get(rule['volume']) != 'delete':
+                    volume_actions[rule['volume']] = cd_action or 'modify'
+                if not self.module.check_mode:
+                    if cd_action == 'create':
+                        self.quota_entry_set(rule)
+                    elif cd_action == 'delete':
+                        self.quota_entry_delete(rule)
+                    else:
+                        self.quota_entry_modify(dict((key.replace('_', '-'), value) for key, value in modify_quota.items()), rule)
+        changed = any(result['changed'] for result in results)
+        for volume in volumes:
+            na_helper = NetAppModule()
+            modify_quota_status = self.get_quota_status_action(na_helper, volume, volume in volume_actions)
+            changed = changed or na_helper.changed
+            if modify_quota_status is not None and not self.module.check_mode:
+                self.activate_quota(modify_quota_status, volume_actions.get(volume), volume)
+        self.module.exit_json(changed=changed, quotas=results)
+
     def apply(self):
         """
         Apply action to quotas
         """
         netapp_utils.ems_log_event("na_ontap_quotas", self.server)
+        if self.parameters.get('quotas'):
+            self.apply_quotas()
+            return
         cd_action = None
-        modify_quota_status = None
         modify_quota = None
         current = self.get_quotas()
         if self.parameters.get('type') is not None:
             cd_action = self.na_helper.get_cd_action(current, self.parameters)
             if cd_action is None:
                 modify_quota = self.na_helper.get_modified_attributes(current, self.parameters)
-        quota_status = self.get_quota_status()
-        if 'set_quota_status' in self.parameters and quota_status is not None:
-            quota_status_action = self.na_helper.get_modified_attributes(
-                {'set_quota_status': True if quota_status == 'on' else False}, self.parameters)
-            if quota_status_action:
-                modify_quota_status = 'quota-on' if quota_status_action['set_quota_status'] else 'quota-off'
-        if (cd_action is not None or modify_quota is not None) and modify_quota_status is None and quota_status in ('on', None):
-            # do we need to resize or reinitialize:
-            if self.parameters['activate_quota_on_change'] in ['resize', 'reinitialize']:
-                modify_quota_status = self.parameters['activate_quota_on_change']
+        modify_quota_status = self.get_quota_status_action(self.na_helper, self.parameters['volume'],
+                                                           cd_action is not None or modify_quota is not None)
         if self.na_helper.changed:
             if self.module.check_mode:
                 pass
@@ -460,14 +670,7 @@ class NetAppONTAPQuotas(object):
                     for key in list(modify_quota):
                         modify_quota[key.replace("_", "-")] = modify_quota.pop(key)
                     self.quota_entry_modify(modify_quota)
-                if modify_quota_status in ['quota-off', 'quota-on']:
-                    self.on_or_off_quota(modify_quota_status)
-                elif modify_quota_status == 'resize':
-                    self.resize_quota(cd_action)
-                elif modify_quota_status == 'reinitialize':
-                    self.on_or_off_quota('quota-off')
-                    time.sleep(10)  # status switch interval
-                    self.on_or_off_quota('quota-on', cd_action)
+                self.activate_quota(modify_quota_status, cd_action, self.parameters['volume'])
 
         self.module.exit_json(changed=self.na_helper.changed)
 
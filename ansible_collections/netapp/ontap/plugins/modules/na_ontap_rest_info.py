@@ -105,6 +105,14 @@ options:
         description:
             - Maximum number of records returned in a single call.
         default: 1024
+    max_records_limit:
+        type: int
+        description:
+            - When set and greater than C(max_records), the number of records requested is doubled for each following page, up to this limit.
+            - ONTAP pagination uses a cursor in the next link, so pages cannot be requested concurrently, larger pages reduce the number of round trips.
+            - For instance, with the default C(max_records) of 1024 and a limit of 65536, 100000 records are collected in 7 calls rather than 98.
+            - ONTAP may return fewer records than requested if C(return_timeout) expires, following pages are still collected.
+        version_added: '21.7.0'
     fields:
         type: list
         elements: str
@@ -114,11 +122,75 @@ options:
                '<list of fields>'  to return specified fields, only one subset will be allowed.
             - If the option is not present, return all the fields.
         version_added: '20.6.0'
+    profile:
+        type: str
+        description:
+            - Request a curated set of fields for each subset, ignored for a subset if C(fields) or C(subset_fields) is set.
+            - C(minimal) requests the fields identifying each record, for instance uuid, name, and svm.name.
+            - C(standard) adds the most commonly used attributes, for instance state, size, and space usage for volumes.
+            - C(full) requests all the fields, as with C(fields) set to '*'.
+            - Curated profiles are available for aggregate_info, cifs_share_info, cluster_node_info, disk_info, initiator_groups_info,
+                ip_interfaces_info, network_ports_info, san_lun_maps, security_login_info, storage_luns_info, storage_NVMe_namespaces,
+                storage_qtrees_config, storage_quota_policy_rules, storage_snapshot_policies, volume_info, and vserver_info.
+                Other subsets return the default fields with C(minimal) and C(standard).
+            - If the option is not present, and C(fields) is not present, the default fields are returned.
+        choices: ['minimal', 'standard', 'full']
+        version_added: '21.7.0'
+    subset_fields:
+        type: dict
+        description:
+            - Request specific fields for each subset, as a dictionary of lists keyed by info name or REST API.
+            - For instance, C({'volume_info': ['name', 'size'], 'storage/luns': ['name', 'serial_number']}).
+            - Every key must be present in C(gather_subset), or C(gather_subset) must be all.
+            - Takes precedence over C(fields) and C(profile) for these subsets.
+        version_added: '21.7.0'
     parameters:
         description:
         - Allows for any rest option to be passed in
         type: dict
         version_added: '20.7.0'
+    max_concurrency:
+        type: int
+        description:
+            - Maximum number of subsets collected in parallel.
+            - With the default value of 1, subsets are collected one at a time.
+            - The output is identical whatever the value.
+            - The C(rest_pool_maxsize) feature flag should be at least equal to this value, so that all connections are kept alive.
+        default: 1
+        version_added: '21.7.0'
+    incremental:
+        type: dict
+        description:
+            - Keep a local snapshot of each subset, keyed by record, and only download the records that were added or changed since the last run.
+            - Each run first lists all records with only the key and C(signature_fields), then fetches the full records that are new,
+                or whose signature changed, using a query on the key.  Removed records are dropped from the snapshot.
+            - ontap_info reports the merged full view for each subset, and incremental_summary reports the added, changed, and removed keys.
+            - Subsets that do not return a list of records, or whose records do not have the key field, are always fully downloaded.
+            - Changes to fields that are not part of C(signature_fields) are not detected.
+        version_added: '21.7.0'
+        suboptions:
+            enabled:
+                type: bool
+                description:
+                    - Whether to use incremental mode.
+                default: true
+            key:
+                type: str
+                description:
+                    - Field that uniquely identifies a record.
+                default: uuid
+            signature_fields:
+                type: list
+                elements: str
+                description:
+                    - Fields used to detect that a record changed, for instance C(state) or C(space.used).
+                    - If not set, only added and removed records are detected, existing records are returned from the snapshot.
+            snapshot_dir:
+                type: str
+                description:
+                    - Directory for the local snapshots, one file per cluster and subset.
+                    - Defaults to <tempdir>/ansible_netapp_ontap_cache/rest_info.
+                    - The directory must be owned by the user running the module, with no access for group and others, or no snapshot is used.
 '''
 
 EXAMPLES = '''
@@ -180,13 +252,146 @@ EXAMPLES = '''
       use_rest: Always
       gather_subset:
       - aggregate_info
+- name: run ONTAP gather facts for volume info and lun info with different fields, and a standard set of fields for aggregates
+  netapp.ontap.na_ontap_rest_info:
+      hostname: "1.2.3.4"
+      username: "testuser"
+      password: "test-password"
+      https: true
+      validate_certs: false
+      use_rest: Always
+      profile: standard
+      subset_fields:
+        volume_info: ['uuid', 'name', 'size', 'space.used']
+        storage_luns_info: ['uuid', 'name', 'serial_number']
+      gather_subset:
+      - aggregate_info
+      - volume_info
+      - storage_luns_info
+- name: run ONTAP gather facts for all subsets, collecting 8 subsets at a time
+  netapp.ontap.na_ontap_rest_info:
+      hostname: "1.2.3.4"
+      username: "testuser"
+      password: "test-password"
+      https: true
+      validate_certs: false
+      use_rest: Always
+      max_concurrency: 8
+      gather_subset:
+      - all
+- name: run ONTAP gather facts for volume info, only downloading volumes that were added or changed since the last run
+  netapp.ontap.na_ontap_rest_info:
+      hostname: "1.2.3.4"
+      username: "testuser"
+      password: "test-password"
+      https: true
+      validate_certs: false
+      use_rest: Always
+      incremental:
+        signature_fields: ['state', 'size', 'svm.name']
+      gather_subset:
+      - volume_info
+'''
+
+RETURN = '''
+ontap_info:
+    description: Returns the information for each subset, keyed by REST API.
+    returned: always
+    type: dict
+incremental_summary:
+    description:
+        - For each subset collected in incremental mode, the keys of the records that were added, changed, or removed since the last run,
+          and the number of records that were downloaded in full.
+    returned: when incremental is enabled
+    type: dict
+    sample: '{"storage/volumes": {"added": ["uuid3"], "changed": ["uuid1"], "removed": [], "fetched": 2}}'
 '''
 
+import hashlib
+import json
+import os
+import tempfile
+
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_rest_next_pages
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp import OntapRestAPI
 
+# curated fields for the minimal and standard profiles, keyed by REST API
+FIELD_PROFILES = {
+    'cluster/nodes': {
+        'minimal': 'uuid,name',
+        'standard': 'uuid,name,serial_number,model,state,location,version.full,ha.enabled,ha.partners.name,uptime,management_interfaces.ip.address',
+    },
+    'network/ethernet/ports': {
+        'minimal': 'uuid,name,node.name',
+        'standard': 'uuid,name,node.name,type,state,enabled,mtu,speed,broadcast_domain.name,broadcast_domain.ipspace.name,vlan.tag,vlan.base_port.name',
+    },
+    'network/ip/interfaces': {
+        'minimal': 'uuid,name,svm.name',
+        'standard': 'uuid,name,svm.name,ip.address,ip.netmask,state,enabled,scope,ipspace.name,service_policy.name,'
+                    'location.home_node.name,location.home_port.name,location.node.name,location.port.name',
+    },
+    'protocols/cifs/shares': {
+        'minimal': 'svm.name,name,path',
+        'standard': 'svm.name,name,path,comment,acls.user_or_group,acls.permission,acls.type',
+    },
+    'protocols/san/igroups': {
+        'minimal': 'uuid,name,svm.name',
+        'standard': 'uuid,name,svm.name,os_type,protocol,initiators.name,lun_maps.lun.name,lun_maps.logical_unit_number',
+    },
+    'protocols/san/lun-maps': {
+        'minimal': 'svm.name,lun.name,igroup.name',
+        'standard': 'svm.name,lun.name,lun.uuid,igroup.name,igroup.uuid,logical_unit_number',
+    },
+    'security/accounts': {
+        'minimal': 'name,owner.name',
+        'standard': 'name,owner.name,role.name,locked,applications.application,applications.authentication_methods',
+    },
+    'storage/aggregates': {
+        'minimal': 'uuid,name,node.name',
+        'standard': 'uuid,name,node.name,state,space.block_storage.size,space.block_storage.available,space.block_storage.used,'
+                    'block_storage.primary.raid_type,block_storage.primary.disk_count',
+    },
+    'storage/disks': {
+        'minimal': 'name,node.name',
+        'standard': 'name,uid,node.name,type,class,container_type,state,model,serial_number,usable_size,aggregates.name,shelf.uid,bay',
+    },
+    'storage/luns': {
+        'minimal': 'uuid,name,svm.name',
+        'standard': 'uuid,name,svm.name,location.volume.name,os_type,serial_number,space.size,space.used,status.state,status.mapped,enabled',
+    },
+    'storage/namespaces': {
+        'minimal': 'uuid,name,svm.name',
+        'standard': 'uuid,name,svm.name,location.volume.name,os_type,space.size,space.used,status.state,status.mapped,enabled',
+    },
+    'storage/qtrees': {
+        'minimal': 'id,name,svm.name,volume.name',
+        'standard': 'id,name,svm.name,volume.name,path,security_style,unix_permissions,export_policy.name',
+    },
+    'storage/quota/rules': {
+        'minimal': 'uuid,svm.name,volume.name,type,qtree.name,users.name,group.name',
+        'standard': 'uuid,svm.name,volume.name,type,qtree.name,users.name,group.name,'
+                    'space.hard_limit,space.soft_limit,files.hard_limit,files.soft_limit',
+    },
+    'storage/snapshot-policies': {
+        'minimal': 'uuid,name,svm.name',
+        'standard': 'uuid,name,svm.name,enabled,comment,copies.count,copies.prefix,copies.schedule.name',
+    },
+    'storage/volumes': {
+        'minimal': 'uuid,name,svm.name',
+        'standard': 'uuid,name,svm.name,state,type,style,size,space.used,space.available,aggregates.name,nas.path,'
+                    'snapshot_policy.name,tiering.policy,qos.policy.name',
+    },
+    'svm/svms': {
+        'minimal': 'uuid,name',
+        'standard': 'uuid,name,state,subtype,language,ipspace.name,aggregates.name,'
+                    'nfs.enabled,cifs.enabled,iscsi.enabled,fcp.enabled,nvme.enabled',
+    },
+}
+
 
 class NetAppONTAPGatherInfo(object):
     '''Class with gather info methods'''
@@ -201,8 +406,18 @@ class NetAppONTAPGatherInfo(object):
             state=dict(type='str', required=False),
             gather_subset=dict(default=['all'], type='list', elements='str', required=False),
             max_records=dict(type='int', default=1024, required=False),
+            max_records_limit=dict(type='int', required=False),
             fields=dict(type='list', elements='str', required=False),
-            parameters=dict(type='dict', required=False)
+            profile=dict(type='str', required=False, choices=['minimal', 'standard', 'full']),
+            subset_fields=dict(type='dict', required=False),
+            parameters=dict(type='dict', required=False),
+            max_concurrency=dict(type='int', default=1, required=False),
+            incremental=dict(type='dict', required=False, options=dict(
+                enabled=dict(type='bool', default=True),
+                key=dict(type='str', default='uuid'),
+                signature_fields=dict(type='list', elements='str'),
+                snapshot_dir=dict(type='str'),
+            )),
         ))
 
         self.module = AnsibleModule(
@@ -214,6 +429,8 @@ class NetAppONTAPGatherInfo(object):
         self.na_helper = NetAppModule()
         self.parameters = self.na_helper.set_parameters(self.module.params)
         self.fields = list()
+        # set by get_incremental_records, keyed by subset
+        self.incremental_summary = dict()
 
         self.rest_api = OntapRestAPI(self.module)
 
@@ -232,17 +449,23 @@ class NetAppONTAPGatherInfo(object):
 
         return ontap_version
 
-    def get_subset_info(self, gather_subset_info):
+    def get_subset_info(self, gather_subset_info, fields=None, query=None):
         """
             Gather ONTAP information for the given subset using REST APIs
             Input for REST APIs call : (api, data)
-            return gathered_ontap_info
+            fields and query optionally override the fields option, and add query parameters.
+            return gathered_ontap_info, error
+            This may run in a worker thread, so errors are reported to the caller rather than with fail_json.
         """
 
         api = gather_subset_info['api_call']
         if gather_subset_info.pop('post', False):
-            self.run_post(gather_subset_info)
-        data = {'max_records': self.parameters['max_records'], 'fields': self.fields}
+            error = self.run_post(gather_subset_info)
+            if error:
+                return None, error
+        if fields is None:
+            fields = gather_subset_info.get('fields', self.fields)
+        data = {'max_records': self.parameters['max_records'], 'fields': fields}
 
         #  Delete the fields record from data if it is a private/cli API call.
         #  The private_cli_fields method handles the fields for API calls using the private/cli endpoint.
@@ -253,26 +476,24 @@ class NetAppONTAPGatherInfo(object):
         if self.parameters.get('parameters'):
             for each in self.parameters['parameters']:
                 data[each] = self.parameters['parameters'][each]
+        if query:
+            data.update(query)
 
         gathered_ontap_info, error = self.rest_api.get(api, data)
 
         if error:
             # Fail the module if error occurs from REST APIs call
             if int(error.get('code', 0)) == 6:
-                self.module.fail_json(msg="%s user is not authorized to make %s api call" % (self.parameters.get('username'), api))
+                return None, "%s user is not authorized to make %s api call" % (self.parameters.get('username'), api)
             # if Aggr recommender can't make a recommendation it will fail with the following error code.
             # We don't want to fail
-            elif int(error.get('code', 0)) == 19726344 and "No recommendation can be made for this cluster" in error.get('message'):
-                return error.get('message')
+            if int(error.get('code', 0)) == 19726344 and "No recommendation can be made for this cluster" in error.get('message'):
+                return error.get('message'), None
             # If the API doesn't exist (using an older system) we don't want to fail
-            elif int(error.get('code', 0)) == 3:
-                return error.get('message')
-            else:
-                self.module.fail_json(msg=error)
-        else:
-            return gathered_ontap_info
-
-        return None
+            if int(error.get('code', 0)) == 3:
+                return error.get('message'), None
+            return None, error
+        return gathered_ontap_info, None
 
     def run_post(self, gather_subset_info):
         api = gather_subset_info['api_call']
@@ -281,22 +502,139 @@ class NetAppONTAPGatherInfo(object):
             return None
         dummy, error = self.rest_api.wait_on_job(post_return['job'], increment=5)
         if error:
-            self.module.fail_json(msg="%s" % error)
+            return "%s" % error
+        return None
 
-    def get_next_records(self, api):
+    def get_all_records(self, gather_subset_info, fields=None, query=None):
         """
-            Gather next set of ONTAP information for the specified api
-            Input for REST APIs call : (api, data)
-            return gather_subset_info
+            Gather ONTAP information for the given subset, following next links to collect all records
+            return subset_info, error
         """
-
-        data = {}
-        gather_subset_info, error = self.rest_api.get(api, data)
-
-        if error:
-            self.module.fail_json(msg=error)
-
-        return gather_subset_info
+        subset_info, error = self.get_subset_info(gather_subset_info, fields, query)
+        if error or subset_info is None:
+            return subset_info, error
+        if isinstance(subset_info, dict) and '_links' in subset_info:
+            # Get all the set of records if next link found in subset_info for the specified subset
+            for gathered_subset_info, error in iter_rest_next_pages(self.rest_api, subset_info, self.parameters['max_records'],
+                                                                    self.parameters.get('max_records_limit')):
+                if error:
+                    return None, error
+
+                # Update the subset info for the specified subset
+                subset_info['_links'] = gathered_subset_info['_links']
+                subset_info['records'].extend(gathered_subset_info['records'])
+
+            # metrocluster doesn't have a records field, so we need to skip this
+            if subset_info.get('records') is not None:
+                # Getting total number of records
+                subset_info['num_records'] = len(subset_info['records'])
+        return subset_info, None
+
+    def get_snapshot_path(self, subset, create=False):
+        """
+            Snapshots are kept per cluster, user, and subset.  The fields and parameters options are part of the name,
+            so that records collected with a different projection or filter are not mixed.
+            return snapshot_dir, snapshot_path, or None, None if the directory is not private to the current user
+        """
+        snapshot_dir = netapp_utils.get_cache_dir(self.parameters['incremental'].get('snapshot_dir'), 'rest_info', create)
+        if snapshot_dir is None:
+            return None, None
+        key = repr([self.parameters.get(option) for option in ('hostname', 'http_port', 'username', 'fields', 'profile', 'subset_fields', 'parameters')]
+                   + [subset, self.parameters['incremental']['key']])
+        return snapshot_dir, os.path.join(snapshot_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def read_snapshot(self, subset):
+        """
+            return the records and signatures from the last run, empty if there is no usable snapshot
+        """
+        dummy, snapshot_path = self.get_snapshot_path(subset)
+        if snapshot_path is None:
+            return dict(), dict()
+        try:
+            with open(snapshot_path, 'r') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            return snapshot['records'], snapshot['signatures']
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return dict(), dict()
+
+    def write_snapshot(self, subset, records, signatures):
+        """
+            errors are ignored, as the next run will do a full download
+        """
+        snapshot_dir, snapshot_path = self.get_snapshot_path(subset, create=True)
+        if snapshot_path is None:
+            return
+        try:
+            # write to a temporary file and rename, as other tasks may be reading the snapshot
+            handle, tmp_path = tempfile.mkstemp(dir=snapshot_dir)
+            with os.fdopen(handle, 'w') as snapshot_file:
+                json.dump(dict(records=records, signatures=signatures), snapshot_file)
+            os.rename(tmp_path, snapshot_path)
+        except (IOError, OSError, TypeError, ValueError):
+            pass
+
+    def get_records_by_key(self, gather_subset_info, keys, all_keys):
+        """
+            Download the full records for keys, with a query on the key field, in chunks to limit the URL length.
+            When most records are needed, a single listing is cheaper than many queries.
+            return records keyed by key, error
+        """
+        key = self.parameters['incremental']['key']
+        if len(keys) * 2 > len(all_keys):
+            chunks = [None]
+        else:
+            chunks = [keys[index:index + 100] for index in range(0, len(keys), 100)]
+        records = dict()
+        for chunk in chunks:
+            query = None if chunk is None else {key: '|'.join(chunk)}
+            subset_info, error = self.get_all_records(gather_subset_info, query=query)
+            if error:
+                return None, error
+            for record in subset_info.get('records', []) if isinstance(subset_info, dict) else []:
+                if key in record:
+                    records[record[key]] = record
+        return records, None
+
+    def get_incremental_records(self, gather_subset_info, subset):
+        """
+            Gather ONTAP information for the given subset, only downloading the records that were added or changed since the last run
+            return subset_info, error
+            This may run in a worker thread, so errors are reported to the caller rather than with fail_json.
+        """
+        key = self.parameters['incremental']['key']
+        if '/private/cli' in gather_subset_info['api_call']:
+            return self.get_all_records(gather_subset_info)
+        signature_fields = [key] + [field for field in self.parameters['incremental'].get('signature_fields') or [] if field != key]
+        light_info, error = self.get_all_records(gather_subset_info, fields=','.join(signature_fields))
+        if error or not isinstance(light_info, dict) or 'records' not in light_info \
+                or any(key not in record for record in light_info['records']):
+            # not a collection, or records cannot be identified
+            return self.get_all_records(gather_subset_info)
+        snapshot_records, snapshot_signatures = self.read_snapshot(subset)
+        signatures = dict((record[key], record) for record in light_info['records'])
+        all_keys = [record[key] for record in light_info['records']]
+        added = [record_key for record_key in all_keys if record_key not in snapshot_records]
+        changed = [record_key for record_key in all_keys
+                   if record_key in snapshot_records and snapshot_signatures.get(record_key) != signatures[record_key]]
+        removed = [record_key for record_key in snapshot_records if record_key not in signatures]
+        fetched = dict()
+        if added or changed:
+            fetched, error = self.get_records_by_key(gather_subset_info, added + changed, all_keys)
+            if error:
+                return None, error
+        records = dict()
+        for record_key in all_keys:
+            if record_key in fetched:
+                records[record_key] = fetched[record_key]
+            elif record_key in snapshot_records and record_key not in changed:
+                records[record_key] = snapshot_records[record_key]
+        # a record may have been deleted between the two calls, it is reported on the next run
+        self.write_snapshot(subset, records, dict((record_key, signatures[record_key]) for record_key in records))
+        self.incremental_summary[subset] = dict(added=added, changed=changed, removed=removed, fetched=len(fetched))
+        subset_info = dict((field, value) for field, value in light_info.items() if field not in ('records', '_links'))
+        subset_info['records'] = [records[record_key] for record_key in all_keys if record_key in records]
+        subset_info['num_records'] = len(subset_info['records'])
+        return subset_info, None
 
     def private_cli_fields(self, api):
         '''
@@ -313,9 +651,10 @@ class NetAppONTAPGatherInfo(object):
 
             return str(fields)
 
-    def convert_subsets(self):
+    def convert_subsets(self, subsets=None):
         """
         Convert an info to the REST API
+        :param subsets: list of info names or REST APIs, defaults to gather_subset
         """
         info_to_rest_mapping = {
             "aggregate_info": "storage/aggregates",
@@ -381,15 +720,36 @@ class NetAppONTAPGatherInfo(object):
             "volume_info": "storage/volumes"
         }
         # Add rest API names as there info version, also make sure we don't add a duplicate
-        subsets = []
-        for subset in self.parameters['gather_subset']:
+        converted_subsets = []
+        for subset in self.parameters['gather_subset'] if subsets is None else subsets:
             if subset in info_to_rest_mapping:
-                if info_to_rest_mapping[subset] not in subsets:
-                    subsets.append(info_to_rest_mapping[subset])
+                if info_to_rest_mapping[subset] not in converted_subsets:
+                    converted_subsets.append(info_to_rest_mapping[subset])
             else:
-                if subset not in subsets:
-                    subsets.append(subset)
-        return subsets
+                if subset not in converted_subsets:
+                    converted_subsets.append(subset)
+        return converted_subsets
+
+    def set_subset_fields(self, get_ontap_subset_info, converted_subsets):
+        """
+        Record the fields to request for each subset, from subset_fields, or from the profile if fields is not set
+        """
+        subset_fields = dict()
+        for subset, fields in (self.parameters.get('subset_fields') or dict()).items():
+            converted_subset = self.convert_subsets([subset])[0]
+            if converted_subset not in converted_subsets:
+                self.module.fail_json(msg="Error: subset_fields: %s is not in gather_subset." % subset)
+            if not isinstance(fields, list):
+                fields = [fields]
+            subset_fields[converted_subset] = ','.join(str(field) for field in fields)
+        profile = self.parameters.get('profile')
+        for subset in converted_subsets:
+            if subset in subset_fields:
+                get_ontap_subset_info[subset]['fields'] = subset_fields[subset]
+            elif profile == 'full' and self.parameters.get('fields') is None:
+                get_ontap_subset_info[subset]['fields'] = '*'
+            elif profile is not None and self.parameters.get('fields') is None and subset in FIELD_PROFILES:
+                get_ontap_subset_info[subset]['fields'] = FIELD_PROFILES[subset][profile]
 
     def apply(self):
         """
@@ -602,32 +962,29 @@ class NetAppONTAPGatherInfo(object):
         converted_subsets = self.convert_subsets()
 
         for subset in converted_subsets:
-            try:
-                # Verify whether the supported subset passed
-                specified_subset = get_ontap_subset_info[subset]
-            except KeyError:
+            # Verify whether the supported subset passed
+            if subset not in get_ontap_subset_info:
                 self.module.fail_json(msg="Specified subset %s is not found, supported subsets are %s" %
                                       (subset, list(get_ontap_subset_info.keys())))
+        self.set_subset_fields(get_ontap_subset_info, converted_subsets)
 
-            result_message[subset] = self.get_subset_info(specified_subset)
-
-            if result_message[subset] is not None:
-                if isinstance(result_message[subset], dict) and '_links' in result_message[subset]:
-                    while result_message[subset]['_links'].get('next'):
-                        # Get all the set of records if next link found in subset_info for the specified subset
-                        next_api = result_message[subset]['_links']['next']['href']
-                        gathered_subset_info = self.get_next_records(next_api.replace('/api', ''))
-
-                        # Update the subset info for the specified subset
-                        result_message[subset]['_links'] = gathered_subset_info['_links']
-                        result_message[subset]['records'].extend(gathered_subset_info['records'])
-
-                    # metrocluster doesn't have a records field, so we need to skip this
-                    if result_message[subset].get('records') is not None:
-                        # Getting total number of records
-                        result_message[subset]['num_records'] = len(result_message[subset]['records'])
+        # subsets are independent, and can be collected concurrently.  Results are reported in order.
+        incremental = self.parameters.get('incremental') is not None and self.parameters['incremental']['enabled']
+        if incremental:
+            get_records = self.get_incremental_records
+            args_list = [(get_ontap_subset_info[subset], subset) for subset in converted_subsets]
+        else:
+            get_records = self.get_all_records
+            args_list = [(get_ontap_subset_info[subset],) for subset in converted_subsets]
+        for subset, (subset_info, error) in zip(converted_subsets,
+                                                iter_concurrently(get_records, args_list, self.parameters['max_concurrency'])):
+            if error:
+                self.module.fail_json(msg=error)
+            result_message[subset] = subset_info
 
         results = {'changed': False}
+        if incremental:
+            results['incremental_summary'] = self.incremental_summary
         if self.parameters.get('state') is not None:
             results['state'] = self.parameters['state']
             results['warnings'] = "option 'state' is deprecated."
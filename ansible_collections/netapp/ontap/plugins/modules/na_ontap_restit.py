@@ -21,6 +21,7 @@ description:
   - In case of a REST API error, C(status_code), C(error_code), C(error_message) are set to help with diagnosing the issue,
   - and the call is reported as an error ('failed').
   - Other errors (eg connection issues) are reported as Ansible error.
+  - With C(requests), several REST API calls are made in a single task, and the status of each call is reported in C(responses).
 extends_documentation_fragment:
   - netapp.ontap.netapp.na_ontap
 module: na_ontap_restit
@@ -30,35 +31,113 @@ options:
   api:
     description:
       - The REST API to call (eg I(cluster/software), I(svms/svm)).
-    required: true
+      - One of C(api) or C(requests) is required.
     type: str
   method:
     description:
       - The REST method to use.
+      - With C(requests), the default method for each request.
     default: GET
     type: str
   query:
     description:
       - A list of dictionaries for the query parameters
+      - With C(requests), the default query for each request.
     type: dict
   body:
     description:
       - A dictionary for the info parameter
+      - With C(requests), the default body for each request.
     type: dict
     aliases: ['info']
   vserver_name:
     description:
       - if provided, forces vserver tunneling.  username identifies a cluster admin account.
+      - With C(requests), the default vserver_name for each request.
     type: str
   vserver_uuid:
     description:
       - if provided, forces vserver tunneling.  username identifies a cluster admin account.
+      - With C(requests), the default vserver_uuid for each request.
     type: str
   hal_linking:
     description:
       - if true, HAL-encoded links are returned in the response.
     default: false
     type: bool
+  requests:
+    description:
+      - A list of REST API calls, made in a single task using the same session.
+      - C(method), C(query), C(body), C(vserver_name), and C(vserver_uuid) default to the top level options.
+      - A value set for a request replaces the default, dictionaries are not merged.
+      - Mutually exclusive with C(api).
+    type: list
+    elements: dict
+    version_added: '21.7.0'
+    suboptions:
+      api:
+        description:
+          - The REST API to call.
+        required: true
+        type: str
+      method:
+        description:
+          - The REST method to use.
+        type: str
+      query:
+        description:
+          - A dictionary for the query parameters.
+        type: dict
+      body:
+        description:
+          - A dictionary for the info parameter.
+        type: dict
+        aliases: ['info']
+      vserver_name:
+        description:
+          - if provided, forces vserver tunneling.
+        type: str
+      vserver_uuid:
+        description:
+          - if provided, forces vserver tunneling.
+        type: str
+      barrier:
+        description:
+          - If true, the request is only sent when all the previous requests, and their jobs, are complete.
+          - Requests between two barriers may be run in parallel, depending on C(max_concurrency).
+        type: bool
+        default: false
+  max_concurrency:
+    description:
+      - Maximum number of requests sent in parallel when C(requests) is set.
+      - The connections are pooled in a shared session, up to the C(rest_pool_maxsize) feature flag.
+      - With the default value of 1, requests are sent one at a time, in order.
+    type: int
+    default: 1
+    version_added: '21.7.0'
+  continue_on_error:
+    description:
+      - When C(requests) is set and a request fails, whether to send the remaining requests.
+      - By default, no request is sent after a failure, and the remaining requests are reported with a C(skipped) status.
+      - With C(max_concurrency) greater than 1, the requests before the next barrier are sent.
+    type: bool
+    default: false
+    version_added: '21.7.0'
+  wait_for_completion:
+    description:
+      - When C(requests) is set, wait for the jobs returned by asynchronous requests to complete.
+      - The jobs are polled together, at each barrier, and at the end of the task.
+      - A failed job is reported as a failed request.
+      - Ignored with C(api), use C(return_timeout) in C(query) to wait for a single request.
+    type: bool
+    default: true
+    version_added: '21.7.0'
+  job_timeout:
+    description:
+      - Time to wait for the jobs returned by a group of requests to complete, in seconds.
+    type: int
+    default: 600
+    version_added: '21.7.0'
 '''
 
 EXAMPLES = """
@@ -186,6 +265,27 @@ EXAMPLES = """
     - debug: var=result
     - assert: { that: result.status_code==200, quiet: True }
 
+    - name: set the QoS policy for several volumes, with up to 10 requests in flight
+      na_ontap_restit:
+        <<: *login
+        requests:
+          - api: "storage/volumes/{{ vol1_uuid }}"
+          - api: "storage/volumes/{{ vol2_uuid }}"
+          - api: "storage/volumes/{{ vol3_uuid }}"
+          # sent when the previous requests, and their jobs, are complete
+          - api: "storage/volumes/{{ vol1_uuid }}"
+            body:
+              comment: QoS policy set to gold
+            barrier: true
+        method: PATCH
+        body:
+          qos:
+            policy:
+              name: gold
+        max_concurrency: 10
+      register: result
+    - debug: var=result
+
 # error cases
     - name: run ontap REST API command
       na_ontap_restit:
@@ -223,12 +323,25 @@ error_message:
     - Not present if successful, or if the REST API call cannot be performed.
   returned: On error
   type: str
+responses:
+  description:
+    - With C(requests), a list with an entry for each request, in the same order.
+    - Each entry reports C(api), C(method), and C(status), either C(passed), C(failed), or C(skipped).
+    - C(status_code), C(response), C(error_message), and C(error_code) are set as for a single request.
+    - C(job) reports the last state of the job for an asynchronous request.
+    - The task is reported as an error ('failed') if any request failed.
+  returned: With requests
+  type: list
+  version_added: '21.7.0'
 """
 
 from ansible.module_utils.basic import AnsibleModule
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp import OntapRestAPI
 
+REQUEST_DEFAULTS = ('method', 'query', 'body', 'vserver_name', 'vserver_uuid')
+
 
 class NetAppONTAPRestAPI(object):
     ''' calls a REST API command '''
@@ -236,16 +349,31 @@ class NetAppONTAPRestAPI(object):
     def __init__(self):
         self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
         self.argument_spec.update(dict(
-            api=dict(required=True, type='str'),
+            api=dict(required=False, type='str'),
             method=dict(required=False, type='str', default='GET'),
             query=dict(required=False, type='dict'),
             body=dict(required=False, type='dict', aliases=['info']),
             vserver_name=dict(required=False, type='str'),
             vserver_uuid=dict(required=False, type='str'),
             hal_linking=dict(required=False, type='bool', default=False),
+            requests=dict(required=False, type='list', elements='dict', options=dict(
+                api=dict(required=True, type='str'),
+                method=dict(required=False, type='str'),
+                query=dict(required=False, type='dict'),
+                body=dict(required=False, type='dict', aliases=['info']),
+                vserver_name=dict(required=False, type='str'),
+                vserver_uuid=dict(required=False, type='str'),
+                barrier=dict(required=False, type='bool', default=False),
+            )),
+            max_concurrency=dict(required=False, type='int', default=1),
+            continue_on_error=dict(required=False, type='bool', default=False),
+            wait_for_completion=dict(required=False, type='bool', default=True),
+            job_timeout=dict(required=False, type='int', default=600),
         ))
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
+            mutually_exclusive=[('api', 'requests')],
+            required_one_of=[('api', 'requests')],
             supports_check_mode=False
         )
         parameters = self.module.params
@@ -257,38 +385,126 @@ class NetAppONTAPRestAPI(object):
         self.vserver_name = parameters['vserver_name']
         self.vserver_uuid = parameters['vserver_uuid']
         self.hal_linking = parameters['hal_linking']
+        self.requests = parameters['requests']
+        self.max_concurrency = parameters['max_concurrency']
+        self.continue_on_error = parameters['continue_on_error']
+        self.wait_for_completion = parameters['wait_for_completion']
+        self.job_timeout = parameters['job_timeout']
 
         self.rest_api = OntapRestAPI(self.module)
 
-    def run_api(self):
-        ''' calls the REST API '''
-        # TODO, log usage
+    @staticmethod
+    def get_error_details(error):
+        ''' split a REST error into message, code, and what is left of the error '''
+        if isinstance(error, dict):
+            error = dict(error)
+            error_message = error.pop('message', None)
+            error_code = error.pop('code', None)
+            if not error:
+                # we exhausted the dictionary
+                error = 'check error_message and error_code for details.'
+        else:
+            error_message = error
+            error_code = None
+        return error_message, error_code, error
 
+    def send_request(self, method, api, query, body, vserver_name, vserver_uuid):
+        ''' calls the REST API, and returns status, response, error '''
         if self.hal_linking:
             content_type = 'application/hal+json'
         else:
             content_type = 'application/json'
-        status, response, error = self.rest_api.send_request(self.method, self.api, self.query, self.body,
-                                                             accept=content_type,
-                                                             vserver_name=self.vserver_name, vserver_uuid=self.vserver_uuid)
-        if error:
-            if isinstance(error, dict):
-                error_message = error.pop('message', None)
-                error_code = error.pop('code', None)
-                if not error:
-                    # we exhausted the dictionary
-                    error = 'check error_message and error_code for details.'
-            else:
-                error_message = error
-                error_code = None
+        return self.rest_api.send_request(method, api, query, body, accept=content_type,
+                                          vserver_name=vserver_name, vserver_uuid=vserver_uuid)
+
+    def run_api(self):
+        ''' calls the REST API '''
+        # TODO, log usage
 
+        status, response, error = self.send_request(self.method, self.api, self.query, self.body, self.vserver_name, self.vserver_uuid)
+        if error:
+            error_message, error_code, error = self.get_error_details(error)
             msg = "Error when calling '%s': %s" % (self.api, str(error))
             self.module.fail_json(msg=msg, status_code=status, response=response, error_message=error_message, error_code=error_code)
 
         return status, response
 
+    def get_request_parameters(self):
+        ''' apply top level options as defaults, and split the requests in groups at each barrier '''
+        groups = list()
+        for index, request in enumerate(self.requests):
+            request = dict(request)
+            for option in REQUEST_DEFAULTS:
+                if request.get(option) is None:
+                    request[option] = self.module.params[option]
+            if request.pop('barrier') or not groups:
+                groups.append(list())
+            groups[-1].append((index, request))
+        return groups
+
+    def run_request(self, request):
+        ''' calls the REST API, and reports the status rather than failing '''
+        status_code, response, error = self.send_request(request['method'], request['api'], request['query'], request['body'],
+                                                         request['vserver_name'], request['vserver_uuid'])
+        result = dict(api=request['api'], method=request['method'], status='passed', status_code=status_code, response=response)
+        if error:
+            error_message, error_code, dummy = self.get_error_details(error)
+            result.update(status='failed', error_message=error_message, error_code=error_code)
+        return result
+
+    def wait_for_jobs(self, results):
+        ''' wait on the jobs returned by a group of requests, all jobs are polled together '''
+        results = [result for result in results if isinstance(result.get('response'), dict) and 'job' in result['response']]
+        if not results:
+            return
+        jobs, dummy = self.rest_api.wait_on_jobs([result['response']['job'] for result in results], timeout=self.job_timeout)
+        for result, (job, error) in zip(results, jobs):
+            result['job'] = job
+            if error:
+                result.update(status='failed', error_message=error, error_code=job.get('code') if job else None)
+
+    def run_requests(self):
+        ''' calls the REST APIs in requests, using up to max_concurrency connections from the shared session
+            a group of requests starts after all the requests in the previous group, and their jobs, are complete
+            return a list of results, in the same order as requests
+        '''
+        results = [None] * len(self.requests)
+        failed = False
+        for group in self.get_request_parameters():
+            if failed and not self.continue_on_error:
+                break
+            concurrent = self.max_concurrency > 1 and len(group) > 1
+            group_results = list()
+            args_list = [(request,) for dummy, request in group]
+            for (index, dummy), result in zip(group, iter_concurrently(self.run_request, args_list, self.max_concurrency)):
+                results[index] = result
+                group_results.append(result)
+                if result['status'] == 'failed':
+                    failed = True
+                    if not self.continue_on_error and not concurrent:
+                        break
+            if self.wait_for_completion:
+                self.wait_for_jobs(group_results)
+                failed = failed or any(result['status'] == 'failed' for result in group_results)
+        for index, request in enumerate(self.requests):
+            if results[index] is None:
+                results[index] = dict(api=request['api'], method=request['method'] or self.method, status='skipped')
+        return results
+
+    def apply_requests(self):
+        ''' calls the apis and returns the status and json output for each request '''
+        responses = self.run_requests()
+        changed = any(response['status'] == 'passed' for response in responses)
+        failed = [response for response in responses if response['status'] == 'failed']
+        if not failed:
+            self.module.exit_json(changed=changed, responses=responses)
+        msg = 'Error: %d of %d requests failed, check status, error_message and error_code in responses.' % (len(failed), len(responses))
+        self.module.fail_json(changed=changed, responses=responses, msg=msg)
+
     def apply(self):
         ''' calls the api and returns json output '''
+        if self.requests is not None:
+            self.apply_requests()
         status_code, response = self.run_api()
         self.module.exit_json(changed=True, status_code=status_code, response=response)
 
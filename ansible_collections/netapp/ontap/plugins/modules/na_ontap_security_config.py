@@ -230,9 +230,7 @@ class NetAppOntapSecurityConfig(object):
                 )
 
     def ems_log_event(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_security_config", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_security_config", self.server, self.module)
 
     def apply(self):
         if not self.use_rest:
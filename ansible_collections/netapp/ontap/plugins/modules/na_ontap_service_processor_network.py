@@ -258,9 +258,7 @@ class NetAppOntapServiceProcessorNetwork(object):
                                   exception=traceback.format_exc())
 
     def autosupport_log(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_service_processor_network", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_service_processor_network", self.server, self.module)
 
     def apply(self):
         """
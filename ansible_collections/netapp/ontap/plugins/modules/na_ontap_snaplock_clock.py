@@ -156,9 +156,7 @@ class NetAppOntapSnaplockClock():
             return result
 
     def ems_log_event(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        return netapp_utils.ems_log_event("na_ontap_snaplock_clock", cserver)
+        return netapp_utils.ems_log_event_cserver("na_ontap_snaplock_clock", self.server, self.module)
 
     def apply(self):
         if not self.use_rest:
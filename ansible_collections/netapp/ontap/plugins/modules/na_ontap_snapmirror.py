@@ -285,6 +285,62 @@ options:
           - The name of the SVM.  Not sure when this is needed.
         type: str
 
+  wait_timeout:
+    description:
+      - Maximum time to wait, in seconds, for a relationship to reach the expected state after an abort or a quiesce.
+      - The relationship is polled with an interval starting at 1 second and doubling up to 60 seconds.
+    type: int
+    default: 300
+    version_added: '21.7.0'
+  wait_for_transfer:
+    description:
+      - If true, wait for the transfer started by an initialize, resync, or update to complete.
+      - Progress is reported in C(transfer_stats).
+      - The next poll is scheduled from the estimated time of arrival when it can be computed from the observed
+        transfer rate and the size of the last transfer, otherwise the poll interval doubles up to 60 seconds.
+    type: bool
+    default: false
+    version_added: '21.7.0'
+  transfer_timeout:
+    description:
+      - Maximum time to wait, in seconds, for a transfer to complete when C(wait_for_transfer) is true.
+      - Defaults to 86400 (24 hours) for an initialize (baseline transfer), and to 3600 for a resync or an update.
+    type: int
+    version_added: '21.7.0'
+  relationships:
+    description:
+      - Manage several existing ONTAP/ONTAP relationships in a single task, for instance to break, resync, or update them on failover.
+      - The current state of all relationships is read with a single snapmirror-get-iter call, then each relationship is
+        initialized, broken, resumed, resynced, or updated as needed, based on C(relationship_state), C(initialize), and C(update).
+      - Relationships are processed in parallel, up to C(max_concurrency) at a time, and all quiesce or transfer waits
+        are done together, using a single snapmirror-get-iter call per poll.
+      - Relationships are not created or deleted in this mode, C(state) must be present.
+      - Mutually exclusive with the source and destination options.
+      - The result reports actions, mirror_state, status, and any error for each relationship in C(relationships).
+      - Only supported with ZAPI.
+    type: list
+    elements: dict
+    version_added: '21.7.0'
+    suboptions:
+      destination_path:
+        description:
+          - The destination endpoint of the relationship, in the <vserver:volume> or <vserver:> format.
+        type: str
+        required: true
+      relationship_state:
+        description:
+          - Whether to break or establish this relationship, defaults to the value of C(relationship_state) for the task.
+        choices: ['active', 'broken']
+        type: str
+  max_concurrency:
+    description:
+      - Maximum number of relationships processed in parallel with C(relationships).
+      - Each worker uses its own connection to ONTAP.
+      - With the default value of 1, relationships are processed one at a time.
+    type: int
+    default: 1
+    version_added: '21.7.0'
+
 short_description: "NetApp ONTAP or ElementSW Manage SnapMirror"
 version_added: 2.7.0
 '''
@@ -307,6 +363,18 @@ EXAMPLES = """
         username: "{{ destination_cluster_username }}"
         password: "{{ destination_cluster_password }}"
 
+    # creates and initializes the snapmirror, and waits for the baseline transfer to complete
+    - name: Create ONTAP/ONTAP SnapMirror and wait for the baseline transfer
+      na_ontap_snapmirror:
+        state: present
+        source_path: 'ansible:test'
+        destination_path: 'ansible:dest'
+        wait_for_transfer: true
+        transfer_timeout: 172800
+        hostname: "{{ destination_cluster_hostname }}"
+        username: "{{ destination_cluster_username }}"
+        password: "{{ destination_cluster_password }}"
+
     # creates and initializes the snapmirror between vservers
     - name: Create ONTAP/ONTAP vserver SnapMirror
       na_ontap_snapmirror:
@@ -360,6 +428,19 @@ EXAMPLES = """
         username: "{{ destination_cluster_username }}"
         password: "{{ destination_cluster_password }}"
 
+    - name: Break all DR relationships on failover
+      na_ontap_snapmirror:
+        state: present
+        relationship_state: broken
+        relationships:
+          - destination_path: 'dr_svm:vol1'
+          - destination_path: 'dr_svm:vol2'
+          - destination_path: 'dr_svm:vol3'
+        max_concurrency: 16
+        hostname: "{{ destination_cluster_hostname }}"
+        username: "{{ destination_cluster_username }}"
+        password: "{{ destination_cluster_password }}"
+
     - name: Set schedule to NULL
       na_ontap_snapmirror:
         state: present
@@ -436,6 +517,22 @@ EXAMPLES = """
 """
 
 RETURN = """
+transfer_stats:
+  description:
+    - Progress of the last wait, when the module waited for an abort, a quiesce, or a transfer.
+    - bytes_transferred is the number of bytes transferred, elapsed_time and eta are in seconds,
+      rate is in bytes per second, poll_count is the number of times the relationship was queried.
+  returned: when the module waited for a state transition
+  type: dict
+  sample: {"bytes_transferred": 1073741824, "elapsed_time": 31, "eta": 0, "poll_count": 6, "rate": 34636833}
+relationships:
+  description:
+    - Per relationship results when C(relationships) is set, in the same order.
+    - Each element reports destination_path, actions, mirror_state, and status, and msg on error.
+  returned: when relationships is set
+  type: list
+  elements: dict
+  sample: '[{"destination_path": "dr_svm:vol1", "actions": ["break"], "mirror_state": "broken-off", "status": "idle"}]'
 """
 
 import re
@@ -444,8 +541,10 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently, ThreadConnections
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_elementsw_module import NaElementSWModule
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_zapi_records
 import ansible_collections.netapp.ontap.plugins.module_utils.rest_response_helpers as rrh
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
@@ -522,6 +621,14 @@ class NetAppONTAPSnapmirror(object):
             )),
             source_cluster=dict(required=False, type='str'),
             destination_cluster=dict(required=False, type='str'),
+            wait_timeout=dict(required=False, type='int', default=300),
+            wait_for_transfer=dict(required=False, type='bool', default=False),
+            transfer_timeout=dict(required=False, type='int'),
+            relationships=dict(required=False, type='list', elements='dict', options=dict(
+                destination_path=dict(required=True, type='str'),
+                relationship_state=dict(type='str', choices=['active', 'broken']),
+            )),
+            max_concurrency=dict(required=False, type='int', default=1),
         ))
 
         self.module = AnsibleModule(
@@ -535,6 +642,14 @@ class NetAppONTAPSnapmirror(object):
                 ('destination_endpoint', 'destination_path'),
                 ('destination_endpoint', 'destination_volume'),
                 ('destination_endpoint', 'destination_vserver'),
+                ('relationships', 'source_endpoint'),
+                ('relationships', 'source_path'),
+                ('relationships', 'source_volume'),
+                ('relationships', 'source_vserver'),
+                ('relationships', 'destination_endpoint'),
+                ('relationships', 'destination_path'),
+                ('relationships', 'destination_volume'),
+                ('relationships', 'destination_vserver'),
             ],
             required_together=(['source_volume', 'destination_volume'],
                                ['source_vserver', 'destination_vserver'],
@@ -548,6 +663,8 @@ class NetAppONTAPSnapmirror(object):
         self.new_style = False
         # setup later if required
         self.source_server = None
+        # set by wait_for_state
+        self.transfer_stats = None
         # only for ElementSW -> ONTAP snapmirroring, validate if ElementSW SDK is available
         if self.parameters.get('connection_type') in ['elementsw_ontap', 'ontap_elementsw']:
             if HAS_SF_SDK is False:
@@ -616,7 +733,6 @@ class NetAppONTAPSnapmirror(object):
         :return: Dictionary of current SnapMirror details if query successful, else None
         """
         snapmirror_get_iter = self.snapmirror_get_iter(destination)
-        snap_info = dict()
         try:
             result = self.server.invoke_successfully(snapmirror_get_iter, enable_tunneling=True)
         except netapp_utils.zapi.NaApiError as error:
@@ -626,34 +742,155 @@ class NetAppONTAPSnapmirror(object):
                 int(result.get_child_content('num-records')) > 0:
             snapmirror_info = result.get_child_by_name('attributes-list').get_child_by_name(
                 'snapmirror-info')
-            snap_info['mirror_state'] = snapmirror_info.get_child_content('mirror-state')
-            snap_info['status'] = snapmirror_info.get_child_content('relationship-status')
-            snap_info['schedule'] = snapmirror_info.get_child_content('schedule')
-            snap_info['policy'] = snapmirror_info.get_child_content('policy')
-            snap_info['relationship_type'] = snapmirror_info.get_child_content('relationship-type')
-            snap_info['current_transfer_type'] = snapmirror_info.get_child_content('current-transfer-type')
-            if snapmirror_info.get_child_by_name('max-transfer-rate'):
-                snap_info['max_transfer_rate'] = int(snapmirror_info.get_child_content('max-transfer-rate'))
-            if snapmirror_info.get_child_by_name('last-transfer-error'):
-                snap_info['last_transfer_error'] = snapmirror_info.get_child_content('last-transfer-error')
-            if snapmirror_info.get_child_by_name('is-healthy') is not None:
-                snap_info['is_healthy'] = self.na_helper.get_value_for_bool(True, snapmirror_info.get_child_content('is-healthy'))
-            if snapmirror_info.get_child_by_name('unhealthy-reason'):
-                snap_info['unhealthy_reason'] = snapmirror_info.get_child_content('unhealthy-reason')
-            if snap_info['schedule'] is None:
-                snap_info['schedule'] = ""
-            return snap_info
+            return self.get_snapmirror_details(snapmirror_info)
         return None
 
-    def wait_for_status(self):
-        timeout = 300       # 5 minutes
-        while timeout > 0:
-            time.sleep(30)
+    def get_snapmirror_details(self, snapmirror_info):
+        """
+        Convert a snapmirror-info element into a dictionary
+        """
+        snap_info = dict()
+        snap_info['mirror_state'] = snapmirror_info.get_child_content('mirror-state')
+        snap_info['status'] = snapmirror_info.get_child_content('relationship-status')
+        snap_info['schedule'] = snapmirror_info.get_child_content('schedule')
+        snap_info['policy'] = snapmirror_info.get_child_content('policy')
+        snap_info['relationship_type'] = snapmirror_info.get_child_content('relationship-type')
+        snap_info['current_transfer_type'] = snapmirror_info.get_child_content('current-transfer-type')
+        snap_info['source_location'] = snapmirror_info.get_child_content('source-location')
+        if snapmirror_info.get_child_by_name('max-transfer-rate'):
+            snap_info['max_transfer_rate'] = int(snapmirror_info.get_child_content('max-transfer-rate'))
+        if snapmirror_info.get_child_by_name('last-transfer-error'):
+            snap_info['last_transfer_error'] = snapmirror_info.get_child_content('last-transfer-error')
+        if snapmirror_info.get_child_by_name('is-healthy') is not None:
+            snap_info['is_healthy'] = self.na_helper.get_value_for_bool(True, snapmirror_info.get_child_content('is-healthy'))
+        if snapmirror_info.get_child_by_name('unhealthy-reason'):
+            snap_info['unhealthy_reason'] = snapmirror_info.get_child_content('unhealthy-reason')
+        # transfer progress, used when waiting for a transfer
+        for zapi_key in ('snapshot-progress', 'last-transfer-size', 'last-transfer-duration', 'last-transfer-end-timestamp'):
+            if snapmirror_info.get_child_by_name(zapi_key):
+                snap_info[zapi_key.replace('-', '_')] = int(snapmirror_info.get_child_content(zapi_key))
+        if snap_info['schedule'] is None:
+            snap_info['schedule'] = ""
+        return snap_info
+
+    def snapmirror_get_all(self, destinations):
+        """
+        Get current SnapMirror relations for several destinations with a single snapmirror-get-iter query
+        :return: Dictionary of current SnapMirror details, keyed by destination path
+        """
+        records = dict()
+        if not destinations:
+            return records
+        query = self.snapmirror_get_iter('|'.join(destinations)).get_child_by_name('query')
+        try:
+            for snapmirror_info in iter_zapi_records(self.server, 'snapmirror-get-iter', query, len(destinations)):
+                records[snapmirror_info.get_child_content('destination-location')] = self.get_snapmirror_details(snapmirror_info)
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching snapmirror info: %s' % to_native(error),
+                                  exception=traceback.format_exc())
+        return records
+
+    @staticmethod
+    def get_transfer_rate(current, previous_bytes, progress, interval):
+        """
+        Estimate the transfer rate in bytes per second.
+        Use the progress observed since the previous poll if available, otherwise seed the rate
+        from the size and duration of the last transfer.
+        """
+        if previous_bytes is not None and progress is not None and progress > previous_bytes and interval > 0:
+            return float(progress - previous_bytes) / interval
+        if current and current.get('last_transfer_size') and current.get('last_transfer_duration'):
+            return float(current['last_transfer_size']) / current['last_transfer_duration']
+        return None
+
+    @staticmethod
+    def get_transfer_eta(current, progress, rate):
+        """
+        Estimate the remaining time in seconds for the current transfer, assuming it is about
+        the same size as the last transfer.  Returns None if no estimate is available.
+        """
+        if not rate or progress is None or not current:
+            return None
+        expected_size = current.get('last_transfer_size')
+        if not expected_size or expected_size <= progress:
+            return None
+        return (expected_size - progress) / rate
+
+    def wait_for_state(self, is_done, timeout, initial_interval=1, max_interval=60):
+        """
+        Poll the relationship until is_done(current) returns True, or the relationship is deleted, or timeout expires.
+        The poll interval starts at initial_interval seconds and doubles up to max_interval seconds, unless the
+        remaining time for a transfer can be estimated, in which case the next poll is scheduled around the ETA.
+        Progress is recorded in self.transfer_stats.
+        :return: a tuple (done, current)
+        """
+        stats = dict(bytes_transferred=0, elapsed_time=0, eta=None, poll_count=0, rate=None)
+        self.transfer_stats = stats
+        runtime = 0
+        interval = initial_interval
+        sleep_time = 0
+        previous_bytes = None
+        while True:
             current = self.snapmirror_get()
-            if current['status'] != 'transferring':
-                return True
-            timeout -= 30
-        return False
+            stats['poll_count'] += 1
+            done = current is None or is_done(current)
+            progress = current.get('snapshot_progress') if current else None
+            rate = self.get_transfer_rate(current, previous_bytes, progress, sleep_time)
+            if progress is not None:
+                previous_bytes = progress
+                stats['bytes_transferred'] = progress
+            stats['rate'] = int(rate) if rate else None
+            stats['elapsed_time'] = int(round(runtime))
+            if done:
+                stats['eta'] = 0
+                return True, current
+            if runtime >= timeout:
+                return False, current
+            eta = self.get_transfer_eta(current, progress, rate)
+            stats['eta'] = None if eta is None else int(round(eta))
+            if eta is not None:
+                interval = eta
+            elif stats['poll_count'] > 1:
+                interval *= 2
+            sleep_time = min(max(min(interval, max_interval), initial_interval), timeout - runtime)
+            time.sleep(sleep_time)
+            runtime += sleep_time
+
+    def wait_for_status(self):
+        """
+        Wait for a transfer to stop after an abort
+        """
+        done, dummy = self.wait_for_state(lambda current: current['status'] != 'transferring', self.parameters['wait_timeout'])
+        return done
+
+    def wait_for_transfer(self, previous, baseline=False):
+        """
+        Wait for the transfer started by an initialize, resync, or update to complete, if wait_for_transfer is set.
+        A transfer is complete when the relationship is idle and the end timestamp of the last transfer has changed,
+        or when the relationship is snapmirrored if no timestamp was reported before the transfer.
+        :param previous: relationship details before the transfer was started
+        :param baseline: True for an initialize, selects a longer default timeout
+        """
+        if not self.parameters['wait_for_transfer']:
+            return
+        timeout = self.parameters.get('transfer_timeout')
+        if timeout is None:
+            timeout = 86400 if baseline else 3600
+        previous_end = previous.get('last_transfer_end_timestamp') if previous else None
+
+        def is_done(current):
+            if current['status'] != 'idle':
+                return False
+            if previous_end is None:
+                return current['mirror_state'] == 'snapmirrored'
+            return current.get('last_transfer_end_timestamp') != previous_end
+
+        done, current = self.wait_for_state(is_done, timeout)
+        if not done:
+            self.module.fail_json(msg='Error: timeout waiting for SnapMirror transfer to complete after %d seconds.' % timeout,
+                                  transfer_stats=self.transfer_stats)
+        if current and current.get('last_transfer_size') is not None:
+            self.transfer_stats['bytes_transferred'] = current['last_transfer_size']
 
     def check_if_remote_volume_exists(self):
         """
@@ -855,18 +1092,11 @@ class NetAppONTAPSnapmirror(object):
             self.module.fail_json(msg='Error Quiescing SnapMirror : %s'
                                   % (to_native(error)), exception=traceback.format_exc())
         # checking if quiesce was passed successfully
-        if result is not None and result['status'] == 'passed':
-            return
-        elif result is not None and result['status'] != 'passed':
-            retries = 5
-            while retries > 0:
-                time.sleep(5)
-                retries = retries - 1
-                status = self.snapmirror_get()
-                if status['status'] == 'quiesced':
-                    return
-            if retries == 0:
-                self.module.fail_json(msg='Taking a long time to Quiescing SnapMirror, try again later')
+        if result is not None and result['status'] != 'passed':
+            done, dummy = self.wait_for_state(lambda current: current['status'] == 'quiesced', self.parameters['wait_timeout'])
+            if not done:
+                self.module.fail_json(msg='Taking a long time to Quiescing SnapMirror, try again later',
+                                      transfer_stats=self.transfer_stats)
 
     def snapmirror_delete(self):
         """
@@ -956,6 +1186,7 @@ class NetAppONTAPSnapmirror(object):
                 self.module.fail_json(msg='Error initializing SnapMirror : %s'
                                       % (to_native(error)),
                                       exception=traceback.format_exc())
+            self.wait_for_transfer(current, baseline=True)
 
     def snapmirror_resync(self):
         """
@@ -1233,11 +1464,202 @@ class NetAppONTAPSnapmirror(object):
             cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
             netapp_utils.ems_log_event(event_name, cserver)
 
+    def get_relationship_actions(self, relationship, current):
+        """
+        Compute the actions required for a relationship in relationships mode, using the same rules as apply
+        :return: a tuple (actions, error)
+        """
+        if current is None:
+            return None, 'Error: SnapMirror relationship not found'
+        relationship_state = relationship.get('relationship_state') or self.parameters['relationship_state']
+        actions = list()
+        if relationship_state == 'broken':
+            if current['mirror_state'] == 'uninitialized':
+                return None, 'SnapMirror relationship cannot be broken if mirror state is uninitialized'
+            if current['relationship_type'] in ['load_sharing', 'vault']:
+                return None, 'SnapMirror break is not allowed in a load_sharing or vault relationship'
+            if current['mirror_state'] != 'broken-off':
+                actions.append('break')
+            return actions, None
+        if self.parameters['initialize'] and current['mirror_state'] == 'uninitialized' and current['current_transfer_type'] != 'initialize':
+            actions.append('initialize')
+        if current['status'] == 'quiesced':
+            actions.append('resume')
+        if current['mirror_state'] == 'broken-off':
+            actions.append('resync')
+        elif self.parameters['update'] and current['mirror_state'] == 'snapmirrored':
+            actions.append('update')
+        return actions, None
+
+    @staticmethod
+    def get_relationship_zapi(action, destination, current):
+        """
+        :return: ZAPI name and options to perform action on a relationship
+        """
+        options = {'destination-location': destination}
+        zapi = 'snapmirror-%s' % action
+        if current['relationship_type'] == 'load_sharing' and action in ('initialize', 'update'):
+            zapi = 'snapmirror-%s-ls-set' % action
+            options = {'source-location': current['source_location']}
+        return zapi, options
+
+    @staticmethod
+    def invoke_snapmirror_zapi(connections, zapi, options):
+        """
+        Invoke a SnapMirror ZAPI using the connection for the current thread
+        This is safe to call from a worker thread, as errors are returned rather than reported.
+        :return: None or error message
+        """
+        request = netapp_utils.zapi.NaElement.create_node_with_children(zapi, **options)
+        try:
+            connections.get().invoke_successfully(request, enable_tunneling=True)
+        except netapp_utils.zapi.NaApiError as error:
+            return 'Error calling %s: %s' % (zapi, to_native(error))
+        return None
+
+    def run_relationship_actions(self, action, destinations, currents, errors):
+        """
+        Perform action on all destinations, using up to max_concurrency connections
+        Errors are recorded in errors, keyed by destination path.
+        """
+        max_concurrency = self.parameters['max_concurrency']
+        with ThreadConnections(self.server, netapp_utils.clone_zapi_server) as connections:
+            args_list = [(connections,) + self.get_relationship_zapi(action, destination, currents[destination])
+                         for destination in destinations]
+            for destination, error in zip(destinations, iter_concurrently(self.invoke_snapmirror_zapi, args_list, max_concurrency)):
+                if error:
+                    errors[destination] = error
+
+    def wait_for_relationships(self, destinations, is_done, timeout, initial_interval=1, max_interval=60):
+        """
+        Poll all relationships together, with a single snapmirror-get-iter call per poll, until is_done(destination, current)
+        returns True for all of them, or timeout expires.
+        The poll interval starts at initial_interval seconds and doubles up to max_interval seconds.
+        Elapsed time and poll count are added to self.transfer_stats.
+        :return: the list of destinations that did not reach the expected state
+        """
+        runtime = 0
+        interval = initial_interval
+        pending = list(destinations)
+        while pending:
+            currents = self.snapmirror_get_all(pending)
+            self.transfer_stats['poll_count'] += 1
+            pending = [destination for destination in pending
+                       if destination in currents and not is_done(destination, currents[destination])]
+            if not pending or runtime >= timeout:
+                break
+            sleep_time = min(interval, timeout - runtime)
+            time.sleep(sleep_time)
+            runtime += sleep_time
+            interval = min(interval * 2, max_interval)
+        self.transfer_stats['elapsed_time'] += int(round(runtime))
+        return pending
+
+    def apply_relationships(self):
+        """
+        Break, resume, resync, initialize, or update several relationships
+        All relationships are read with a single query, actions are run in parallel, and waits are shared
+        """
+        if self.parameters['state'] != 'present':
+            self.module.fail_json(msg='Error: relationships requires state: present, relationships cannot be deleted in this mode.')
+        if self.parameters.get('connection_type') != 'ontap_ontap':
+            self.module.fail_json(msg='Error: relationships is only supported with connection_type: ontap_ontap.')
+        relationships = self.parameters['relationships']
+        destinations = [relationship['destination_path'] for relationship in relationships]
+        duplicates = sorted(set(destination for destination in destinations if destinations.count(destination) > 1))
+        if duplicates:
+            self.module.fail_json(msg='Error: duplicate destination_path in relationships: %s' % ', '.join(duplicates))
+        currents = self.snapmirror_get_all(destinations)
+        actions = dict()
+        errors = dict()
+        for relationship in relationships:
+            destination = relationship['destination_path']
+            actions[destination], error = self.get_relationship_actions(relationship, currents.get(destination))
+            if error:
+                errors[destination] = error
+        changed = any(actions.values())
+
+        if changed and not self.module.check_mode:
+            self.transfer_stats = dict(bytes_transferred=0, elapsed_time=0, poll_count=0)
+
+            def with_action(action):
+                return [destination for destination in destinations
+                        if destination not in errors and action in (actions[destination] or [])]
+
+            # break: quiesce all, wait for all to be quiesced, then break
+            to_break = with_action('break')
+            self.run_relationship_actions('quiesce', to_break, currents, errors)
+            to_break = [destination for destination in to_break if destination not in errors]
+            for destination in self.wait_for_relationships(to_break, lambda destination, current: current['status'] == 'quiesced',
+                                                           self.parameters['wait_timeout']):
+                errors[destination] = 'Taking a long time to Quiescing SnapMirror, try again later'
+            self.run_relationship_actions('break', with_action('break'), currents, errors)
+            # resume before resync or update
+            self.run_relationship_actions('resume', with_action('resume'), currents, errors)
+            transfers = list()
+            for action in ('initialize', 'resync', 'update'):
+                destinations_for_action = with_action(action)
+                self.run_relationship_actions(action, destinations_for_action, currents, errors)
+                transfers.extend(destinations_for_action)
+            if self.parameters['wait_for_transfer']:
+                self.wait_for_relationship_transfers([destination for destination in transfers if destination not in errors],
+                                                     currents, errors)
+            final = self.snapmirror_get_all(destinations)
+        else:
+            final = currents
+
+        results = list()
+        for destination in destinations:
+            result = dict(destination_path=destination, actions=actions[destination] or [])
+            current = final.get(destination)
+            if current is not None:
+                result['mirror_state'] = current['mirror_state']
+                result['status'] = current['status']
+            if destination in errors:
+                result['msg'] = errors[destination]
+            results.append(result)
+        module_results = dict(changed=changed, relationships=results)
+        if self.transfer_stats is not None:
+            module_results['transfer_stats'] = self.transfer_stats
+        if errors:
+            self.module.fail_json(msg='Error: failed to apply %d of %d relationships: %s'
+                                  % (len(errors), len(results), '  '.join('%s: %s' % (result['destination_path'], result['msg'])
+                                                                          for result in results if 'msg' in result)),
+                                  **module_results)
+        self.module.exit_json(**module_results)
+
+    def wait_for_relationship_transfers(self, destinations, currents, errors):
+        """
+        Wait for the transfers started on destinations to complete, polling all relationships together
+        A baseline transfer selects the longer default timeout.
+        """
+        timeout = self.parameters.get('transfer_timeout')
+        if timeout is None:
+            timeout = 86400 if any(currents[destination]['mirror_state'] == 'uninitialized' for destination in destinations) else 3600
+
+        def is_done(destination, current):
+            if current['status'] != 'idle':
+                return False
+            previous_end = currents[destination].get('last_transfer_end_timestamp')
+            if previous_end is None:
+                done = current['mirror_state'] == 'snapmirrored'
+            else:
+                done = current.get('last_transfer_end_timestamp') != previous_end
+            if done:
+                self.transfer_stats['bytes_transferred'] += current.get('last_transfer_size', 0)
+            return done
+
+        for destination in self.wait_for_relationships(destinations, is_done, timeout):
+            errors[destination] = 'Error: timeout waiting for SnapMirror transfer to complete after %d seconds.' % timeout
+
     def apply(self):
         """
         Apply action to SnapMirror
         """
         self.asup_log_for_cserver("na_ontap_snapmirror")
+        if self.parameters.get('relationships'):
+            self.apply_relationships()
+            return
         # source is ElementSW
         if self.parameters['state'] == 'present' and self.parameters.get('connection_type') == 'elementsw_ontap':
             self.check_elementsw_parameters()
@@ -1320,6 +1742,7 @@ class NetAppONTAPSnapmirror(object):
                     actions.append('resync')
                     if not self.module.check_mode:
                         self.snapmirror_resync()
+                        self.wait_for_transfer(current)
                     # set changed explicitly for resync
                     self.na_helper.changed = True
                 # Update when create is called again, or modify is being called
@@ -1329,6 +1752,7 @@ class NetAppONTAPSnapmirror(object):
                         actions.append('update')
                         if not self.module.check_mode:
                             self.snapmirror_update(current['relationship_type'])
+                            self.wait_for_transfer(current)
                         self.na_helper.changed = True
 
         self.check_health()
@@ -1337,6 +1761,8 @@ class NetAppONTAPSnapmirror(object):
             results['actions'] = actions
         if response:
             results['response'] = response
+        if self.transfer_stats is not None:
+            results['transfer_stats'] = self.transfer_stats
         self.module.exit_json(**results)
 
 
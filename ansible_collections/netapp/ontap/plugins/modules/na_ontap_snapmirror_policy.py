@@ -782,9 +782,7 @@ class NetAppOntapSnapMirrorPolicy(object):
                                   exception=traceback.format_exc())
 
     def asup_log_for_cserver(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_snapmirror_policy", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_snapmirror_policy", self.server, self.module)
 
     def apply(self):
         uuid = None
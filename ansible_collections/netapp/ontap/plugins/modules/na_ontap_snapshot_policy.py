@@ -457,9 +457,7 @@ class NetAppOntapSnapshotPolicy(object):
         if 'vserver' in self.parameters:
             netapp_utils.ems_log_event(event_name, self.server)
         else:
-            results = netapp_utils.get_cserver(self.server)
-            cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-            netapp_utils.ems_log_event(event_name, cserver)
+            netapp_utils.ems_log_event_cserver(event_name, self.server, self.module)
 
     def apply(self):
         """
@@ -158,9 +158,7 @@ class NetAppONTAPSnmp(object):
         to add an already existing snmp community
         """
         current = self.get_snmp()
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_snmp", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_snmp", self.server, self.module)
         cd_action = self.na_helper.get_cd_action(current, self.parameters)
         if self.na_helper.changed and not self.module.check_mode:
             if cd_action == 'create':
@@ -336,9 +336,7 @@ class NetAppONTAPSoftwareUpdate(object):
         Autosupport log for software_update
         :return:
         """
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        netapp_utils.ems_log_event("na_ontap_software_update", cserver)
+        netapp_utils.ems_log_event_cserver("na_ontap_software_update", self.server, self.module)
 
     def is_update_required(self):
         ''' return True if at least one node is not at the correct version '''
@@ -227,9 +227,7 @@ class NetAppOntapStorageAutoGiveback(object):
                                       exception=traceback.format_exc())
 
     def ems_log_event(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        return netapp_utils.ems_log_event("na_ontap_storage_auto_giveback", cserver)
+        return netapp_utils.ems_log_event_cserver("na_ontap_storage_auto_giveback", self.server, self.module)
 
     def apply(self):
         if not self.use_rest:
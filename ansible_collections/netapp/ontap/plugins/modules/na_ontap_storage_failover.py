@@ -188,9 +188,7 @@ class NetAppOntapStorageFailover(object):
                     self.parameters['node_name'], to_native(error)), exception=traceback.format_exc())
 
     def ems_log_event(self):
-        results = netapp_utils.get_cserver(self.server)
-        cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-        return netapp_utils.ems_log_event("na_ontap_storage_failover", cserver)
+        return netapp_utils.ems_log_event_cserver("na_ontap_storage_failover", self.server, self.module)
 
     def apply(self):
         if not self.use_rest:
@@ -41,8 +41,8 @@ options:
   name:
     description:
     - The name of the volume to manage.
+    - Required, unless C(volumes) is set.
     type: str
-    required: true
 
   vserver:
     description:
@@ -526,6 +526,90 @@ options:
     - Whether to enable inline compression for the volume (HDD and Flash Pool aggregates, AFF platforms).
     type: bool
     version_added: '20.12.0'
+
+  volumes:
+    description:
+    - Manage several volumes in a single task.
+    - The current state of all volumes is read with a single volume-get-iter call, then volumes are created, modified, or deleted as needed.
+    - Each element describes a volume, options that are not set for a volume default to the values set for the task.
+    - Mutually exclusive with C(name), C(from_name), C(from_vserver), C(snapshot_restore), and C(nas_application_template).
+    - The result reports changed, modify, and any error for each volume in C(volumes).
+    type: list
+    elements: dict
+    version_added: '21.7.0'
+    suboptions:
+      name:
+        description: The name of the volume.
+        type: str
+        required: true
+      state:
+        description: Whether the volume should exist or not.
+        type: str
+        choices: ['present', 'absent']
+      size:
+        description: The size of the volume in (size_unit).
+        type: int
+      size_unit:
+        description: The unit used to interpret the size parameter.
+        type: str
+        choices: ['bytes', 'b', 'kb', 'mb', 'gb', 'tb', 'pb', 'eb', 'zb', 'yb']
+      aggregate_name:
+        description: The name of the aggregate the FlexVol should exist on.
+        type: str
+      junction_path:
+        description: Junction path of the volume.
+        type: str
+      export_policy:
+        description: Name of the export policy.
+        type: str
+      comment:
+        description: Sets a comment associated with the volume.
+        type: str
+      snapshot_policy:
+        description: The name of the snapshot policy.
+        type: str
+      percent_snapshot_space:
+        description: Amount of space reserved for snapshot copies of the volume.
+        type: int
+      space_guarantee:
+        description: Space guarantee style for the volume.
+        type: str
+        choices: ['none', 'file', 'volume']
+      volume_security_style:
+        description: The security style associated with this volume.
+        type: str
+        choices: ['mixed', 'ntfs', 'unified', 'unix']
+      unix_permissions:
+        description: Unix permission bits in octal or symbolic format.
+        type: str
+      efficiency_policy:
+        description: Allows a storage efficiency policy to be set on volume creation.
+        type: str
+      qos_policy_group:
+        description: Specifies a QoS policy group to be set on volume.
+        type: str
+      tiering_policy:
+        description: The tiering policy that is to be associated with the volume.
+        type: str
+        choices: ['snapshot-only', 'auto', 'backup', 'none', 'all']
+      is_online:
+        description: Whether the specified volume is online, or not.
+        type: bool
+      type:
+        description: The volume type, either read-write (RW) or data-protection (DP).
+        type: str
+      language:
+        description: Language to use for Volume.
+        type: str
+
+  max_concurrency:
+    description:
+    - Maximum number of volumes created, modified, or deleted in parallel when C(volumes) is set.
+    - Each worker uses its own connection to ONTAP.
+    - With the default value of 1, volumes are processed one at a time.
+    type: int
+    default: 1
+    version_added: '21.7.0'
 '''
 
 EXAMPLES = """
@@ -731,22 +815,83 @@ EXAMPLES = """
         password: "{{ netapp_password }}"
         https: true
         validate_certs: false
+
+    - name: Create or update several volumes in a single task
+      na_ontap_volume:
+        state: present
+        vserver: ansibleSVM
+        aggregate_name: ansible_aggr
+        size: 10
+        size_unit: gb
+        space_guarantee: none
+        volumes:
+          - name: tenant1_vol1
+            junction_path: /tenant1_vol1
+          - name: tenant1_vol2
+            junction_path: /tenant1_vol2
+            size: 20
+          - name: tenant1_old
+            state: absent
+        max_concurrency: 4
+        hostname: "{{ netapp_hostname }}"
+        username: "{{ netapp_username }}"
+        password: "{{ netapp_password }}"
 """
 
 RETURN = """
+volumes:
+  description:
+  - Per volume results when C(volumes) is set, in the same order.
+  - Each element reports name and changed, and modify, modify_after_create, or msg when applicable.
+  returned: when volumes is set
+  type: list
+  elements: dict
+  sample: '[{"name": "tenant1_vol1", "changed": true}, {"name": "tenant1_vol2", "changed": false}]'
+job_progress:
+  description:
+  - For each asynchronous ZAPI job the module waited on, the job id, the last job state, and the distinct progress messages, oldest first.
+  - With C(volumes), reported for each volume in C(volumes).
+  returned: when the module waited on a ZAPI job
+  type: list
+  elements: dict
+  sample: '[{"jobid": "8316", "state": "success", "progress": ["Creating constituent volumes", "Complete: Successful [0]"]}]'
 """
 
+import copy
 import time
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently, ThreadConnections
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp_module import NetAppModule
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_zapi_records
 from ansible_collections.netapp.ontap.plugins.module_utils.rest_application import RestApplication
 import ansible_collections.netapp.ontap.plugins.module_utils.rest_volume as rest_volume
+import ansible_collections.netapp.ontap.plugins.module_utils.zapi_job_helpers as zapi_job_helpers
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
+SIZE_UNITS = ['bytes', 'b', 'kb', 'mb', 'gb', 'tb', 'pb', 'eb', 'zb', 'yb']
+
+
+class WorkerError(Exception):
+    ''' fail_json arguments raised when processing a volume in batch mode, to be reported from the main thread '''
+
+
+class WorkerModule(object):
+    ''' wraps AnsibleModule so that an error is reported for a single volume rather than exiting the module '''
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs['msg'] = msg
+        raise WorkerError(kwargs)
+
 
 class NetAppOntapVolume(object):
     '''Class with volume operations'''
@@ -769,13 +914,13 @@ class NetAppOntapVolume(object):
         self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
         self.argument_spec.update(dict(
             state=dict(required=False, type='str', choices=['present', 'absent'], default='present'),
-            name=dict(required=True, type='str'),
+            name=dict(required=False, type='str'),
             vserver=dict(required=True, type='str'),
             from_name=dict(required=False, type='str'),
             is_infinite=dict(required=False, type='bool', default=False),
             is_online=dict(required=False, type='bool', default=True),
             size=dict(type='int', default=None),
-            size_unit=dict(default='gb', choices=['bytes', 'b', 'kb', 'mb', 'gb', 'tb', 'pb', 'eb', 'zb', 'yb'], type='str'),
+            size_unit=dict(default='gb', choices=SIZE_UNITS, type='str'),
             sizing_method=dict(choices=['add_new_resources', 'use_existing_resources'], type='str'),
             aggregate_name=dict(type='str', default=None),
             type=dict(type='str', default=None),
@@ -839,13 +984,38 @@ class NetAppOntapVolume(object):
                 ))
             )),
             size_change_threshold=dict(type='int', default=10),
+            volumes=dict(type='list', elements='dict', options=dict(
+                name=dict(required=True, type='str'),
+                state=dict(type='str', choices=['present', 'absent']),
+                size=dict(type='int'),
+                size_unit=dict(type='str', choices=SIZE_UNITS),
+                aggregate_name=dict(type='str'),
+                junction_path=dict(type='str'),
+                export_policy=dict(type='str'),
+                comment=dict(type='str'),
+                snapshot_policy=dict(type='str'),
+                percent_snapshot_space=dict(type='int'),
+                space_guarantee=dict(type='str', choices=['none', 'file', 'volume']),
+                volume_security_style=dict(type='str', choices=['mixed', 'ntfs', 'unified', 'unix']),
+                unix_permissions=dict(type='str'),
+                efficiency_policy=dict(type='str'),
+                qos_policy_group=dict(type='str'),
+                tiering_policy=dict(type='str', choices=['snapshot-only', 'auto', 'backup', 'none', 'all']),
+                is_online=dict(type='bool'),
+                type=dict(type='str'),
+                language=dict(type='str'),
+            )),
+            max_concurrency=dict(type='int', default=1),
         ))
 
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
             mutually_exclusive=[
-                ['space_guarantee', 'space_slo'], ['auto_remap_luns', 'force_unmap_luns']
+                ['space_guarantee', 'space_slo'], ['auto_remap_luns', 'force_unmap_luns'],
+                ['name', 'volumes'], ['from_name', 'volumes'], ['from_vserver', 'volumes'],
+                ['snapshot_restore', 'volumes'], ['nas_application_template', 'volumes']
             ],
+            required_one_of=[['name', 'volumes']],
             supports_check_mode=True
         )
         self.na_helper = NetAppModule(self.module)
@@ -853,6 +1023,7 @@ class NetAppOntapVolume(object):
         self.volume_style = None
         self.volume_created = False
         self.issues = list()
+        self.job_progress = list()
         self.sis_keys2zapi_get = dict(
             efficiency_policy='policy',
             compression='is-compression-enabled',
@@ -944,6 +1115,30 @@ class NetAppOntapVolume(object):
                                   exception=traceback.format_exc())
         return result
 
+    def get_volumes(self, vol_names):
+        """
+        Return volume-attributes for a list of volumes, using a single volume-get-iter query
+        :param vol_names: names of the volumes
+        :return: dict of NaElement indexed by volume name, volumes that are not found are not present.
+        """
+        volume_attributes = netapp_utils.zapi.NaElement('volume-attributes')
+        volume_id_attributes = netapp_utils.zapi.NaElement('volume-id-attributes')
+        volume_id_attributes.add_new_child('name', '|'.join(vol_names))
+        volume_id_attributes.add_new_child('vserver', self.parameters['vserver'])
+        volume_attributes.add_child_elem(volume_id_attributes)
+        query = netapp_utils.zapi.NaElement('query')
+        query.add_child_elem(volume_attributes)
+        records = dict()
+        try:
+            for record in iter_zapi_records(self.server, 'volume-get-iter', query, len(vol_names)):
+                name = self.na_helper.zapi_get_value(record, ['volume-id-attributes', 'name'])
+                records[name] = record
+        except netapp_utils.zapi.NaApiError as error:
+            self.module.fail_json(msg='Error fetching volumes %s : %s'
+                                  % (', '.join(vol_names), to_native(error)),
+                                  exception=traceback.format_exc())
+        return records
+
     def get_application(self):
         if self.rest_app:
             app, error = self.rest_app.get_application_details('nas')
@@ -970,70 +1165,84 @@ class NetAppOntapVolume(object):
             vol_name = self.parameters['name']
         volume_info = self.volume_get_iter(vol_name)
         if self.na_helper.zapi_get_value(volume_info, ['num-records'], convert_to=int, default=0) > 0:
-            # extract values from volume record
-            attrs = dict(
-                # The keys are used to index a result dictionary, values are read from a ZAPI object indexed by key_list.
-                # If required is True, an error is reported if a key in key_list is not found.
-                # I'm not sure there is much value in omitnone, but it preserves backward compatibility
-                # If omitnone is absent or False, a None value is recorded, if True, the key is not set
-                encrypt=dict(key_list=['encrypt'], convert_to=bool, omitnone=True),
-                tiering_policy=dict(key_list=['volume-comp-aggr-attributes', 'tiering-policy'], omitnone=True),
-                export_policy=dict(key_list=['volume-export-attributes', 'policy']),
-                aggregate_name=dict(key_list=['volume-id-attributes', 'containing-aggregate-name']),
-                flexgroup_uuid=dict(key_list=['volume-id-attributes', 'flexgroup-uuid']),
-                instance_uuid=dict(key_list=['volume-id-attributes', 'instance-uuid']),
-                junction_path=dict(key_list=['volume-id-attributes', 'junction-path'], default=''),
-                style_extended=dict(key_list=['volume-id-attributes', 'style-extended']),
-                type=dict(key_list=['volume-id-attributes', 'type'], omitnone=True),
-                comment=dict(key_list=['volume-id-attributes', 'comment']),
-                atime_update=dict(key_list=['volume-performance-attributes', 'is-atime-update-enabled'], convert_to=bool),
-                qos_policy_group=dict(key_list=['volume-qos-attributes', 'policy-group-name']),
-                qos_adaptive_policy_group=dict(key_list=['volume-qos-attributes', 'adaptive-policy-group-name']),
-                # style is not present if the volume is still offline or of type: dp
-                volume_security_style=dict(key_list=['volume-security-attributes', 'style'], omitnone=True),
-                group_id=dict(key_list=['volume-security-attributes', 'volume-security-unix-attributes', 'group-id'], convert_to=int, omitnone=True),
-                unix_permissions=dict(key_list=['volume-security-attributes', 'volume-security-unix-attributes', 'permissions'], required=True),
-                user_id=dict(key_list=['volume-security-attributes', 'volume-security-unix-attributes', 'user-id'], convert_to=int, omitnone=True),
-                snapdir_access=dict(key_list=['volume-snapshot-attributes', 'snapdir-access-enabled'], convert_to=bool),
-                snapshot_policy=dict(key_list=['volume-snapshot-attributes', 'snapshot-policy'], omitnone=True),
-                percent_snapshot_space=dict(key_list=['volume-space-attributes', 'percentage-snapshot-reserve'], convert_to=int, omitnone=True),
-                size=dict(key_list=['volume-space-attributes', 'size'], required=True, convert_to=int),
-                space_guarantee=dict(key_list=['volume-space-attributes', 'space-guarantee']),
-                space_slo=dict(key_list=['volume-space-attributes', 'space-slo']),
-                nvfail_enabled=dict(key_list=['volume-state-attributes', 'is-nvfail-enabled'], convert_to=bool),
-                is_online=dict(key_list=['volume-state-attributes', 'state'], required=True, convert_to='bool_online'),
-                vserver_dr_protection=dict(key_list=['volume-vserver-dr-protection-attributes', 'vserver-dr-protection']),
-            )
-
             volume_attributes = self.na_helper.zapi_get_value(volume_info, ['attributes-list', 'volume-attributes'], required=True)
-            result = dict(name=vol_name)
-            self.na_helper.zapi_get_attrs(volume_attributes, attrs, result)
+            result = self.get_volume_from_attributes(vol_name, volume_attributes)
+        return result
 
-            if result['style_extended'] == 'flexvol':
-                result['uuid'] = result['instance_uuid']
-            elif result['style_extended'] is not None and result['style_extended'].startswith('flexgroup'):
-                result['uuid'] = result['flexgroup_uuid']
-            else:
-                result['uuid'] = None
-
-            # snapshot_auto_delete options
-            auto_delete = dict()
-            attrs = dict(
-                commitment=dict(key_list=['volume-snapshot-autodelete-attributes', 'commitment']),
-                defer_delete=dict(key_list=['volume-snapshot-autodelete-attributes', 'defer-delete']),
-                delete_order=dict(key_list=['volume-snapshot-autodelete-attributes', 'delete-order']),
-                destroy_list=dict(key_list=['volume-snapshot-autodelete-attributes', 'destroy-list']),
-                is_autodelete_enabled=dict(key_list=['volume-snapshot-autodelete-attributes', 'is-autodelete-enabled'], convert_to=bool),
-                prefix=dict(key_list=['volume-snapshot-autodelete-attributes', 'prefix']),
-                target_free_space=dict(key_list=['volume-snapshot-autodelete-attributes', 'target-free-space'], convert_to=int),
-                trigger=dict(key_list=['volume-snapshot-autodelete-attributes', 'trigger']),
-            )
-            self.na_helper.zapi_get_attrs(volume_attributes, attrs, auto_delete)
-            if auto_delete['is_autodelete_enabled'] is not None:
-                auto_delete['state'] = 'on' if auto_delete['is_autodelete_enabled'] else 'off'
-                del auto_delete['is_autodelete_enabled']
-            result['snapshot_auto_delete'] = auto_delete
+    def get_volume_from_attributes(self, vol_name, volume_attributes, get_efficiency=True):
+        """
+        Extract details about the volume from a volume-attributes ZAPI object
+        :param:
+            vol_name : Name of the volume
+            volume_attributes: volume-attributes NaElement
+            get_efficiency: whether to read efficiency settings with sis-get-iter
+        :return: Details about the volume.
+        :rtype: dict
+        """
+        # extract values from volume record
+        attrs = dict(
+            # The keys are used to index a result dictionary, values are read from a ZAPI object indexed by key_list.
+            # If required is True, an error is reported if a key in key_list is not found.
+            # I'm not sure there is much value in omitnone, but it preserves backward compatibility
+            # If omitnone is absent or False, a None value is recorded, if True, the key is not set
+            encrypt=dict(key_list=['encrypt'], convert_to=bool, omitnone=True),
+            tiering_policy=dict(key_list=['volume-comp-aggr-attributes', 'tiering-policy'], omitnone=True),
+            export_policy=dict(key_list=['volume-export-attributes', 'policy']),
+            aggregate_name=dict(key_list=['volume-id-attributes', 'containing-aggregate-name']),
+            flexgroup_uuid=dict(key_list=['volume-id-attributes', 'flexgroup-uuid']),
+            instance_uuid=dict(key_list=['volume-id-attributes', 'instance-uuid']),
+            junction_path=dict(key_list=['volume-id-attributes', 'junction-path'], default=''),
+            style_extended=dict(key_list=['volume-id-attributes', 'style-extended']),
+            type=dict(key_list=['volume-id-attributes', 'type'], omitnone=True),
+            comment=dict(key_list=['volume-id-attributes', 'comment']),
+            atime_update=dict(key_list=['volume-performance-attributes', 'is-atime-update-enabled'], convert_to=bool),
+            qos_policy_group=dict(key_list=['volume-qos-attributes', 'policy-group-name']),
+            qos_adaptive_policy_group=dict(key_list=['volume-qos-attributes', 'adaptive-policy-group-name']),
+            # style is not present if the volume is still offline or of type: dp
+            volume_security_style=dict(key_list=['volume-security-attributes', 'style'], omitnone=True),
+            group_id=dict(key_list=['volume-security-attributes', 'volume-security-unix-attributes', 'group-id'], convert_to=int, omitnone=True),
+            unix_permissions=dict(key_list=['volume-security-attributes', 'volume-security-unix-attributes', 'permissions'], required=True),
+            user_id=dict(key_list=['volume-security-attributes', 'volume-security-unix-attributes', 'user-id'], convert_to=int, omitnone=True),
+            snapdir_access=dict(key_list=['volume-snapshot-attributes', 'snapdir-access-enabled'], convert_to=bool),
+            snapshot_policy=dict(key_list=['volume-snapshot-attributes', 'snapshot-policy'], omitnone=True),
+            percent_snapshot_space=dict(key_list=['volume-space-attributes', 'percentage-snapshot-reserve'], convert_to=int, omitnone=True),
+            size=dict(key_list=['volume-space-attributes', 'size'], required=True, convert_to=int),
+            space_guarantee=dict(key_list=['volume-space-attributes', 'space-guarantee']),
+            space_slo=dict(key_list=['volume-space-attributes', 'space-slo']),
+            nvfail_enabled=dict(key_list=['volume-state-attributes', 'is-nvfail-enabled'], convert_to=bool),
+            is_online=dict(key_list=['volume-state-attributes', 'state'], required=True, convert_to='bool_online'),
+            vserver_dr_protection=dict(key_list=['volume-vserver-dr-protection-attributes', 'vserver-dr-protection']),
+        )
 
+        result = dict(name=vol_name)
+        self.na_helper.zapi_get_attrs(volume_attributes, attrs, result)
+
+        if result['style_extended'] == 'flexvol':
+            result['uuid'] = result['instance_uuid']
+        elif result['style_extended'] is not None and result['style_extended'].startswith('flexgroup'):
+            result['uuid'] = result['flexgroup_uuid']
+        else:
+            result['uuid'] = None
+
+        # snapshot_auto_delete options
+        auto_delete = dict()
+        attrs = dict(
+            commitment=dict(key_list=['volume-snapshot-autodelete-attributes', 'commitment']),
+            defer_delete=dict(key_list=['volume-snapshot-autodelete-attributes', 'defer-delete']),
+            delete_order=dict(key_list=['volume-snapshot-autodelete-attributes', 'delete-order']),
+            destroy_list=dict(key_list=['volume-snapshot-autodelete-attributes', 'destroy-list']),
+            is_autodelete_enabled=dict(key_list=['volume-snapshot-autodelete-attributes', 'is-autodelete-enabled'], convert_to=bool),
+            prefix=dict(key_list=['volume-snapshot-autodelete-attributes', 'prefix']),
+            target_free_space=dict(key_list=['volume-snapshot-autodelete-attributes', 'target-free-space'], convert_to=int),
+            trigger=dict(key_list=['volume-snapshot-autodelete-attributes', 'trigger']),
+        )
+        self.na_helper.zapi_get_attrs(volume_attributes, attrs, auto_delete)
+        if auto_delete['is_autodelete_enabled'] is not None:
+            auto_delete['state'] = 'on' if auto_delete['is_autodelete_enabled'] else 'off'
+            del auto_delete['is_autodelete_enabled']
+        result['snapshot_auto_delete'] = auto_delete
+
+        if get_efficiency:
             self.get_efficiency_info(result)
 
         return result
@@ -1043,6 +1252,8 @@ class NetAppOntapVolume(object):
             self.module.warn(issue)
         if self.volume_created:
             msg = 'Volume created with success, with missing attributes: ' + msg
+        if self.job_progress:
+            self.module.fail_json(msg=msg, exception=exception, job_progress=self.job_progress)
         self.module.fail_json(msg=msg, exception=exception)
 
     def create_nas_application_component(self):
@@ -1764,73 +1975,28 @@ class NetAppOntapVolume(object):
             return 'flexgroup'
         return None
 
-    def get_job(self, jobid, server):
+    def check_job_status(self, jobid):
         """
-        Get job details by id
+        Loop until job is complete
         """
-        job_get = netapp_utils.zapi.NaElement('job-get')
-        job_get.add_new_child('job-id', jobid)
         try:
-            result = server.invoke_successfully(job_get, enable_tunneling=True)
+            results = zapi_job_helpers.wait_for_job(self.module, self.server, jobid, self.parameters['time_out'])
         except netapp_utils.zapi.NaApiError as error:
-            if to_native(error.code) == "15661":
-                # Not found
-                return None
             self.wrap_fail_json(msg='Error fetching job info: %s' % to_native(error),
                                 exception=traceback.format_exc())
-        job_info = result.get_child_by_name('attributes').get_child_by_name('job-info')
-        results = {
-            'job-progress': job_info['job-progress'],
-            'job-state': job_info['job-state']
-        }
-        if job_info.get_child_by_name('job-completion') is not None:
-            results['job-completion'] = job_info['job-completion']
-        else:
-            results['job-completion'] = None
-        return results
-
-    def check_job_status(self, jobid):
-        """
-        Loop until job is complete
-        """
-        server = self.server
-        sleep_time = 5
-        time_out = self.parameters['time_out']
-        results = self.get_job(jobid, server)
-        error = 'timeout'
-
-        while time_out > 0:
-            results = self.get_job(jobid, server)
-            # If running as cluster admin, the job is owned by cluster vserver
-            # rather than the target vserver.
-            if results is None and server == self.server:
-                results = netapp_utils.get_cserver(self.server)
-                server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-                continue
-            if results is None:
-                error = 'cannot locate job with id: %d' % int(jobid)
-                break
-            if results['job-state'] in ('queued', 'running'):
-                time.sleep(sleep_time)
-                time_out -= sleep_time
-                continue
-            if results['job-state'] in ('success', 'failure'):
-                break
-            else:
-                self.wrap_fail_json(msg='Unexpected job status in: %s' % repr(results))
-
-        if results is not None:
-            if results['job-state'] == 'success':
-                error = None
-            elif results['job-state'] in ('queued', 'running'):
-                error = 'job completion exceeded expected timer of: %s seconds' % \
-                        self.parameters['time_out']
-            else:
-                if results['job-completion'] is not None:
-                    error = results['job-completion']
-                else:
-                    error = results['job-progress']
-        return error
+        if results is None:
+            return 'cannot locate job with id: %d' % int(jobid)
+        self.job_progress.append(dict(jobid=str(jobid), state=results['job-state'], progress=results['job-progress-history']))
+        if results['job-state'] == 'success':
+            return None
+        if results['job-state'] in ('queued', 'running'):
+            return 'job completion exceeded expected timer of: %s seconds, last progress: %s' % \
+                (self.parameters['time_out'], results['job-progress'])
+        if results['job-state'] == 'failure':
+            if results['job-completion'] is not None:
+                return results['job-completion']
+            return results['job-progress']
+        self.wrap_fail_json(msg='Unexpected job status in: %s' % repr(results))
 
     def check_invoke_result(self, result, action):
         '''
@@ -1915,26 +2081,39 @@ class NetAppOntapVolume(object):
         if attribute does not exist, set its value to None
         :return: update return_value dict.
         """
-        sis_info = netapp_utils.zapi.NaElement('sis-get-iter')
+        sis_records = self.get_sis_records(['/vol/' + self.parameters['name']])
+        if sis_records is None:
+            return
+        self.set_efficiency_values(return_value, sis_records[0] if sis_records else None)
+
+    def get_sis_records(self, paths):
+        """
+        get sis-status-info records for a list of volume paths
+        :return: list of NaElement, or None if efficiency settings cannot be read.
+        """
         sis_status_info = netapp_utils.zapi.NaElement('sis-status-info')
-        sis_status_info.add_new_child('path', '/vol/' + self.parameters['name'])
+        sis_status_info.add_new_child('path', '|'.join(paths))
         query = netapp_utils.zapi.NaElement('query')
         query.add_child_elem(sis_status_info)
-        sis_info.add_child_elem(query)
         try:
-            result = self.server.invoke_successfully(sis_info, True)
+            return list(iter_zapi_records(self.server, 'sis-get-iter', query, len(paths)))
         except netapp_utils.zapi.NaApiError as error:
             # Don't error out if efficiency settings cannot be read.  We'll fail if they need to be set.
             if error.message.startswith('Insufficient privileges: user ') and error.message.endswith(' does not have read access to this resource'):
                 self.issues.append('cannot read volume efficiency options (as expected when running as vserver): %s' % to_native(error))
-                return
+                return None
             self.wrap_fail_json(msg='Error fetching efficiency policy for volume %s : %s'
-                                % (self.parameters['name'], to_native(error)),
+                                % (', '.join(path[len('/vol/'):] for path in paths), to_native(error)),
                                 exception=traceback.format_exc())
+
+    def set_efficiency_values(self, return_value, sis_attributes):
+        """
+        set efficiency policy and compression values from a sis-status-info record, or None if there is no record
+        :return: update return_value dict.
+        """
         for key in self.sis_keys2zapi_get:
             return_value[key] = None
-        if result.get_child_by_name('num-records') and int(result.get_child_content('num-records')) >= 1:
-            sis_attributes = result.get_child_by_name('attributes-list'). get_child_by_name('sis-status-info')
+        if sis_attributes is not None:
             for key, attr in self.sis_keys2zapi_get.items():
                 value = sis_attributes.get_child_content(attr)
                 if self.argument_spec[key]['type'] == 'bool':
@@ -2047,9 +2226,16 @@ class NetAppOntapVolume(object):
 
     def apply(self):
         '''Call create/modify/delete operations'''
+        if self.parameters.get('volumes') is not None:
+            self.apply_volumes()
+        current = self.get_volume()
+        result = self.apply_volume(current)
+        self.module.exit_json(**result)
+
+    def apply_volume(self, current):
+        '''Call create/modify/delete operations for a volume, and return the results'''
         response = None
         modify_after_create = None
-        current = self.get_volume()
         self.volume_style = self.get_volume_style(current)
         if self.volume_style == 'flexgroup' and self.parameters.get('aggregate_name') is not None:
             self.module.fail_json(msg='Error: aggregate_name option cannot be used with FlexGroups.')
@@ -2122,7 +2308,86 @@ class NetAppOntapVolume(object):
             result['modify'] = modify
         if modify_after_create:
             result['modify_after_create'] = modify_after_create
-        self.module.exit_json(**result)
+        if self.job_progress:
+            result['job_progress'] = self.job_progress
+        return result
+
+    def get_volume_parameters(self, volume):
+        '''Merge the options set for a volume in volumes with the options set for the task'''
+        parameters = dict(self.parameters)
+        del parameters['volumes']
+        parameters.update((key, value) for key, value in volume.items() if value is not None)
+        if volume.get('size') is not None or volume.get('size_unit') is not None:
+            size = volume['size'] if volume.get('size') is not None else self.module.params['size']
+            if size is not None:
+                parameters['size'] = size * self._size_unit_map[parameters['size_unit']]
+        return parameters
+
+    def create_worker(self, volume):
+        '''Return a copy of this object to manage a volume in volumes'''
+        worker = copy.copy(self)
+        worker.module = WorkerModule(self.module)
+        worker.na_helper = NetAppModule(worker.module)
+        worker.parameters = self.get_volume_parameters(volume)
+        worker.na_helper.parameters = worker.parameters
+        worker.volume_style = None
+        worker.volume_created = False
+        worker.issues = list()
+        worker.job_progress = list()
+        worker.rest_app = None
+        return worker
+
+    def apply_worker(self, volume_attributes, sis_records):
+        '''Apply changes to a volume in volumes, errors are reported in the result rather than exiting'''
+        try:
+            current = None
+            if volume_attributes is not None:
+                current = self.get_volume_from_attributes(self.parameters['name'], volume_attributes, get_efficiency=False)
+                if sis_records is not None:
+                    self.set_efficiency_values(current, sis_records.get('/vol/' + self.parameters['name']))
+            result = self.apply_volume(current)
+        except WorkerError as exc:
+            result = dict(changed=self.na_helper.changed, failed=True, msg=exc.args[0]['msg'])
+            if self.job_progress:
+                result['job_progress'] = self.job_progress
+        for issue in self.issues:
+            self.module.warn('%s: %s' % (self.parameters['name'], issue))
+        result['name'] = self.parameters['name']
+        return result
+
+    def apply_volumes(self):
+        '''Read the current state of all volumes in volumes with a single query, then call create/modify/delete operations for each'''
+        vol_names = [volume['name'] for volume in self.parameters['volumes']]
+        duplicates = sorted(set(name for name in vol_names if vol_names.count(name) > 1))
+        if duplicates:
+            self.module.fail_json(msg='Error: duplicate volume names in volumes: %s' % ', '.join(duplicates))
+        records = self.get_volumes(vol_names)
+        sis_records = None
+        if records:
+            sis_list = self.get_sis_records(['/vol/' + name for name in records])
+            if sis_list is not None:
+                sis_records = dict((record.get_child_content('path'), record) for record in sis_list)
+            for issue in self.issues:
+                self.module.warn(issue)
+        max_concurrency = self.parameters['max_concurrency']
+        # a ZAPI connection cannot be shared between threads, each worker thread uses its own connections
+        with ThreadConnections(self.server, netapp_utils.clone_zapi_server) as servers, \
+                ThreadConnections(self.cluster, netapp_utils.clone_zapi_server) as clusters:
+            args_list = [(self.create_worker(volume), records.get(volume['name']), sis_records, servers, clusters)
+                         for volume in self.parameters['volumes']]
+            results = list(iter_concurrently(self.run_worker, args_list, max_concurrency))
+        changed = any(result['changed'] for result in results)
+        errors = ['%s: %s' % (result['name'], result['msg']) for result in results if result.get('failed')]
+        if errors:
+            self.module.fail_json(msg='Error: failed to apply %d of %d volumes: %s' % (len(errors), len(results), '  '.join(errors)),
+                                  changed=changed, volumes=results)
+        self.module.exit_json(changed=changed, volumes=results)
+
+    @staticmethod
+    def run_worker(worker, volume_attributes, sis_records, servers, clusters):
+        worker.server = servers.get()
+        worker.cluster = clusters.get()
+        return worker.apply_worker(volume_attributes, sis_records)
 
     def ems_log_event(self, state):
         '''Autosupport log event'''
@@ -272,9 +272,7 @@ class NetAppOntapVscanScannerPool(object):
             # TODO: logging for Rest
             return
         else:
-            results = netapp_utils.get_cserver(self.server)
-            cserver = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=results)
-            netapp_utils.ems_log_event(event_name, cserver)
+            netapp_utils.ems_log_event_cserver(event_name, self.server, self.module)
 
     def apply(self):
         self.asup_log_for_cserver("na_ontap_vscan_scanner_pool")
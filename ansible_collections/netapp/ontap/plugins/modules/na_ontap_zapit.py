@@ -21,6 +21,7 @@ description:
   - In case of a ZAPI error, C(status), C(errno), C(reason) are set to help with diagnosing the issue,
   - and the call is reported as an error ('failed').
   - Other errors (eg connection issues) are reported as Ansible error.
+  - With C(zapis), several ZAPIs are called in a single task, and the status of each call is reported in C(responses).
 extends_documentation_fragment:
   - netapp.ontap.netapp.na_ontap
 module: na_ontap_zapit
@@ -34,8 +35,34 @@ options:
         - Value can be another dictionary, a list of dictionaries, a string, or nothing.
         - eg I(<tag/>) is represented as I(tag:)
         - A single zapi can be called at a time.  Ansible warns if duplicate keys are found and only uses the last entry.
-        required: true
+        - Use C(zapis) to call several ZAPIs.
+        - One of C(zapi) or C(zapis) is required.
         type: dict
+    zapis:
+        description:
+        - A list of dictionaries, each one with a single zapi and its arguments, using the same format as C(zapi).
+        - The ZAPIs are called in order, using a single connection, and a single EMS event is logged for the task.
+        - Mutually exclusive with C(zapi).
+        type: list
+        elements: dict
+        version_added: '21.7.0'
+    max_concurrency:
+        description:
+        - Maximum number of ZAPIs called in parallel when C(zapis) is set.
+        - Each worker uses its own connection to ONTAP.
+        - With the default value of 1, ZAPIs are called one at a time, in order.
+        - Only use a value greater than 1 when the ZAPIs are independent of each other.
+        type: int
+        default: 1
+        version_added: '21.7.0'
+    continue_on_error:
+        description:
+        - When C(zapis) is set and a ZAPI fails, whether to call the remaining ZAPIs.
+        - By default, the remaining ZAPIs are not called, and are reported with a C(skipped) status.
+        - With C(max_concurrency) greater than 1, all the ZAPIs are called.
+        type: bool
+        default: false
+        version_added: '21.7.0'
     vserver:
         description:
         - if provided, forces vserver tunneling.  username identifies a cluster admin account.
@@ -138,6 +165,20 @@ EXAMPLES = """
       ignore_errors: True
     - debug: var=output
 
+    - name: run several ontap ZAPI commands, over a single connection
+      na_ontap_zapit:
+        <<: *login
+        zapis:
+          - system-get-version:
+          - vserver-get-iter:
+              desired-attributes:
+                vserver-info:
+                  - uuid
+          - cluster-identity-get:
+        max_concurrency: 3
+      register: output
+    - debug: var=output
+
 """
 
 RETURN = """
@@ -166,24 +207,24 @@ reason:
     - Not present if successful, or if the ZAPI call cannot be performed.
   returned: On error
   type: str
+responses:
+  description:
+    - With C(zapis), a list with an entry for each ZAPI, in the same order.
+    - Each entry reports C(zapi), the ZAPI name, and C(status), either C(passed), C(failed), C(error), or C(skipped).
+    - C(response) is set as for a single ZAPI, C(errno) and C(reason) are set if the ZAPI was executed but failed.
+    - A status of C(error) indicates the ZAPI call could not be performed, C(reason) reports the error.
+    - The task is reported as an error ('failed') if any ZAPI did not pass.
+  returned: With zapis
+  type: list
+  version_added: '21.7.0'
 """
 
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
-
-try:
-    import xmltodict
-    HAS_XMLTODICT = True
-except ImportError:
-    HAS_XMLTODICT = False
-
-try:
-    import json
-    HAS_JSON = True
-except ImportError:
-    HAS_JSON = False
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently, ThreadConnections
+from ansible_collections.netapp.ontap.plugins.module_utils.zapi_converters import zapi_to_dict
 
 HAS_NETAPP_LIB = netapp_utils.has_netapp_lib()
 
@@ -194,29 +235,38 @@ class NetAppONTAPZapi(object):
     def __init__(self):
         self.argument_spec = netapp_utils.na_ontap_host_argument_spec()
         self.argument_spec.update(dict(
-            zapi=dict(required=True, type='dict'),
+            zapi=dict(required=False, type='dict'),
+            zapis=dict(required=False, type='list', elements='dict'),
+            max_concurrency=dict(required=False, type='int', default=1),
+            continue_on_error=dict(required=False, type='bool', default=False),
             vserver=dict(required=False, type='str'),
         ))
         self.module = AnsibleModule(
             argument_spec=self.argument_spec,
+            mutually_exclusive=[('zapi', 'zapis')],
+            required_one_of=[('zapi', 'zapis')],
             supports_check_mode=False
         )
         parameters = self.module.params
         # set up state variables
         self.zapi = parameters['zapi']
+        self.zapis = parameters['zapis']
+        self.max_concurrency = parameters['max_concurrency']
+        self.continue_on_error = parameters['continue_on_error']
         self.vserver = parameters['vserver']
 
-        if not HAS_JSON:
-            self.module.fail_json(msg="the python json module is required")
         if not HAS_NETAPP_LIB:
             self.module.fail_json(msg="the python NetApp-Lib module is required")
-        if not HAS_XMLTODICT:
-            self.module.fail_json(msg="the python xmltodict module is required")
 
         if self.vserver is not None:
             self.server = netapp_utils.setup_na_ontap_zapi(module=self.module, vserver=self.vserver)
         else:
             self.server = netapp_utils.setup_na_ontap_zapi(module=self.module)
+        self.connections = None
+
+    def get_server(self):
+        ''' return the connection for the current thread '''
+        return self.server if self.connections is None else self.connections.get()
 
     def asup_log_for_cserver(self, event_name):
         """
@@ -233,28 +283,18 @@ class NetAppONTAPZapi(object):
             pass
 
     def jsonify_and_parse_output(self, xml_data):
-        ''' convert from XML to JSON
+        ''' convert from XML to a dictionary
             extract status and error fields is present
         '''
-        try:
-            as_dict = xmltodict.parse(xml_data.to_string(), xml_attribs=True)
-        except Exception as exc:
-            self.module.fail_json(msg='Error running zapi in xmltodict: %s: %s' %
-                                  (xml_data.to_string(), str(exc)))
-        try:
-            as_json = json.loads(json.dumps(as_dict))
-        except Exception as exc:
-            self.module.fail_json(msg='Error running zapi in json load/dump: %s: %s' %
-                                  (as_dict, str(exc)))
-
-        if 'results' not in as_json:
+        as_dict = zapi_to_dict(xml_data, xml_attribs=True)
+        if 'results' not in as_dict:
             self.module.fail_json(msg='Error running zapi, no results field: %s: %s' %
-                                  (xml_data.to_string(), repr(as_json)))
+                                  (xml_data.to_string(), repr(as_dict)))
 
         # set status, and if applicable errno/reason, and remove attribute fields
         errno = None
         reason = None
-        response = as_json.pop('results')
+        response = as_dict.pop('results') or dict()
         status = response.get('@status', 'no_status_attr')
         if status != 'passed':
             # collect errno and reason
@@ -277,38 +317,74 @@ class NetAppONTAPZapi(object):
                 pass
         return response, status, errno, reason
 
+    @staticmethod
+    def get_zapi_name(zapi_struct):
+        ''' return the ZAPI name, and an error if zapi_struct is not a dictionary with a single key '''
+        if not isinstance(zapi_struct, dict):
+            return zapi_struct, 'A directory entry is expected, eg: system-get-version: '
+        zapi = list(zapi_struct.keys())
+        if len(zapi) != 1:
+            return zapi, 'A single ZAPI can be called at a time'
+        return zapi[0], None
+
+    def call_zapi(self, server, zapi, attributes):
+        ''' calls the ZAPI, NaApiError is raised as is '''
+        zapi_obj = netapp_utils.zapi.NaElement(zapi)
+        if attributes is not None and attributes != 'None':
+            zapi_obj.translate_struct(attributes)
+        output = server.invoke_elem(zapi_obj, True)
+        return self.jsonify_and_parse_output(output)
+
     def run_zapi(self):
         ''' calls the ZAPI '''
         zapi_struct = self.zapi
-        error = None
-        if not isinstance(zapi_struct, dict):
-            error = 'A directory entry is expected, eg: system-get-version: '
-            zapi = zapi_struct
-        else:
-            zapi = list(zapi_struct.keys())
-            if len(zapi) != 1:
-                error = 'A single ZAPI can be called at a time'
-            else:
-                zapi = zapi[0]
+        zapi, error = self.get_zapi_name(zapi_struct)
 
         # log first, then error out as needed
         self.ems(zapi)
         if error:
             self.module.fail_json(msg='%s, received: %s' % (error, zapi))
 
-        zapi_obj = netapp_utils.zapi.NaElement(zapi)
-        attributes = zapi_struct[zapi]
-        if attributes is not None and attributes != 'None':
-            zapi_obj.translate_struct(attributes)
-
         try:
-            output = self.server.invoke_elem(zapi_obj, True)
+            return self.call_zapi(self.server, zapi, zapi_struct[zapi])
         except netapp_utils.zapi.NaApiError as error:
             self.module.fail_json(msg='Error running zapi %s: %s' %
                                   (zapi, to_native(error)),
                                   exception=traceback.format_exc())
 
-        return self.jsonify_and_parse_output(output)
+    def run_zapi_in_batch(self, zapi, attributes):
+        ''' calls the ZAPI, and reports the status rather than failing '''
+        try:
+            response, status, errno, reason = self.call_zapi(self.get_server(), zapi, attributes)
+        except netapp_utils.zapi.NaApiError as error:
+            return dict(zapi=zapi, status='error', errno=to_native(error.code), reason=to_native(error.message))
+        result = dict(zapi=zapi, status=status, response=response)
+        if status != 'passed':
+            result.update(errno=errno, reason=reason)
+        return result
+
+    def run_zapis(self):
+        ''' calls the ZAPIs in zapis, using up to max_concurrency connections
+            return a list of results, in the same order as zapis
+        '''
+        zapis = list()
+        for index, zapi_struct in enumerate(self.zapis):
+            zapi, error = self.get_zapi_name(zapi_struct)
+            if error:
+                self.module.fail_json(msg='%s, received: %s in zapis entry %d' % (error, zapi, index))
+            zapis.append((zapi, zapi_struct[zapi]))
+
+        # a single EMS event for the batch
+        self.ems(','.join(sorted(set(zapi for zapi, dummy in zapis))))
+        concurrent = self.max_concurrency > 1 and len(zapis) > 1
+        results = list()
+        with ThreadConnections(self.server, netapp_utils.clone_zapi_server) as self.connections:
+            for result in iter_concurrently(self.run_zapi_in_batch, zapis, self.max_concurrency):
+                results.append(result)
+                if result['status'] != 'passed' and not self.continue_on_error and not concurrent:
+                    break
+        results.extend(dict(zapi=zapi, status='skipped') for zapi, dummy in zapis[len(results):])
+        return results
 
     def ems(self, zapi):
         """
@@ -323,8 +399,19 @@ class NetAppONTAPZapi(object):
         else:
             self.asup_log_for_cserver("na_ontap_zapi: " + str(zapi))
 
+    def apply_zapis(self):
+        ''' calls the zapis and returns the status and json output for each zapi '''
+        responses = self.run_zapis()
+        changed = any(response['status'] == 'passed' for response in responses)
+        if all(response['status'] == 'passed' for response in responses):
+            self.module.exit_json(changed=changed, responses=responses)
+        msg = 'ZAPI failure: check status, errno and reason in responses.'
+        self.module.fail_json(changed=changed, responses=responses, msg=msg)
+
     def apply(self):
         ''' calls the zapi and returns json output '''
+        if self.zapis is not None:
+            self.apply_zapis()
         response, status, errno, reason = self.run_zapi()
         if status == 'passed':
             self.module.exit_json(changed=True, response=response)
@@ -0,0 +1,120 @@
+# (c) 2021, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' benchmarks for info and batch modules, against the in-process ONTAP simulator
+
+    pip install -r tests/benchmark/requirements.txt
+    python -m pytest tests/benchmark --benchmark-json=benchmark.json
+
+    The dataset scale and the latency are set with environment variables:
+        ONTAP_BENCHMARK_VOLUMES     default 10000
+        ONTAP_BENCHMARK_SNAPSHOTS   default 50000
+        ONTAP_BENCHMARK_LUNS        default 1000
+        ONTAP_BENCHMARK_LATENCY     in seconds, added to each request, default 0
+        ONTAP_BENCHMARK_BATCH       number of volumes for na_ontap_volume, default 100
+        ONTAP_BENCHMARK_ROUNDS      default 3
+    Besides wall time, extra_info reports the number of requests per API for a run, and the peak memory allocated by the module.
+    The peak memory is traced with tracemalloc in a child process running the module once, so that it does not include
+    the simulator or other benchmarks, and tracing does not slow down the timed runs.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.framework.ontap_simulator import OntapSimulator, run_module
+from ansible_collections.netapp.ontap.plugins.modules import na_ontap_info, na_ontap_lun, na_ontap_rest_info, na_ontap_volume
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+pytest.importorskip('pytest_benchmark')
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+else:
+    pytestmark = pytest.mark.filterwarnings('ignore::urllib3.exceptions.InsecureRequestWarning')
+
+
+def get_setting(name, default, convert=int):
+    return convert(os.environ.get('ONTAP_BENCHMARK_%s' % name, default))
+
+
+VOLUMES = get_setting('VOLUMES', 10000)
+SNAPSHOTS = get_setting('SNAPSHOTS', 50000)
+LUNS = get_setting('LUNS', 1000)
+LATENCY = get_setting('LATENCY', 0, float)
+BATCH = min(get_setting('BATCH', 100), VOLUMES)
+ROUNDS = get_setting('ROUNDS', 3)
+
+
+@pytest.fixture(scope='module')
+def simulator():
+    with OntapSimulator(volumes=VOLUMES, snapshots=SNAPSHOTS, luns=LUNS, latency=LATENCY) as ontap:
+        yield ontap
+
+
+PEAK_MEMORY_SCRIPT = '''
+import importlib, json, sys, tracemalloc
+from ansible_collections.netapp.ontap.tests.unit.framework.ontap_simulator import run_module
+module = importlib.import_module(sys.argv[1])
+tracemalloc.start()
+result = run_module(module, json.loads(sys.argv[2]))
+peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+print(json.dumps(dict(failed=result.get('failed', False), peak=peak)))
+'''
+
+
+def get_peak_memory(module, args):
+    ''' run the module once in a child process, and return the peak memory allocated while it runs, in bytes '''
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    output = subprocess.check_output([sys.executable, '-c', PEAK_MEMORY_SCRIPT, module.__name__, json.dumps(args)], env=env)
+    result = json.loads(output.decode().splitlines()[-1])
+    assert not result['failed']
+    return result['peak']
+
+
+def run_benchmark(benchmark, simulator, module, args):
+    ''' run the module ROUNDS times, and report the requests for the last run '''
+    result = benchmark.pedantic(run_module, args=(module, args), setup=simulator.reset_stats, rounds=ROUNDS, iterations=1)
+    assert not result.get('failed'), result.get('msg')
+    benchmark.extra_info['requests'] = simulator.request_count
+    benchmark.extra_info['requests_by_api'] = dict(simulator.stats)
+    benchmark.extra_info['peak_memory'] = get_peak_memory(module, args)
+    return result
+
+
+@pytest.mark.parametrize('subset, count', [('volume_info', VOLUMES), ('snapshot_info', SNAPSHOTS), ('lun_info', LUNS)])
+def test_na_ontap_info(benchmark, simulator, subset, count):
+    args = dict(simulator.module_args(), gather_subset=[subset])
+    result = run_benchmark(benchmark, simulator, na_ontap_info, args)
+    assert len(result['ontap_info'][subset]) == count
+
+
+@pytest.mark.parametrize('subset, count', [('volume_info', VOLUMES), ('storage/luns', LUNS)])
+def test_na_ontap_rest_info(benchmark, simulator, subset, count):
+    args = dict(simulator.module_args(), gather_subset=[subset], profile='standard')
+    result = run_benchmark(benchmark, simulator, na_ontap_rest_info, args)
+    assert len(list(result['ontap_info'].values())[0]['records']) == count
+
+
+def test_na_ontap_volume_batch(benchmark, simulator):
+    ''' idempotent run, the volumes already exist '''
+    volumes = [dict(name=volume['name'], aggregate_name=volume['aggregate']['name'], size=volume['size'], size_unit='bytes')
+               for volume in simulator.volumes[:BATCH]]
+    args = dict(simulator.module_args(use_rest='never'), vserver='svm0', volumes=volumes)
+    result = run_benchmark(benchmark, simulator, na_ontap_volume, args)
+    assert not result['changed']
+
+
+def test_na_ontap_lun(benchmark, simulator):
+    ''' idempotent run, the LUN already exists in a volume with LUNS / VOLUMES LUNs '''
+    lun = simulator.luns[0]
+    args = dict(simulator.module_args(use_rest='never'), vserver='svm0', flexvol_name=lun['volume']['name'], name=lun['name'],
+                size=lun['size'], size_unit='bytes', os_type='linux')
+    result = run_benchmark(benchmark, simulator, na_ontap_lun, args)
+    assert not result['changed']
@@ -0,0 +1,36 @@
+# (c) 2021, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' benchmark for module_utils zapi_converters.py, against the xmltodict/json round trip previously used in na_ontap_info
+
+    pip install -r tests/benchmark/requirements.txt
+    python -m pytest tests/benchmark/test_benchmark_zapi_converters.py --benchmark-group-by=param:translate_keys
+
+    The number of records is set with ONTAP_BENCHMARK_RECORDS, default 2000.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import pytest
+
+from ansible_collections.netapp.ontap.plugins.module_utils.zapi_converters import zapi_to_dict
+from ansible_collections.netapp.ontap.tests.unit.plugins.module_utils.test_zapi_converters import get_records, xmltodict_to_dict
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+pytest.importorskip('pytest_benchmark')
+pytest.importorskip('xmltodict')
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+RECORDS = int(os.environ.get('ONTAP_BENCHMARK_RECORDS', 2000))
+
+
+@pytest.mark.parametrize('translate_keys', [False, True])
+@pytest.mark.parametrize('convert', [xmltodict_to_dict, zapi_to_dict], ids=['xmltodict', 'zapi_to_dict'])
+def test_convert_records(benchmark, convert, translate_keys):
+    records = get_records(RECORDS)
+    results = benchmark(lambda: [convert(record, translate_keys) for record in records])
+    assert len(results) == RECORDS
@@ -0,0 +1,506 @@
+# (c) 2021, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' in-process ONTAP stand-in for unit tests and benchmarks
+
+    OntapSimulator runs an HTTPS server on 127.0.0.1, in a background thread, serving:
+    - ZAPI requests on /servlets/netapp.servlets.admin.XMLrequest_filer,
+    - REST requests on /api/...
+    Unlike MockONTAPConnection, requests go through OntapZAPICx.invoke_elem and OntapRestAPI.send_request,
+    including the HTTP transport, authentication, and XML or JSON parsing.
+
+    The dataset is generated from a few counts (vservers, aggregates, volumes, snapshots, luns), and each object
+    is presented as a ZAPI record (eg volume-attributes) and as a REST record (eg storage/volumes).
+
+    Supported:
+    - ZAPI get-iter calls with query (exact match, '*' wildcard, '|' alternatives, '!' negation), max-records and tag,
+    - REST collections with fields, max_records, query parameters, and _links.next,
+    - a fixed latency added to each request,
+    - a maximum page size, to emulate ONTAP limits,
+    - request counts per API, in stats.
+    Other ZAPI calls succeed with empty results, other REST calls return an empty collection or a 404 error.
+    desired-attributes is ignored, all attributes are returned.
+
+    with OntapSimulator(volumes=100) as simulator:
+        result = run_module(na_ontap_info, dict(simulator.module_args(), gather_subset=['volume_info']))
+        print(simulator.stats)
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import collections
+import fnmatch
+import json
+import os
+import ssl
+import threading
+import time
+import uuid
+
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.six.moves import BaseHTTPServer, socketserver
+from ansible.module_utils.six.moves.urllib.parse import parse_qsl, urlencode, urlsplit
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+
+CERTIFICATE = os.path.join(os.path.dirname(__file__), 'ontap_simulator.pem')
+ZAPI_URL = '/servlets/netapp.servlets.admin.XMLrequest_filer'
+ZAPI_NAMESPACE = 'http://www.netapp.com/filer/admin'
+ZAPI_DEFAULT_MAX_RECORDS = 20
+REST_RESERVED_PARAMS = ('fields', 'max_records', 'return_records', 'return_timeout', 'order_by', 'start')
+UUID_NAMESPACE = uuid.UUID('2f6f2f5c-6c71-4c44-9a2e-5b0d0b1a5a5e')
+GIB = 1024 * 1024 * 1024
+
+
+def make_uuid(kind, index):
+    return str(uuid.uuid5(UUID_NAMESPACE, '%s-%d' % (kind, index)))
+
+
+def get_dotted(record, path):
+    ''' return the value for a dotted path, eg svm.name, or None '''
+    value = record
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def set_dotted(record, path, value):
+    keys = path.split('.')
+    for key in keys[:-1]:
+        record = record.setdefault(key, dict())
+    record[keys[-1]] = value
+
+
+def match_value(value, pattern):
+    ''' ONTAP query syntax: a|b for alternatives, * wildcard, ! negation '''
+    if isinstance(value, bool):
+        value = str(value).lower()
+    value = str(value)
+    for alternative in pattern.split('|'):
+        negate = alternative.startswith('!')
+        if negate:
+            alternative = alternative[1:]
+        matched = fnmatch.fnmatchcase(value, alternative) if '*' in alternative else value == alternative
+        if matched != negate:
+            return True
+    return False
+
+
+def match_zapi_query(record, query):
+    ''' query is a dict of dicts, every leaf needs to match '''
+    for key, pattern in query.items():
+        value = record.get(key)
+        if value is None:
+            return False
+        if isinstance(pattern, dict):
+            if not isinstance(value, dict) or not match_zapi_query(value, pattern):
+                return False
+        elif isinstance(value, (dict, list)) or not match_value(value, pattern):
+            return False
+    return True
+
+
+def xml_to_dict(element):
+    ''' convert a query element into a dict of dicts, namespaces are stripped '''
+    children = list(element)
+    if not children:
+        return element.text or ''
+    return dict((child.tag.split('}')[-1], xml_to_dict(child)) for child in children)
+
+
+def dict_to_xml_children(value):
+    ''' a dict provides child elements, a list of (tag, value) provides repeated child elements '''
+    children = list()
+    for key, child in value.items():
+        if isinstance(child, list):
+            children.append('<%s>%s</%s>' % (key, ''.join(dict_to_xml(item_tag, item) for item_tag, item in child), key))
+        else:
+            children.append(dict_to_xml(key, child))
+    return ''.join(children)
+
+
+def dict_to_xml(tag, value):
+    if isinstance(value, dict):
+        return '<%s>%s</%s>' % (tag, dict_to_xml_children(value), tag)
+    if isinstance(value, bool):
+        value = str(value).lower()
+    return '<%s>%s</%s>' % (tag, escape(str(value)), tag)
+
+
+def project(record, fields):
+    ''' keep the requested fields, and the key fields '''
+    if fields is None:
+        fields = ['uuid', 'name']
+    elif '*' in fields or '**' in fields:
+        return record
+    else:
+        fields = ['uuid', 'name'] + fields
+    result = dict()
+    for field in fields:
+        value = get_dotted(record, field)
+        if value is not None:
+            set_dotted(result, field, value)
+    return result
+
+
+class OntapSimulator(object):
+    ''' in-process ZAPI and REST server, see module docstring '''
+
+    def __init__(self, volumes=10, snapshots=0, luns=0, vservers=1, aggregates=2, latency=0,
+                 zapi_max_records=None, rest_max_records=None, version=(9, 8, 0)):
+        self.latency = latency
+        self.zapi_max_records = zapi_max_records
+        self.rest_max_records = rest_max_records
+        self.version = version
+        self.stats = collections.Counter()
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+        self.build_dataset(volumes, snapshots, luns, vservers, aggregates)
+
+    def build_dataset(self, volumes, snapshots, luns, vservers, aggregates):
+        self.vservers = [dict(name='svm%d' % index, uuid=make_uuid('svm', index)) for index in range(vservers)]
+        self.aggregates = [dict(name='aggr%d' % index, uuid=make_uuid('aggr', index)) for index in range(aggregates)]
+        self.volumes = list()
+        for index in range(volumes):
+            self.volumes.append(dict(name='vol%05d' % index, uuid=make_uuid('volume', index), size=GIB * (1 + index % 10),
+                                     used=GIB // 10 * (index % 10), vserver=self.vservers[index % vservers],
+                                     aggregate=self.aggregates[index % aggregates]))
+        self.snapshots = list()
+        for index in range(snapshots):
+            self.snapshots.append(dict(name='snap%05d' % index, uuid=make_uuid('snapshot', index),
+                                       create_time=1600000000 + index, volume=self.volumes[index % volumes]))
+        self.luns = list()
+        for index in range(luns):
+            volume = self.volumes[index % volumes]
+            self.luns.append(dict(name='lun%05d' % index, uuid=make_uuid('lun', index), size=GIB,
+                                  serial='sim%09d' % index, volume=volume, path='/vol/%s/lun%05d' % (volume['name'], index)))
+        self.zapi_collections = {
+            'vserver-get-iter': ('vserver-info', self.zapi_vservers),
+            'aggr-get-iter': ('aggr-attributes', self.zapi_aggregates),
+            'volume-get-iter': ('volume-attributes', self.zapi_volumes),
+            'snapshot-get-iter': ('snapshot-info', self.zapi_snapshots),
+            'lun-get-iter': ('lun-info', self.zapi_luns),
+        }
+        self.rest_collections = {
+            'cluster/nodes': self.rest_nodes,
+            'svm/svms': self.rest_vservers,
+            'storage/aggregates': self.rest_aggregates,
+            'storage/volumes': self.rest_volumes,
+            'storage/luns': self.rest_luns,
+        }
+        self.cache = dict()
+
+    def cached(self, key, builder):
+        ''' records are built on first use, then reused for all requests '''
+        if key not in self.cache:
+            self.cache[key] = builder()
+        return self.cache[key]
+
+    # ZAPI views
+
+    def zapi_vservers(self):
+        records = [{'vserver-name': 'cluster1', 'vserver-type': 'admin', 'uuid': make_uuid('cluster', 0), 'state': 'running'}]
+        records.extend({'vserver-name': vserver['name'], 'vserver-type': 'data', 'uuid': vserver['uuid'], 'state': 'running'}
+                       for vserver in self.vservers)
+        return records
+
+    def zapi_aggregates(self):
+        return [{'aggregate-name': aggregate['name'], 'aggregate-uuid': aggregate['uuid'],
+                 'aggr-ownership-attributes': {'home-name': 'node1', 'owner-name': 'node1'},
+                 'aggr-raid-attributes': {'state': 'online', 'raid-type': 'raid_dp'}} for aggregate in self.aggregates]
+
+    def zapi_volumes(self):
+        return [{
+            'encrypt': 'false',
+            'volume-id-attributes': {'name': volume['name'], 'owning-vserver-name': volume['vserver']['name'],
+                                     'vserver': volume['vserver']['name'],
+                                     'containing-aggregate-name': volume['aggregate']['name'],
+                                     'instance-uuid': volume['uuid'], 'junction-path': '/%s' % volume['name'],
+                                     'style-extended': 'flexvol', 'type': 'rw', 'node': 'node1'},
+            'volume-space-attributes': {'size': volume['size'], 'size-used': volume['used'],
+                                        'percentage-snapshot-reserve': 5, 'space-guarantee': 'none',
+                                        'fractional-reserve': 0, 'space-slo': 'none'},
+            'volume-state-attributes': {'state': 'online', 'is-cluster-volume': 'true', 'is-node-root': 'false'},
+            'volume-snapshot-attributes': {'snapshot-policy': 'default', 'snapdir-access-enabled': 'true'},
+            'volume-export-attributes': {'policy': 'default'},
+            'volume-security-attributes': {'style': 'unix',
+                                           'volume-security-unix-attributes': {'permissions': '755', 'user-id': 0, 'group-id': 0}},
+            'volume-performance-attributes': {'is-atime-update-enabled': 'true'},
+            'volume-language-attributes': {'language-code': 'c.utf_8'},
+            'volume-autosize-attributes': {'mode': 'off', 'grow-threshold-percent': 85, 'shrink-threshold-percent': 50},
+            'volume-qos-attributes': {'policy-group-name': 'none'},
+            'volume-comp-aggr-attributes': {'tiering-policy': 'none'},
+        } for volume in self.volumes]
+
+    def zapi_snapshots(self):
+        return [{'name': snapshot['name'], 'snapshot-instance-uuid': snapshot['uuid'], 'volume': snapshot['volume']['name'],
+                 'vserver': snapshot['volume']['vserver']['name'], 'access-time': snapshot['create_time'],
+                 'total': 4096, 'cumulative-total': 4096, 'busy': 'false', 'state': 'valid'} for snapshot in self.snapshots]
+
+    def zapi_luns(self):
+        return [{'path': lun['path'], 'volume': lun['volume']['name'], 'vserver': lun['volume']['vserver']['name'],
+                 'qtree': '', 'lun': lun['name'], 'size': lun['size'], 'size-used': 0, 'uuid': lun['uuid'],
+                 'serial-number': lun['serial'], 'multiprotocol-type': 'linux', 'online': 'true', 'mapped': 'false',
+                 'state': 'online', 'class': 'regular', 'is-space-reservation-enabled': 'true',
+                 'is-space-alloc-enabled': 'false', 'alignment': 'aligned'} for lun in self.luns]
+
+    # REST views
+
+    @staticmethod
+    def rest_reference(item):
+        return dict(name=item['name'], uuid=item['uuid'])
+
+    def rest_nodes(self):
+        return [dict(name='node1', uuid=make_uuid('node', 0))]
+
+    def rest_vservers(self):
+        return [dict(name=vserver['name'], uuid=vserver['uuid'], state='running') for vserver in self.vservers]
+
+    def rest_aggregates(self):
+        return [dict(name=aggregate['name'], uuid=aggregate['uuid'], node=dict(name='node1'), state='online')
+                for aggregate in self.aggregates]
+
+    def rest_volumes(self):
+        return [dict(name=volume['name'], uuid=volume['uuid'], svm=self.rest_reference(volume['vserver']),
+                     aggregates=[self.rest_reference(volume['aggregate'])], size=volume['size'],
+                     space=dict(size=volume['size'], used=volume['used']), state='online', type='rw', style='flexvol',
+                     nas=dict(path='/%s' % volume['name'], security_style='unix'), snapshot_policy=dict(name='default'))
+                for volume in self.volumes]
+
+    def rest_luns(self):
+        return [dict(name=lun['path'], uuid=lun['uuid'], svm=self.rest_reference(lun['volume']['vserver']),
+                     location=dict(volume=self.rest_reference(lun['volume']), logical_unit=lun['name']),
+                     space=dict(size=lun['size'], used=0), os_type='linux', serial_number=lun['serial'],
+                     status=dict(state='online', mapped=False)) for lun in self.luns]
+
+    def rest_snapshots(self, volume_uuid):
+        return [dict(name=snapshot['name'], uuid=snapshot['uuid'], create_time=snapshot['create_time'],
+                     volume=self.rest_reference(snapshot['volume']))
+                for snapshot in self.snapshots if snapshot['volume']['uuid'] == volume_uuid]
+
+    def rest_cluster(self):
+        generation, major, minor = self.version
+        return dict(name='cluster1', uuid=make_uuid('cluster', 0),
+                    version=dict(full='NetApp Release %d.%d.%d: simulated' % self.version,
+                                 generation=generation, major=major, minor=minor))
+
+    # request handling
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    @property
+    def request_count(self):
+        ''' number of ZAPI and REST requests, authentication challenges are not included '''
+        return sum(count for key, count in self.stats.items() if key != 'challenge')
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats.clear()
+
+    def handle_zapi(self, body):
+        ''' return a ZAPI response, as a string '''
+        root = ElementTree.fromstring(body)
+        api_element = list(root)[0]
+        api = api_element.tag.split('}')[-1]
+        self.count('zapi %s' % api)
+        request = xml_to_dict(api_element)
+        if not isinstance(request, dict):
+            request = dict()
+        if api == 'system-get-version':
+            results = {'version': 'NetApp Release %d.%d.%d: simulated' % self.version, 'is-clustered': 'true',
+                       'version-tuple': {'system-version-tuple': dict(zip(('generation', 'major', 'minor'), self.version))}}
+        elif api == 'system-get-ontapi-version':
+            results = {'major-version': 1, 'minor-version': 100 + 10 * self.version[1]}
+        elif api.endswith('-get-iter'):
+            results = self.zapi_get_iter(api, request)
+        else:
+            results = dict()
+        return ('<?xml version="1.0" encoding="UTF-8"?><netapp version="1.180" xmlns="%s"><results status="passed">%s</results></netapp>'
+                % (ZAPI_NAMESPACE, dict_to_xml_children(results)))
+
+    def zapi_get_iter(self, api, request):
+        tag, builder = self.zapi_collections.get(api, (None, list))
+        records = self.cached(api, builder)
+        query = request.get('query')
+        if isinstance(query, dict) and query:
+            query = list(query.values())[0]
+            if isinstance(query, dict):
+                records = [record for record in records if match_zapi_query(record, query)]
+        offset = int(request.get('tag') or 0)
+        max_records = int(request.get('max-records') or ZAPI_DEFAULT_MAX_RECORDS)
+        if self.zapi_max_records is not None:
+            max_records = min(max_records, self.zapi_max_records)
+        page = records[offset:offset + max_records]
+        results = {'num-records': len(page)}
+        if page:
+            results['attributes-list'] = [(tag, record) for record in page]
+        if offset + max_records < len(records):
+            results['next-tag'] = str(offset + max_records)
+        return results
+
+    def handle_rest(self, method, url):
+        ''' return a status code and a JSON response, as a dict '''
+        parts = urlsplit(url)
+        path = parts.path[len('/api/'):].strip('/')
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        self.count('rest %s %s' % (method, path))
+        if method != 'GET':
+            return 200, dict(num_records=0, records=[])
+        if path == 'cluster':
+            return 200, project(self.rest_cluster(), params['fields'].split(',') if 'fields' in params else ['*'])
+        collection, records = path, None
+        if path in self.rest_collections:
+            records = self.cached(path, self.rest_collections[path])
+        elif path.startswith('storage/volumes/') and path.endswith('/snapshots'):
+            volume_uuid = path.split('/')[2]
+            records = self.cached(path, lambda: self.rest_snapshots(volume_uuid))
+        else:
+            collection, dummy, key = path.rpartition('/')
+            if collection in self.rest_collections:
+                for record in self.cached(collection, self.rest_collections[collection]):
+                    if key in (record['uuid'], record['name']):
+                        return 200, project(record, params['fields'].split(',') if 'fields' in params else ['*'])
+                return 404, dict(error=dict(message='entry doesn\'t exist', code='4'))
+            records = list()
+        return 200, self.rest_get_collection(collection, records, params)
+
+    def rest_get_collection(self, path, records, params):
+        filters = [(key, value) for key, value in params.items() if key not in REST_RESERVED_PARAMS]
+        if filters:
+            records = [record for record in records
+                       if all(get_dotted(record, key) is not None and match_value(get_dotted(record, key), value) for key, value in filters)]
+        offset = int(params.get('start', 0))
+        max_records = len(records)
+        if params.get('max_records'):
+            max_records = int(params['max_records'])
+        if self.rest_max_records is not None:
+            max_records = min(max_records, self.rest_max_records)
+        fields = params['fields'].split(',') if params.get('fields') else None
+        page = records[offset:offset + max_records]
+        response = dict(num_records=len(page), _links=dict(self=dict(href='/api/%s' % path)))
+        if params.get('return_records', 'true') == 'true':
+            response['records'] = [project(record, fields) for record in page]
+        if offset + max_records < len(records):
+            next_params = dict(params, start=offset + max_records)
+            response['_links']['next'] = dict(href='/api/%s?%s' % (path, urlencode(sorted(next_params.items()))))
+        return response
+
+    # server
+
+    def start(self):
+        simulator = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+            def send(self, status, body, content_type):
+                body = to_bytes(body)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def handle_request(self, method):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                if simulator.latency:
+                    time.sleep(simulator.latency)
+                if self.headers.get('Authorization') is None:
+                    # as ONTAP does, a client that does not send credentials preemptively gets a challenge
+                    simulator.count('challenge')
+                    self.send_response(401)
+                    self.send_header('WWW-Authenticate', 'Basic realm="simulator"')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if self.path.startswith(ZAPI_URL):
+                    self.send(200, simulator.handle_zapi(body), 'text/xml')
+                elif self.path.startswith('/api/'):
+                    status, response = simulator.handle_rest(method, self.path)
+                    self.send(status, json.dumps(response), 'application/hal+json')
+                else:
+                    self.send(404, '', 'text/plain')
+
+            def do_GET(self):
+                self.handle_request('GET')
+
+            def do_POST(self):
+                self.handle_request('POST')
+
+            def do_PATCH(self):
+                self.handle_request('PATCH')
+
+            def do_DELETE(self):
+                self.handle_request('DELETE')
+
+        class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+            daemon_threads = True
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(CERTIFICATE)
+        self.server = Server(('127.0.0.1', 0), Handler)
+        self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def module_args(self, **kwargs):
+        ''' connection options for a module '''
+        args = dict(hostname='127.0.0.1', http_port=self.port, https=True, validate_certs=False,
+                    username='admin', password='password')
+        args.update(kwargs)
+        return args
+
+
+class ModuleExit(Exception):
+    pass
+
+
+def run_module(module, args):
+    ''' run module.main() with args, and return the result of exit_json or fail_json as a dict '''
+    def exit_json(self, **kwargs):  # pylint: disable=unused-argument
+        kwargs.setdefault('changed', False)
+        raise ModuleExit(kwargs)
+
+    def fail_json(self, **kwargs):  # pylint: disable=unused-argument
+        kwargs['failed'] = True
+        raise ModuleExit(kwargs)
+
+    basic._ANSIBLE_ARGS = to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': args}))   # pylint: disable=protected-access
+    with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json):
+        try:
+            module.main()
+        except ModuleExit as exc:
+            return exc.args[0]
+    raise AssertionError('module did not call exit_json or fail_json')
@@ -0,0 +1,116 @@
+# (c) 2021, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for the in-process ONTAP simulator, running modules end to end '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.framework.ontap_simulator import OntapSimulator, match_value, run_module
+from ansible_collections.netapp.ontap.plugins.modules import na_ontap_info, na_ontap_lun, na_ontap_rest_info, na_ontap_volume
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+else:
+    pytestmark = pytest.mark.filterwarnings('ignore::urllib3.exceptions.InsecureRequestWarning')
+
+
+@pytest.fixture(scope='module')
+def simulator():
+    with OntapSimulator(volumes=45, snapshots=90, luns=9, zapi_max_records=20, rest_max_records=20) as ontap:
+        yield ontap
+
+
+def zapi_requests(simulator, api):
+    return simulator.stats['zapi %s' % api]
+
+
+def test_match_value():
+    assert match_value('vol1', 'vol1')
+    assert match_value('vol1', 'vol*')
+    assert match_value('vol1', 'vol2|vol1')
+    assert match_value('vol1', '!vol2')
+    assert not match_value('vol1', '!vol*')
+    assert match_value(True, 'true')
+
+
+def test_zapi_get_iter_pages(simulator):
+    ''' na_ontap_info follows next-tag, max-records is capped to 20 '''
+    simulator.reset_stats()
+    result = run_module(na_ontap_info, dict(simulator.module_args(), gather_subset=['volume_info', 'snapshot_info']))
+    assert not result.get('failed'), result
+    assert len(result['ontap_info']['volume_info']) == 45
+    assert len(result['ontap_info']['snapshot_info']) == 90
+    assert result['ontap_info']['volume_info']['vol00001:svm0']['volume_space_attributes']['size'] == str(2 * 1024 ** 3)
+    assert zapi_requests(simulator, 'volume-get-iter') == 3
+    assert zapi_requests(simulator, 'snapshot-get-iter') == 5
+    assert simulator.request_count >= 3 + 5
+
+
+def test_zapi_query(simulator):
+    ''' na_ontap_volume reads several volumes with a name|name query, and na_ontap_lun with a path query '''
+    simulator.reset_stats()
+    volumes = [dict(name=volume['name'], aggregate_name=volume['aggregate']['name'], size=volume['size'], size_unit='bytes')
+               for volume in simulator.volumes[:3]]
+    result = run_module(na_ontap_volume, dict(simulator.module_args(use_rest='never'), vserver='svm0', volumes=volumes))
+    assert not result.get('failed'), result
+    assert not result['changed']
+    assert zapi_requests(simulator, 'volume-get-iter') == 1
+    assert not [key for key in simulator.stats if key.startswith('zapi volume-create')]
+    lun = simulator.luns[0]
+    result = run_module(na_ontap_lun, dict(simulator.module_args(use_rest='never'), vserver='svm0', flexvol_name=lun['volume']['name'],
+                                           name=lun['name'], size=lun['size'], size_unit='bytes', os_type='linux'))
+    assert not result.get('failed'), result
+    assert not result['changed']
+
+
+def test_zapi_create(simulator):
+    ''' other ZAPI calls succeed, and are counted '''
+    simulator.reset_stats()
+    volumes = [dict(name='new_volume', aggregate_name='aggr0', size=1, size_unit='gb')]
+    result = run_module(na_ontap_volume, dict(simulator.module_args(use_rest='never'), vserver='svm0', volumes=volumes))
+    assert result['changed']
+    assert zapi_requests(simulator, 'volume-create') == 1
+
+
+def test_rest_pages(simulator):
+    ''' na_ontap_rest_info follows _links.next, max_records is capped to 20 '''
+    simulator.reset_stats()
+    result = run_module(na_ontap_rest_info, dict(simulator.module_args(), gather_subset=['volume_info'], fields=['size', 'svm.name']))
+    assert not result.get('failed'), result
+    records = result['ontap_info']['storage/volumes']['records']
+    assert len(records) == 45
+    assert records[1] == dict(name='vol00001', uuid=simulator.volumes[1]['uuid'], size=2 * 1024 ** 3, svm=dict(name='svm0'))
+    assert simulator.stats['rest GET storage/volumes'] == 3
+    assert simulator.stats['rest GET cluster'] == 1
+
+
+def test_rest_queries(simulator):
+    ''' query parameters, single records, and errors '''
+    status, response = simulator.handle_rest('GET', '/api/storage/luns?location.volume.name=vol00001|vol00002&fields=serial_number')
+    assert status == 200
+    assert [record['name'] for record in response['records']] == ['/vol/vol00001/lun00001', '/vol/vol00002/lun00002']
+    status, response = simulator.handle_rest('GET', '/api/storage/volumes/%s' % simulator.volumes[0]['uuid'])
+    assert status == 200
+    assert response['name'] == 'vol00000'
+    status, response = simulator.handle_rest('GET', '/api/storage/volumes/%s/snapshots?return_records=false' % simulator.volumes[0]['uuid'])
+    assert response['num_records'] == 2
+    assert 'records' not in response
+    status, response = simulator.handle_rest('GET', '/api/storage/volumes/unknown')
+    assert status == 404
+    assert 'error' in response
+
+
+def test_api_stats(simulator):
+    ''' with the api_stats feature flag, the module result reports ZAPI calls '''
+    simulator.reset_stats()
+    args = dict(simulator.module_args(feature_flags=dict(api_stats=True)), gather_subset=['volume_info'])
+    result = run_module(na_ontap_info, args)
+    assert not result.get('failed'), result
+    api_stats = result['api_stats']
+    assert api_stats['calls'] == simulator.request_count
+    assert api_stats['by_api']['volume-get-iter']['calls'] == 3
+    assert api_stats['by_api']['volume-get-iter']['response_bytes'] > 45 * 500
@@ -0,0 +1,111 @@
+# Copyright (c) 2021 NetApp
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for module_utils concurrency_helpers.py '''
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+import time
+
+import pytest
+
+from ansible_collections.netapp.ontap.plugins.module_utils.concurrency_helpers import iter_concurrently, run_concurrently, ThreadConnections
+
+
+class Counter(object):
+    ''' track the number of calls running at the same time '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.calls = list()
+
+    def square(self, value, delay=0.01):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.calls.append(value)
+        time.sleep(delay)
+        with self.lock:
+            self.running -= 1
+        if value < 0:
+            raise ValueError('negative value: %d' % value)
+        return value * value
+
+
+def test_run_sequentially():
+    ''' default is one call at a time '''
+    counter = Counter()
+    results = run_concurrently(counter.square, [(x,) for x in range(5)])
+    assert results == [0, 1, 4, 9, 16]
+    assert counter.max_running == 1
+
+
+def test_run_concurrently_is_bounded():
+    ''' results are in order, and at most max_workers calls are running '''
+    counter = Counter()
+    results = run_concurrently(counter.square, [(x, 0.05) for x in range(8)], max_workers=3)
+    assert results == [x * x for x in range(8)]
+    assert 1 < counter.max_running <= 3
+
+
+def test_iter_sequentially_is_lazy():
+    ''' the caller can stop early '''
+    counter = Counter()
+    for result in iter_concurrently(counter.square, [(x,) for x in range(5)]):
+        if result == 4:
+            break
+    assert counter.calls == [0, 1, 2]
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_exception_is_reraised(max_workers):
+    ''' the first error in order is reported '''
+    counter = Counter()
+    with pytest.raises(ValueError) as exc:
+        run_concurrently(counter.square, [(1,), (-2,), (-3,), (4,)], max_workers=max_workers)
+    assert str(exc.value) == 'negative value: -2'
+
+
+class MockConnection(object):
+    ''' record the threads using the connection '''
+
+    def __init__(self):
+        self.threads = set()
+        self.closed = False
+
+    def invoke(self, value):
+        self.threads.add(threading.current_thread())
+        time.sleep(0.01)
+        return value
+
+    def close_connection(self):
+        self.closed = True
+
+
+def test_thread_connections():
+    ''' one clone per worker thread, not per call, the main thread uses the original connection '''
+    connection = MockConnection()
+    connections = ThreadConnections(connection, lambda connection: MockConnection())
+    assert connections.get() is connection
+    results = run_concurrently(lambda value: connections.get().invoke(value), [(x,) for x in range(20)], max_workers=3)
+    assert results == list(range(20))
+    assert 1 < len(connections.clones) <= 3
+    assert all(len(clone.threads) == 1 for clone in connections.clones)
+    assert not connection.threads
+    clones = list(connections.clones)
+    connections.close()
+    assert all(clone.closed for clone in clones)
+    assert not connection.closed
+    assert not connections.clones
+
+
+def test_thread_connections_context():
+    ''' clones are closed on exit '''
+    with ThreadConnections(MockConnection(), lambda connection: MockConnection()) as connections:
+        run_concurrently(lambda value: connections.get().invoke(value), [(x,) for x in range(4)], max_workers=2)
+        clones = list(connections.clones)
+    assert clones
+    assert all(clone.closed for clone in clones)
@@ -5,9 +5,16 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import errno
 import json
 import os.path
+import socket
+import struct
 import tempfile
+import threading
+import time
+
+from ansible.module_utils.six.moves import BaseHTTPServer
 
 import pytest
 
@@ -15,9 +22,10 @@ from ansible.module_utils.ansible_release import __version__ as ansible_version
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible_collections.netapp.ontap.plugins.module_utils.netapp import COLLECTION_VERSION
-from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import Mock, patch
 
 import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+import ansible_collections.netapp.ontap.plugins.module_utils.rest_response_helpers as rrh
 
 if not netapp_utils.has_netapp_lib():
     pytestmark = pytest.mark.skip("skipping as missing required netapp_lib")
@@ -466,3 +474,575 @@ def test_zapi_cx_no_auth_header():
     assert not isinstance(zapi_cx, netapp_utils.OntapZAPICx)
     request, dummy = zapi_cx._create_request(netapp_utils.zapi.NaElement('dummy_tag'))
     assert "Authorization" not in [x[0] for x in request.header_items()]
+
+
+@patch('requests.Session.request')
+def test_send_request_uses_session(mock_request):
+    ''' all requests to the same host share a single session '''
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.json.return_value = dict(version=dict(generation=9, major=8, minor=0, full='9.8.0'))
+    rest_api = create_restapi_object(mock_args())
+    rest_api.close_session()
+    assert rest_api.is_rest()
+    rest_api.get('cluster')
+    other_rest_api = create_restapi_object(mock_args())
+    other_rest_api.get('cluster')
+    assert mock_request.call_count == 3
+    assert rest_api.session is not None
+    assert rest_api.session is other_rest_api.session
+    adapter = rest_api.session.get_adapter(rest_api.url)
+    assert adapter._pool_maxsize == 10
+    rest_api.close_session()
+    assert rest_api.url not in netapp_utils.REST_SESSIONS
+
+
+@patch('requests.request')
+def test_send_request_no_keep_alive(mock_request):
+    ''' session is not used when disabled by feature flag '''
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.json.return_value = dict()
+    rest_api = create_restapi_object(mock_args(dict(rest_keep_alive=False)))
+    rest_api.get('cluster')
+    assert mock_request.call_count == 1
+    assert rest_api.session is None
+
+
+def test_session_pool_maxsize():
+    ''' pool size is configurable '''
+    rest_api = create_restapi_object(mock_args(dict(rest_pool_maxsize=4)))
+    rest_api.close_session()
+    session = rest_api.get_session()
+    assert session.get_adapter(rest_api.url)._pool_maxsize == 4
+    rest_api.close_session()
+
+
+ZAPI_RESPONSE = b"<?xml version='1.0' encoding='UTF-8' ?>\n<netapp version='1.180' xmlns='http://www.netapp.com/filer/admin'>" + \
+    b"<results status=\"passed\"><num-records>1</num-records></results></netapp>"
+
+
+class ZAPIRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    ''' minimal ZAPI server, supporting HTTP/1.1 persistent connections '''
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):      # pylint: disable=invalid-name
+        self.server.requests += 1
+        self.rfile.read(int(self.headers['Content-Length']))
+        if self.server.mode == 'reset_mid_response' and self.server.requests > 1:
+            # send part of the response, and reset the connection
+            self.wfile.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/xml\r\nContent-Length: %d\r\n\r\n' % len(ZAPI_RESPONSE))
+            self.wfile.write(ZAPI_RESPONSE[:20])
+            self.wfile.flush()
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            self.close_connection = True
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(ZAPI_RESPONSE)))
+        if self.server.mode == 'close_header':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(ZAPI_RESPONSE)
+        if self.server.mode == 'silent_close':
+            # close the socket without notifying the client
+            self.close_connection = True
+
+    def handle(self):
+        self.server.connections += 1
+        BaseHTTPServer.BaseHTTPRequestHandler.handle(self)
+
+    def log_message(self, *args):     # pylint: disable=arguments-differ
+        pass
+
+
+def start_zapi_server(mode=None):
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), ZAPIRequestHandler)
+    server.mode = mode
+    server.requests = 0
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def create_local_zapi_server(server, feature_flags=None):
+    args = mock_args(feature_flags)
+    args['hostname'] = '127.0.0.1'
+    args['http_port'] = server.server_address[1]
+    module = create_module(args)
+    module.fail_json = fail_json
+    return netapp_utils.setup_na_ontap_zapi(module)
+
+
+@pytest.mark.parametrize('mode', [None, 'close_header', 'silent_close'])
+def test_zapi_keep_alive(mode):
+    ''' a single connection is used, unless the server closes it '''
+    server = start_zapi_server(mode)
+    try:
+        zapi_cx = create_local_zapi_server(server)
+        for dummy in range(3):
+            result = zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+            assert result.get_child_content('num-records') == '1'
+        zapi_cx.close_connection()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert server.requests == 3
+    assert server.connections == (1 if mode is None else 3)
+
+
+def test_zapi_keep_alive_no_retry_after_response_started():
+    ''' the ZAPI may have run, it is not sent again '''
+    server = start_zapi_server('reset_mid_response')
+    try:
+        zapi_cx = create_local_zapi_server(server)
+        zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+        with pytest.raises(netapp_utils.zapi.NaApiError) as exc:
+            zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('volume-create'), True)
+        assert exc.value.code == 'URL error'
+        zapi_cx.close_connection()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert server.requests == 2
+    assert server.connections == 1
+
+
+@pytest.mark.parametrize('exc, stage, retry', [
+    (socket.error(errno.EPIPE, 'Broken pipe'), 'request', True),
+    (socket.error(errno.ECONNRESET, 'Connection reset'), 'request', True),
+    (socket.timeout('timed out'), 'request', False),
+    (netapp_utils.http_client.BadStatusLine(''), 'getresponse', True),
+    (netapp_utils.http_client.BadStatusLine('garbage'), 'getresponse', False),
+    (socket.error(errno.ECONNRESET, 'Connection reset'), 'getresponse', False),
+    (socket.error(errno.ECONNRESET, 'Connection reset'), 'read', False),
+    (netapp_utils.http_client.IncompleteRead(b'partial'), 'read', False),
+])
+def test_is_stale_connection_error(exc, stage, retry):
+    assert netapp_utils.is_stale_connection_error(exc, stage) == retry
+
+
+def test_zapi_no_keep_alive():
+    ''' a new connection for each request when disabled '''
+    server = start_zapi_server()
+    try:
+        zapi_cx = create_local_zapi_server(server, dict(zapi_keep_alive=False))
+        assert not zapi_cx.use_keep_alive()
+        for dummy in range(2):
+            zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert server.requests == 2
+    assert server.connections == 2
+
+
+def test_zapi_keep_alive_connection_refused():
+    ''' connection errors are reported as with urllib '''
+    server = start_zapi_server()
+    zapi_cx = create_local_zapi_server(server)
+    server.shutdown()
+    server.server_close()
+    with pytest.raises(netapp_utils.zapi.NaApiError) as exc:
+        zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+    assert exc.value.code == 'Unable to connect'
+    assert netapp_utils.is_zapi_connection_error(exc.value.message)
+
+
+def create_cached_restapi_object(cache_dir):
+    return create_restapi_object(mock_args(dict(probe_cache_ttl=60, probe_cache_dir=cache_dir)))
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_probe_cache_version(mock_request):
+    ''' cluster version is only read once when caching is enabled '''
+    mock_request.side_effect = [
+        (200, dict(version=dict(generation=9, major=8, minor=0, full='9.8.0')), None),
+        SRR['is_zapi'],
+    ]
+    tempdir = tempfile.mkdtemp()
+    for dummy in range(2):
+        rest_api = create_cached_restapi_object(tempdir)
+        assert rest_api.is_rest()
+        assert rest_api.get_ontap_version() == (9, 8)
+    assert mock_request.call_count == 1
+    # a different user does not share the cache
+    args = mock_args(dict(probe_cache_ttl=60, probe_cache_dir=tempdir))
+    args['username'] = 'other_user'
+    rest_api = create_restapi_object(args)
+    assert not rest_api.is_rest()
+    assert mock_request.call_count == 2
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_probe_cache_version_expired(mock_request):
+    ''' cache entry is ignored once expired, errors are not cached '''
+    mock_request.side_effect = [
+        SRR['is_zapi'],
+        (200, dict(version=dict(generation=9, major=8, minor=0, full='9.8.0')), None),
+        (200, dict(version=dict(generation=9, major=9, minor=1, full='9.9.1')), None),
+    ]
+    tempdir = tempfile.mkdtemp()
+    rest_api = create_cached_restapi_object(tempdir)
+    assert not rest_api.is_rest()
+    rest_api = create_cached_restapi_object(tempdir)
+    assert rest_api.is_rest()
+    with patch('time.time', return_value=time.time() + 61):
+        rest_api = create_cached_restapi_object(tempdir)
+        assert rest_api.is_rest()
+        assert rest_api.get_ontap_version() == (9, 9)
+    assert mock_request.call_count == 3
+
+
+def test_probe_cache_cserver():
+    ''' cluster vserver name is only read once when caching is enabled '''
+    tempdir = tempfile.mkdtemp()
+    module = create_module(mock_args(dict(probe_cache_ttl=60, probe_cache_dir=tempdir)))
+    server = MockONTAPConnection('vserver', 'svm1')
+    server.module = module
+    assert netapp_utils.get_cserver(server) == 'svm1'
+    server = MockONTAPConnection('vserver', 'svm2')
+    server.module = module
+    assert netapp_utils.get_cserver(server) == 'svm1'
+    assert server.xml_in is None
+
+
+def test_probe_cache_path():
+    ''' the file name does not depend on the password, a directory accessible to other users is not used '''
+    tempdir = tempfile.mkdtemp()
+    module = create_module(mock_args(dict(probe_cache_ttl=60, probe_cache_dir=tempdir)))
+    cache_dir, cache_path = netapp_utils.get_probe_cache_path(module)
+    assert cache_dir == tempdir
+    module.params['password'] = 'other_password'
+    assert netapp_utils.get_probe_cache_path(module) == (cache_dir, cache_path)
+    netapp_utils.write_probe_cache(module, 'cserver', 'svm1')
+    assert netapp_utils.read_probe_cache(module, 'cserver') == 'svm1'
+    os.chmod(tempdir, 0o750)
+    assert netapp_utils.get_probe_cache_path(module) == (None, None)
+    assert netapp_utils.read_probe_cache(module, 'cserver') is None
+    os.chmod(tempdir, 0o700)
+    with patch('os.getuid', return_value=os.getuid() + 1):
+        assert netapp_utils.read_probe_cache(module, 'cserver') is None
+    link = os.path.join(tempfile.mkdtemp(), 'link')
+    os.symlink(tempdir, link)
+    module.params['feature_flags']['probe_cache_dir'] = link
+    assert netapp_utils.read_probe_cache(module, 'cserver') is None
+
+
+def test_probe_cache_default_dir():
+    ''' the default directory is created with mode 0700 '''
+    tempdir = tempfile.mkdtemp()
+    module = create_module(mock_args(dict(probe_cache_ttl=60)))
+    with patch('tempfile.gettempdir', return_value=tempdir):
+        assert netapp_utils.read_probe_cache(module, 'cserver') is None
+        assert not os.listdir(tempdir)
+        netapp_utils.write_probe_cache(module, 'cserver', 'svm1')
+        assert netapp_utils.read_probe_cache(module, 'cserver') == 'svm1'
+    cache_dir = os.path.join(tempdir, 'ansible_netapp_ontap_cache')
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+
+def test_probe_cache_disabled():
+    ''' nothing is written by default '''
+    tempdir = tempfile.mkdtemp()
+    module = create_module(mock_args(dict(probe_cache_dir=tempdir)))
+    netapp_utils.write_probe_cache(module, 'cserver', 'svm1')
+    assert netapp_utils.read_probe_cache(module, 'cserver') is None
+    assert not os.listdir(tempdir)
+
+
+def create_ems_module(ems_log_mode, cache_dir=None):
+    feature_flags = dict(ems_log_mode=ems_log_mode)
+    if cache_dir is not None:
+        feature_flags['probe_cache_dir'] = cache_dir
+    module = create_module(mock_args(feature_flags))
+    module.fail_json = fail_json
+    return module
+
+
+def wait_for_ems_threads():
+    for thread in threading.enumerate():
+        if thread.name.startswith('ems_log_'):
+            thread.join()
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp._ems_log_event')
+def test_ems_log_event_cserver_always(mock_ems):
+    ''' default mode logs an event on every call '''
+    module = create_ems_module('always')
+    for dummy in range(2):
+        netapp_utils.ems_log_event_cserver('na_ontap_test', MockONTAPConnection('vserver', 'svm1'), module)
+    assert mock_ems.call_count == 2
+    assert mock_ems.call_args[0][1].get_vserver() == 'svm1'
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp._ems_log_event')
+def test_ems_log_event_cserver_once(mock_ems):
+    ''' the cluster vserver lookup and the EMS call are skipped when the event was already logged '''
+    module = create_ems_module('once', tempfile.mkdtemp())
+    netapp_utils.ems_log_event_cserver('na_ontap_test', MockONTAPConnection('vserver', 'svm1'), module)
+    server = MockONTAPConnection('vserver', 'svm1')
+    netapp_utils.ems_log_event_cserver('na_ontap_test', server, module)
+    assert server.xml_in is None
+    assert mock_ems.call_count == 1
+    # a different event is logged
+    netapp_utils.ems_log_event_cserver('na_ontap_test', server, module, event='other')
+    assert mock_ems.call_count == 2
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp._ems_log_event')
+def test_ems_log_event_once_expired(mock_ems):
+    ''' the event is logged again after ems_log_once_ttl '''
+    module = create_ems_module('once', tempfile.mkdtemp())
+    server = MockONTAPConnection()
+    server.module = module
+    netapp_utils.ems_log_event('na_ontap_test', server)
+    netapp_utils.ems_log_event('na_ontap_test', server)
+    assert mock_ems.call_count == 1
+    with patch('time.time', return_value=time.time() + 3601):
+        netapp_utils.ems_log_event('na_ontap_test', server)
+    assert mock_ems.call_count == 2
+
+
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp._ems_log_event')
+def test_ems_log_event_cserver_background(mock_ems):
+    ''' the lookup and the EMS call run in a thread, errors are ignored '''
+    module = create_ems_module('background')
+    callers = list()
+    mock_ems.side_effect = lambda *args, **kwargs: callers.append(threading.current_thread().name)
+    netapp_utils.ems_log_event_cserver('na_ontap_test', MockONTAPConnection('vserver', 'svm1'), module)
+    wait_for_ems_threads()
+    assert callers == ['ems_log_na_ontap_test']
+    mock_ems.side_effect = netapp_utils.zapi.NaApiError('12345', 'unexpected error')
+    netapp_utils.ems_log_event_cserver('na_ontap_test', MockONTAPConnection('vserver', 'svm1'), module)
+    wait_for_ems_threads()
+    assert mock_ems.call_count == 2
+
+
+def test_ems_log_event_background_clones_server():
+    ''' the persistent ZAPI connection is not shared with the background thread '''
+    zapi_cx = create_ontapzapicx_object(mock_args(), dict(ems_log_mode='background'))
+    zapi_cx._connection = 'in use'
+    clone = netapp_utils.clone_zapi_server(zapi_cx)
+    assert clone._connection is None
+    assert zapi_cx._connection == 'in use'
+    assert clone.module is zapi_cx.module
+
+
+def test_ems_log_mode_invalid():
+    module = create_ems_module('sometimes')
+    with pytest.raises(AnsibleFailJson) as exc:
+        netapp_utils.ems_log_event_cserver('na_ontap_test', MockONTAPConnection(), module)
+    assert 'unexpected value for ems_log_mode feature flag: sometimes' in exc.value.args[0]['msg']
+
+
+JOB = dict(uuid='job_uuid', _links=dict(self=dict(href='/api/cluster/jobs/job_uuid')))
+
+
+def job_state(state, message='job message'):
+    return (200, dict(state=state, message=message), None)
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_backoff(mock_request, mock_sleep):
+    ''' polling starts at initial_increment and doubles up to increment '''
+    mock_request.side_effect = [job_state('queued')] + [job_state('running')] * 5 + [job_state('success', 'done')]
+    rest_api = create_restapi_object(mock_args())
+    message, error, job_stats = rest_api.wait_on_job_with_stats(JOB, increment=5)
+    assert error is None
+    assert message == 'done'
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.25, 0.5, 1, 2, 4, 5, 5]
+    assert job_stats['uuid'] == 'job_uuid'
+    assert job_stats['poll_count'] == 7
+    assert job_stats['elapsed_time'] >= 0
+    assert mock_request.call_args[0][1] == 'cluster/jobs/job_uuid'
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_timeout(mock_request, mock_sleep):
+    ''' the last interval is shortened so that timeout is respected '''
+    mock_request.side_effect = [job_state('running')] * 3
+    rest_api = create_restapi_object(mock_args())
+    message, error, job_stats = rest_api.wait_on_job_with_stats(JOB, timeout=1, increment=60)
+    assert error is None
+    assert message == 'job message'
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.25, 0.5, 0.25]
+    assert job_stats['poll_count'] == 3
+    assert 'Timeout error: Process still running' in rest_api.errors
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_failure(mock_request, mock_sleep):
+    mock_request.side_effect = [job_state('running'), job_state('failure', 'job failed')]
+    rest_api = create_restapi_object(mock_args())
+    message, error, job_stats = rest_api.wait_on_job_with_stats(JOB)
+    assert message is None
+    assert error == 'job failed'
+    assert mock_sleep.call_count == 2
+    assert job_stats['poll_count'] == 2
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_job_max_retries(mock_request, mock_sleep):
+    mock_request.side_effect = [SRR['is_zapi']] * 4
+    rest_api = create_restapi_object(mock_args())
+    message, error, job_stats = rest_api.wait_on_job_with_stats(JOB)
+    assert message is None
+    assert error == 'Unreachable'
+    assert job_stats['poll_count'] == 4
+    assert 'Job error: Reach max retries.' in rest_api.errors
+
+
+def jobs_state(*states):
+    return (200, dict(records=[dict(uuid='job%d' % index, state=state, message='message %d' % index) for index, state in states]), None)
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_jobs(mock_request, mock_sleep):
+    ''' jobs are polled together, and only until they complete '''
+    mock_request.side_effect = [
+        jobs_state((0, 'running'), (1, 'success'), (2, 'running')),
+        jobs_state((0, 'running'), (2, 'failure')),
+        jobs_state((0, 'success')),
+    ]
+    rest_api = create_restapi_object(mock_args())
+    jobs = [dict(uuid='job%d' % index) for index in range(3)] + [dict(uuid='job1'), dict()]
+    results, job_stats = rest_api.wait_on_jobs(jobs)
+    assert [(job['state'] if job else None, error) for job, error in results] == [
+        ('success', None), ('success', None), ('failure', 'message 2'), ('success', None), (None, 'Job uuid not found in: {}')]
+    assert [call[0][2]['uuid'] for call in mock_request.call_args_list] == ['job0|job1|job2', 'job0|job2', 'job0']
+    assert mock_request.call_args[0][1] == 'cluster/jobs'
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.25, 0.5, 1]
+    assert job_stats['job_count'] == 5
+    assert job_stats['poll_count'] == 3
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_jobs_chunks(mock_request, mock_sleep):
+    ''' a request is sent for each chunk, a job missing in the response is reported '''
+    mock_request.side_effect = [jobs_state((0, 'success'), (1, 'success')), jobs_state((2, 'success'))]
+    rest_api = create_restapi_object(mock_args())
+    results, dummy = rest_api.wait_on_jobs([dict(uuid='job%d' % index) for index in range(4)], chunk_size=2)
+    assert [error for job, error in results] == [None, None, None, 'Job job3 not found']
+    assert [call[0][2]['max_records'] for call in mock_request.call_args_list] == [2, 2]
+    assert mock_sleep.call_count == 1
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_wait_on_jobs_timeout_and_errors(mock_request, mock_sleep):
+    mock_request.side_effect = [jobs_state((0, 'running'))] * 3
+    rest_api = create_restapi_object(mock_args())
+    results, dummy = rest_api.wait_on_jobs([dict(uuid='job0')], timeout=1)
+    assert results == [(dict(uuid='job0', state='running', message='message 0'), 'Timeout error: job still running after 1 seconds')]
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.25, 0.5, 0.25]
+    assert 'Timeout error: Process still running' in rest_api.errors
+    mock_request.side_effect = [SRR['is_zapi']] * 4
+    results, job_stats = rest_api.wait_on_jobs([dict(uuid='job0')])
+    assert results == [(None, 'Unreachable')]
+    assert job_stats['poll_count'] == 4
+    assert 'Job error: Reach max retries.' in rest_api.errors
+
+
+@patch('time.sleep')
+@patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+def test_job_stats_in_module_result(mock_request, mock_sleep):
+    ''' the stats for each job are added to the module result '''
+    mock_request.side_effect = [job_state('running'), job_state('success'), job_state('failure', 'job failed')]
+    module = create_module(mock_args())
+    module.exit_json = Mock()
+    module.fail_json = Mock()
+    exit_json, fail_json = module.exit_json, module.fail_json
+    rest_api = netapp_utils.OntapRestAPI(module)
+    response = dict(job=JOB)
+    assert rrh.check_for_error_and_job_results('api', response, None, rest_api) == (response, None)
+    assert response['job_stats']['poll_count'] == 2
+    response = dict(job=JOB)
+    dummy, error = rrh.check_for_error_and_job_results('api', response, None, rest_api)
+    assert 'job failed' in error
+    assert response['job_stats']['poll_count'] == 1
+    module.exit_json(changed=True)
+    assert [stats['poll_count'] for stats in exit_json.call_args[1]['job_stats']] == [2, 1]
+    module.fail_json(msg='error')
+    assert len(fail_json.call_args[1]['job_stats']) == 2
+
+
+def test_api_stats_disabled():
+    ''' nothing is recorded by default '''
+    server = start_zapi_server()
+    try:
+        zapi_cx = create_local_zapi_server(server)
+        zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+        zapi_cx.close_connection()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert zapi_cx.api_stats is None
+    assert create_restapi_object(mock_args()).api_stats is None
+
+
+def test_zapi_api_stats():
+    ''' calls, bytes, and retries on a stale connection are recorded '''
+    server = start_zapi_server('silent_close')
+    try:
+        zapi_cx = create_local_zapi_server(server, dict(api_stats=True))
+        for dummy in range(3):
+            zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+        zapi_cx.close_connection()
+    finally:
+        server.shutdown()
+        server.server_close()
+    summary = zapi_cx.api_stats.summary()
+    assert summary['calls'] == 3
+    assert summary['errors'] == 0
+    assert summary['retries'] == 2
+    assert summary['response_bytes'] == 3 * len(ZAPI_RESPONSE)
+    assert summary['by_api']['system-get-version']['calls'] == 3
+    assert summary['by_api']['system-get-version']['request_bytes'] == summary['request_bytes'] > 0
+    assert len(summary['slowest']) == 3
+    assert summary['slowest'][0]['status'] == 'passed'
+    assert summary['slowest'][0]['method'] == 'POST'
+
+
+def test_zapi_api_stats_error():
+    ''' connection errors are recorded with the error code '''
+    server = start_zapi_server()
+    zapi_cx = create_local_zapi_server(server, dict(api_stats=True))
+    server.shutdown()
+    server.server_close()
+    with pytest.raises(netapp_utils.zapi.NaApiError):
+        zapi_cx.invoke_successfully(netapp_utils.zapi.NaElement('system-get-version'), True)
+    summary = zapi_cx.api_stats.summary()
+    assert summary['errors'] == 1
+    assert summary['slowest'][0]['status'] == 'Unable to connect'
+
+
+@patch('requests.Session.request')
+def test_rest_api_stats(mock_request):
+    ''' REST calls are recorded per method and API, and api_stats is added to the module result '''
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.content = b'{"num_records": 0}'
+    mock_request.return_value.request.body = b'{"name": "vol1"}'
+    mock_request.return_value.json.return_value = dict(num_records=0)
+    rest_api = create_restapi_object(mock_args(dict(api_stats=True, api_stats_slowest=1)))
+    rest_api.get('storage/volumes')
+    rest_api.post('storage/volumes', dict(name='vol1'))
+    mock_request.return_value.status_code = 404
+    rest_api.get('storage/volumes/unknown')
+    with pytest.raises(AnsibleFailJson) as exc:
+        rest_api.module.fail_json(msg='Error')
+    summary = exc.value.args[0]['api_stats']
+    assert summary['calls'] == 3
+    assert summary['errors'] == 1
+    assert summary['by_api']['GET storage/volumes']['response_bytes'] == 18
+    assert summary['by_api']['POST storage/volumes']['request_bytes'] == 16
+    assert len(summary['slowest']) == 1
+    assert summary['api_time'] + summary['local_time'] >= summary['total_time'] - 0.002
+    # a second REST object for the same module shares the same stats
+    assert netapp_utils.OntapRestAPI(rest_api.module).api_stats is rest_api.api_stats
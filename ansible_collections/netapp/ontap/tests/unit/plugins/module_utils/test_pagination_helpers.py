@@ -0,0 +1,132 @@
+# Copyright (c) 2021 NetApp
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for module_utils pagination_helpers.py '''
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import Mock
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.pagination_helpers import iter_rest_next_pages, iter_rest_records, iter_zapi_pages, iter_zapi_records
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+class MockZAPIServer(object):
+    ''' return pages of volume-attributes, with a next-tag for all pages but the last one '''
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = list()
+
+    def invoke_successfully(self, xml, enable_tunneling):     # pylint: disable=unused-argument
+        # the query element is moved from request to request, so record what was sent
+        self.requests.append(dict(api=xml.get_name(), query=xml.get_child_by_name('query') is not None,
+                                  max_records=xml.get_child_content('max-records'), tag=xml.get_child_content('tag')))
+        index = int(xml.get_child_content('tag') or 0)
+        result = netapp_utils.zapi.NaElement('results')
+        if self.pages[index]:
+            attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+            for name in self.pages[index]:
+                attributes_list.add_node_with_children('volume-attributes', **{'name': name})
+            result.add_child_elem(attributes_list)
+        result.add_new_child('num-records', str(len(self.pages[index])))
+        if index + 1 < len(self.pages):
+            result.add_new_child('next-tag', str(index + 1))
+        return result
+
+
+def test_iter_zapi_records_all_pages():
+    ''' records from all pages, query and page size are sent for every page '''
+    server = MockZAPIServer([['vol1', 'vol2'], [], ['vol3']])
+    query = netapp_utils.zapi.NaElement('query')
+    records = iter_zapi_records(server, 'volume-get-iter', query, max_records=2)
+    assert [record.get_child_content('name') for record in records] == ['vol1', 'vol2', 'vol3']
+    assert len(server.requests) == 3
+    assert server.requests == [dict(api='volume-get-iter', query=True, max_records='2', tag=tag) for tag in (None, '1', '2')]
+
+
+def test_iter_zapi_records_early_exit():
+    ''' pages are only requested when needed '''
+    server = MockZAPIServer([['vol1', 'vol2'], ['vol3', 'vol4'], ['vol5']])
+    for record in iter_zapi_records(server, 'volume-get-iter', max_records=2):
+        if record.get_child_content('name') == 'vol3':
+            break
+    assert len(server.requests) == 2
+    server = MockZAPIServer([['vol1'], ['vol2'], ['vol3']])
+    assert len(list(iter_zapi_records(server, 'volume-get-iter', limit=2))) == 2
+    assert len(server.requests) == 2
+    assert server.requests[0]['max_records'] == '2'
+
+
+
+def test_iter_zapi_pages():
+    ''' the request is built for each page, with the tag from the previous page '''
+    server = MockZAPIServer([['vol1', 'vol2'], ['vol3']])
+    tags = list()
+
+    def build_request(next_tag):
+        tags.append(next_tag)
+        request = netapp_utils.zapi.NaElement('volume-get-iter')
+        if next_tag is not None:
+            request.add_new_child('tag', next_tag)
+        return request
+
+    pages = list(iter_zapi_pages(server, build_request))
+    assert [page.get_child_content('num-records') for page in pages] == ['2', '1']
+    assert tags == [None, '1']
+
+
+def rest_page(names, next_href=None):
+    links = dict(self=dict(href='dummy'))
+    if next_href:
+        links['next'] = dict(href=next_href)
+    return dict(records=[dict(name=name) for name in names], num_records=len(names), _links=links), None
+
+
+def test_iter_rest_records_all_pages():
+    ''' the next link is followed as is '''
+    rest_api = Mock()
+    rest_api.get.side_effect = [
+        rest_page(['vol1', 'vol2'], '/api/storage/volumes?start.uuid=2&max_records=2'),
+        rest_page(['vol3']),
+    ]
+    records = list(iter_rest_records(rest_api, 'storage/volumes', dict(fields='name'), max_records=2))
+    assert records == [(dict(name=name), None) for name in ('vol1', 'vol2', 'vol3')]
+    assert rest_api.get.call_args_list[0][0] == ('storage/volumes', dict(fields='name', max_records=2))
+    assert rest_api.get.call_args_list[1][0] == ('storage/volumes?start.uuid=2&max_records=2', None)
+
+
+def test_iter_rest_records_limit_and_error():
+    ''' limit sets the page size, an error is reported once '''
+    rest_api = Mock()
+    rest_api.get.side_effect = [rest_page(['vol1', 'vol2'], '/api/storage/volumes?start.uuid=2')]
+    assert list(iter_rest_records(rest_api, 'storage/volumes', max_records=100, limit=2)) == [(dict(name='vol1'), None), (dict(name='vol2'), None)]
+    assert rest_api.get.call_args_list[0][0] == ('storage/volumes', dict(max_records=2))
+    rest_api = Mock()
+    rest_api.get.side_effect = [rest_page(['vol1'], '/api/storage/volumes?start.uuid=1'), (None, 'Expected error')]
+    assert list(iter_rest_records(rest_api, 'storage/volumes')) == [(dict(name='vol1'), None), (None, 'Expected error')]
+    rest_api = Mock()
+    rest_api.get.side_effect = [(None, 'Expected error')]
+    assert list(iter_rest_records(rest_api, 'storage/volumes')) == [(None, 'Expected error')]
+
+
+def test_iter_rest_next_pages_max_records_limit():
+    ''' the page size doubles for each following page, up to max_records_limit '''
+    rest_api = Mock()
+    rest_api.get.side_effect = [
+        rest_page(['vol2'], '/api/storage/volumes?start.uuid=2&max_records=2'),
+        rest_page(['vol3'], '/api/storage/volumes?start.uuid=3&max_records=3'),
+        rest_page(['vol4']),
+    ]
+    first_page, dummy = rest_page(['vol1'], '/api/storage/volumes?start.uuid=1&max_records=1')
+    pages = list(iter_rest_next_pages(rest_api, first_page, max_records=1, max_records_limit=3))
+    assert [page['records'] for page, error in pages] == [[dict(name='vol%d' % index)] for index in range(2, 5)]
+    assert [call[0][0] for call in rest_api.get.call_args_list] == [
+        'storage/volumes?start.uuid=1&max_records=2',
+        'storage/volumes?start.uuid=2&max_records=3',
+        'storage/volumes?start.uuid=3&max_records=3',
+    ]
@@ -208,6 +208,7 @@ def test_delete_volume_async(mock_request):
     job = dict(SRR['job'][1])           # deepcopy as job is modified in place!
     job['job_response'] = SRR['job_status_success'][1]['message']
     assert error is None
+    assert response.pop('job_stats')['poll_count'] == 1
     assert response == job
 
 
@@ -244,6 +245,7 @@ def test_patch_volume_async(mock_request):
     job = dict(SRR['job'][1])           # deepcopy as job is modified in place!
     job['job_response'] = SRR['job_status_success'][1]['message']
     assert error is None
+    assert response.pop('job_stats')['poll_count'] == 1
     assert response == job
     expected = call('PATCH', 'storage/volumes/uuid', {'return_timeout': 30}, json=body)
     assert expected in mock_request.mock_calls
@@ -263,6 +265,7 @@ def test_patch_volume_async_with_query(mock_request):
     job = dict(SRR['job'][1])           # deepcopy as job is modified in place!
     job['job_response'] = SRR['job_status_success'][1]['message']
     assert error is None
+    assert response.pop('job_stats')['poll_count'] == 1
     assert response == job
     expected = call('PATCH', 'storage/volumes/uuid', {'return_timeout': 20}, json=body)
     assert expected in mock_request.mock_calls
@@ -0,0 +1,109 @@
+# Copyright (c) 2021 NetApp
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for module_utils zapi_converters.py '''
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+
+import pytest
+
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils.zapi_converters import zapi_to_dict
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_info import convert_keys
+
+try:
+    import xmltodict
+    HAS_XMLTODICT = True
+except ImportError:
+    HAS_XMLTODICT = False
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip("skipping as missing required netapp_lib")
+
+RESPONSE = b"<?xml version='1.0' encoding='UTF-8' ?>\n<netapp version='1.180' xmlns='http://www.netapp.com/filer/admin'>" + \
+    b"<results status=\"passed\"><attributes-list>%s</attributes-list></results></netapp>"
+
+VOLUME = b"""<volume-attributes>
+  <volume-id-attributes>
+    <name>vol_%d</name>
+    <owning-vserver-name>svm1</owning-vserver-name>
+    <comment/>
+    <junction-path>  </junction-path>
+  </volume-id-attributes>
+  <volume-space-attributes><size>1073741824</size><percentage-snapshot-reserve>5</percentage-snapshot-reserve></volume-space-attributes>
+  <aggr-list><aggr-name>aggr1</aggr-name><aggr-name>aggr2</aggr-name></aggr-list>
+  <mixed>some<tag>value</tag>text</mixed>
+</volume-attributes>
+"""
+
+
+def get_records(count):
+    ''' build a ZAPI response with count volume records, as received from ONTAP '''
+    server = netapp_utils.zapi.NaServer('localhost')
+    response = RESPONSE % b''.join([VOLUME % index for index in range(count)])
+    result = server._get_result(response)
+    return result.get_child_by_name('attributes-list').get_children()
+
+
+def xmltodict_to_dict(record, translate_keys):
+    ''' conversion as previously done in na_ontap_info '''
+    dic = xmltodict.parse(record.to_string(), xml_attribs=False)
+    info = json.loads(json.dumps(dic))
+    if translate_keys:
+        info = convert_keys(info)
+    return info
+
+
+def test_zapi_to_dict():
+    ''' check conversion of text, empty elements, lists, and mixed content '''
+    record = get_records(1)[0]
+    info = zapi_to_dict(record)
+    assert info == {
+        'volume-attributes': {
+            'volume-id-attributes': {'name': 'vol_0', 'owning-vserver-name': 'svm1', 'comment': None, 'junction-path': None},
+            'volume-space-attributes': {'size': '1073741824', 'percentage-snapshot-reserve': '5'},
+            'aggr-list': {'aggr-name': ['aggr1', 'aggr2']},
+            'mixed': {'tag': 'value', '#text': 'sometext'}
+        }
+    }
+
+
+def test_zapi_to_dict_translate_keys():
+    ''' check - is replaced with _ '''
+    record = get_records(1)[0]
+    info = zapi_to_dict(record, translate_keys=True)
+    assert info['volume_attributes']['volume_id_attributes']['owning_vserver_name'] == 'svm1'
+    assert info['volume_attributes']['aggr_list'] == {'aggr_name': ['aggr1', 'aggr2']}
+
+
+def test_zapi_to_dict_locally_built_element():
+    ''' elements built locally have no namespace '''
+    element = netapp_utils.zapi.NaElement.create_node_with_children('vserver-info', **{'vserver-name': 'svm1'})
+    assert zapi_to_dict(element) == {'vserver-info': {'vserver-name': 'svm1'}}
+
+
+def test_zapi_to_dict_xml_attribs():
+    ''' attributes are reported with a @ prefix, namespace declarations are ignored '''
+    server = netapp_utils.zapi.NaServer('localhost')
+    result = server._get_result(b"<?xml version='1.0' encoding='UTF-8' ?>\n<netapp version='1.180' xmlns='http://www.netapp.com/filer/admin'>"
+                                b"<results status=\"failed\" errno=\"13005\"><reason-info x-y=\"1\">text</reason-info><empty z=\"2\"/></results></netapp>")
+    assert zapi_to_dict(result) == {'results': {'reason-info': 'text', 'empty': None}}
+    assert zapi_to_dict(result, xml_attribs=True) == {
+        'results': {'@status': 'failed', '@errno': '13005', 'reason-info': {'@x-y': '1', '#text': 'text'}, 'empty': {'@z': '2'}}
+    }
+    assert zapi_to_dict(result, translate_keys=True, xml_attribs=True)['results']['reason_info'] == {'@x_y': '1', '#text': 'text'}
+    if HAS_XMLTODICT:
+        as_dict = json.loads(json.dumps(xmltodict.parse(result.to_string(), xml_attribs=True)))
+        del as_dict['results']['@xmlns']
+        assert zapi_to_dict(result, xml_attribs=True) == as_dict
+
+
+@pytest.mark.skipif(not HAS_XMLTODICT, reason='xmltodict is required to compare outputs')
+@pytest.mark.parametrize('translate_keys', [False, True])
+def test_zapi_to_dict_matches_xmltodict(translate_keys):
+    ''' output is identical to the xmltodict/json round trip '''
+    for record in get_records(3):
+        assert zapi_to_dict(record, translate_keys) == xmltodict_to_dict(record, translate_keys)
+
@@ -0,0 +1,118 @@
+# Copyright (c) 2021 NetApp
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for module_utils zapi_job_helpers.py '''
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import Mock, patch
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+from ansible_collections.netapp.ontap.plugins.module_utils import zapi_job_helpers
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+class MockZAPIServer(object):
+    ''' return a job-info for each job state in states, or a not found error if the state is None '''
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.requests = 0
+
+    def invoke_successfully(self, xml, enable_tunneling):     # pylint: disable=unused-argument
+        assert xml.get_name() == 'job-get'
+        self.requests += 1
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if state is None:
+            raise netapp_utils.zapi.NaApiError(code='15661', message='entry does not exist')
+        if state == 'error':
+            raise netapp_utils.zapi.NaApiError(code='13005', message='unexpected error')
+        result = netapp_utils.zapi.NaElement('results')
+        attributes = netapp_utils.zapi.NaElement('attributes')
+        attributes.add_node_with_children('job-info', **{'job-state': state, 'job-progress': 'progress %s' % self.requests})
+        result.add_child_elem(attributes)
+        return result
+
+
+@pytest.fixture
+def sleeps():
+    sleeps = list()
+    with patch('time.sleep', side_effect=sleeps.append):
+        yield sleeps
+
+
+def test_iter_delays():
+    delays = zapi_job_helpers.iter_delays(1, 10)
+    assert [next(delays) for dummy in range(6)] == [1, 2, 4, 8, 10, 10]
+
+
+def test_wait_for_condition(sleeps):
+    ''' the delay doubles, and the last delay is cut to the timeout '''
+    values = iter(range(10))
+    assert zapi_job_helpers.wait_for_condition(lambda: next(values), lambda value: value == 3) == (3, False)
+    assert sleeps == [1, 2, 4]
+    del sleeps[:]
+    values = iter(range(10))
+    assert zapi_job_helpers.wait_for_condition(lambda: next(values), lambda value: value == 9, timeout=10) == (4, True)
+    assert sleeps == [1, 2, 4, 3]
+    del sleeps[:]
+    assert zapi_job_helpers.wait_for_condition(lambda: 0, lambda value: value == 0, wait_first=True) == (0, False)
+    assert sleeps == [1]
+
+
+def test_wait_for_condition_no_wait(sleeps):
+    assert zapi_job_helpers.wait_for_condition(lambda: 0, lambda value: value == 0, timeout=0) == (0, False)
+    assert zapi_job_helpers.wait_for_condition(lambda: 0, lambda value: value == 1, timeout=0) == (0, True)
+    assert zapi_job_helpers.wait_for_condition(lambda: 0, lambda value: value == 1, timeout=0, wait_first=True) == (None, True)
+    assert not sleeps
+
+
+def test_wait_for_job(sleeps):
+    server = MockZAPIServer(['queued', 'running', 'running', 'success'])
+    results = zapi_job_helpers.wait_for_job(Mock(), server, 1234, 100)
+    assert results['job-state'] == 'success'
+    assert results['job-completion'] is None
+    assert results['job-progress-history'] == ['progress 1', 'progress 2', 'progress 3', 'progress 4']
+    assert sleeps == [1, 2, 4]
+
+
+def test_wait_for_job_timeout(sleeps):
+    server = MockZAPIServer(['running'])
+    results = zapi_job_helpers.wait_for_job(Mock(), server, 1234, 20)
+    assert results['job-state'] == 'running'
+    assert sum(sleeps) == 20
+    assert max(sleeps) == 5
+
+
+def test_wait_for_job_cserver(sleeps):
+    ''' the admin vserver connection is created once, and reused for the following jobs '''
+    module = Mock(spec=[])
+    server = MockZAPIServer([None])
+    cserver_connection = MockZAPIServer(['running', 'success'])
+    with patch.object(netapp_utils, 'get_cserver', return_value='cserver') as get_cserver, \
+            patch.object(netapp_utils, 'setup_na_ontap_zapi', return_value=cserver_connection) as setup_na_ontap_zapi:
+        assert zapi_job_helpers.wait_for_job(module, server, 1234, 100)['job-state'] == 'success'
+        assert zapi_job_helpers.wait_for_job(module, server, 1235, 100)['job-state'] == 'success'
+    assert server.requests == 2
+    assert cserver_connection.requests == 3
+    get_cserver.assert_called_once_with(server)
+    setup_na_ontap_zapi.assert_called_once_with(module=module, vserver='cserver')
+
+
+def test_wait_for_job_not_found(sleeps):
+    module = Mock(spec=[])
+    server = MockZAPIServer([None])
+    with patch.object(netapp_utils, 'get_cserver', return_value='cserver'), \
+            patch.object(netapp_utils, 'setup_na_ontap_zapi', return_value=server):
+        assert zapi_job_helpers.wait_for_job(module, server, 1234, 100) is None
+    with patch.object(netapp_utils, 'get_cserver', return_value=None):
+        assert zapi_job_helpers.wait_for_job(Mock(spec=[]), MockZAPIServer([None]), 1234, 100) is None
+    assert not sleeps
+
+
+def test_wait_for_job_error():
+    with pytest.raises(netapp_utils.zapi.NaApiError):
+        zapi_job_helpers.wait_for_job(Mock(), MockZAPIServer(['error']), 1234, 100)
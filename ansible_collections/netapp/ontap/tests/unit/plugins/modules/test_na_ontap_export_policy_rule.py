@@ -59,10 +59,22 @@ class MockONTAPConnection(object):
         self.data = data
         self.xml_in = None
         self.xml_out = None
+        self.zapis = list()
 
     def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
         ''' mock invoke_successfully returning xml data '''
         self.xml_in = xml
+        zapi = xml.get_name()
+        self.zapis.append((zapi, xml.get_child_content('rule-index'), xml.get_child_content('new-rule-index')))
+        if self.kind == 'policy_rules':
+            if zapi == 'export-rule-get-iter':
+                xml = self.build_policy_rules(self.data)
+            elif zapi == 'export-policy-get-iter':
+                xml = self.build_policy()
+            elif zapi == 'export-rule-create' and self.data.get('fail') == zapi:
+                raise netapp_utils.zapi.NaApiError(code='TEST', message="This exception is from the unit test")
+            self.xml_out = xml
+            return xml
         if self.kind == 'rule':
             xml = self.build_policy_rule(self.data)
         if self.kind == 'rules':
@@ -101,6 +113,23 @@ class MockONTAPConnection(object):
         xml.translate_struct(attributes)
         return xml
 
+    @staticmethod
+    def build_policy_rules(data):
+        ''' build xml data for export-rule-info, for each (client_match, rule_index, rw_rule) in data['rules'] '''
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for client_match, rule_index, rw_rule in data['rules']:
+            attributes_list.add_child_elem(netapp_utils.zapi.NaElement.create_node_with_children(
+                'export-rule-info', **{'policy-name': 'test', 'client-match': client_match, 'rule-index': str(rule_index),
+                                       'is-allow-set-uid-enabled': 'false', 'anonymous-user-id': '65534'}))
+            rule_info = attributes_list.get_children()[-1]
+            for parent, child, value in (('ro-rule', 'security-flavor', 'sys'), ('rw-rule', 'security-flavor', rw_rule),
+                                         ('super-user-security', 'security-flavor', 'any'), ('protocol', 'access-protocol', 'nfs')):
+                rule_info.add_child_elem(netapp_utils.zapi.NaElement.create_node_with_children(parent, **{child: value}))
+        xml.add_child_elem(attributes_list)
+        xml.add_new_child('num-records', str(len(data['rules'])))
+        return xml
+
     @staticmethod
     def build_policy():
         ''' build xml data for export-policy-get-iter '''
@@ -267,3 +296,111 @@ class TestMyModule(unittest.TestCase):
         assert 'query' in result
         assert 'export-rule-info' in result['query']
         assert result['query']['export-rule-info']['rule-index'] == data['rule_index']
+
+    def rules_args(self, clients):
+        return {
+            'name': 'test',
+            'vserver': 'test',
+            'ro_rule': 'sys',
+            'rw_rule': 'sys',
+            'protocol': 'nfs',
+            'rules': [dict(client_match=client) if isinstance(client, str) else client for client in clients],
+            'hostname': 'test',
+            'username': 'test_user',
+            'password': 'test_pass!'
+        }
+
+    def get_rules_mock_object(self, current_rules, **kwargs):
+        obj = policy_rule()
+        obj.autosupport_log = Mock(return_value=None)
+        obj.server = MockONTAPConnection(kind='policy_rules', data=dict(rules=current_rules, **kwargs))
+        return obj
+
+    def test_rules_idempotency(self):
+        ''' all rules are in place, only export-rule-get-iter is called '''
+        set_module_args(self.rules_args(['1.1.1.0/24', '2.2.2.0/24']))
+        my_obj = self.get_rules_mock_object([('2.2.2.0/24', 2, 'sys'), ('1.1.1.0/24', 1, 'sys')])
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert not exc.value.args[0]['changed']
+        assert exc.value.args[0]['plan'] == []
+        assert my_obj.server.zapis == [('export-rule-get-iter', None, None)]
+
+    def test_rules_plan(self):
+        ''' delete, modify, create, and move rules '''
+        clients = ['3.3.3.0/24', '1.1.1.0/24', dict(client_match=['2.2.2.0/24', '2.2.3.0/24'], rw_rule=['krb5'])]
+        set_module_args(self.rules_args(clients))
+        current_rules = [('1.1.1.0/24', 1, 'sys'), ('4.4.4.0/24', 2, 'sys'), ('2.2.2.0/24,2.2.3.0/24', 3, 'sys'), ('1.1.1.0/24', 4, 'sys')]
+        my_obj = self.get_rules_mock_object(current_rules)
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['plan'] == [
+            dict(action='delete', client_match='1.1.1.0/24', rule_index=4),
+            dict(action='delete', client_match='4.4.4.0/24', rule_index=2),
+            dict(action='modify', client_match='2.2.2.0/24,2.2.3.0/24', rule_index=3, modify=dict(rw_rule=['krb5'])),
+            dict(action='create', client_match='3.3.3.0/24', rule_index=1),
+            dict(action='move', client_match='2.2.2.0/24,2.2.3.0/24', from_index=4, rule_index=3),
+        ]
+        assert my_obj.server.zapis == [
+            ('export-rule-get-iter', None, None),
+            ('export-policy-get-iter', None, None),
+            ('export-rule-destroy', '4', None),
+            ('export-rule-destroy', '2', None),
+            ('export-rule-modify', '3', None),
+            ('export-rule-create', '1', None),
+            ('export-rule-set-index', '4', '3'),
+        ]
+
+    def test_rules_reorder(self):
+        ''' rotate rules, rules already in place after a move are not moved '''
+        set_module_args(self.rules_args(['2.2.2.0/24', '3.3.3.0/24', '1.1.1.0/24']))
+        my_obj = self.get_rules_mock_object([('1.1.1.0/24', 1, 'sys'), ('2.2.2.0/24', 2, 'sys'), ('3.3.3.0/24', 3, 'sys')])
+        my_obj.module.check_mode = True
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['plan'] == [
+            dict(action='move', client_match='2.2.2.0/24', from_index=2, rule_index=1),
+            dict(action='move', client_match='3.3.3.0/24', from_index=3, rule_index=2),
+        ]
+        assert my_obj.server.zapis == [('export-rule-get-iter', None, None)]
+
+    def test_rules_delete_all(self):
+        ''' an empty list deletes all the rules '''
+        args = self.rules_args([])
+        set_module_args(args)
+        my_obj = self.get_rules_mock_object([('1.1.1.0/24', 1, 'sys'), ('2.2.2.0/24', 2, 'sys')])
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert [action['action'] for action in exc.value.args[0]['plan']] == ['delete', 'delete']
+
+    def test_rules_errors(self):
+        ''' validation and ZAPI errors '''
+        set_module_args(self.rules_args(['1.1.1.0/24', '1.1.1.0/24']))
+        with pytest.raises(AnsibleFailJson) as exc:
+            self.get_rules_mock_object([]).apply()
+        assert exc.value.args[0]['msg'] == 'Error: duplicate client_match in rules: 1.1.1.0/24'
+        args = self.rules_args(['1.1.1.0/24'])
+        args['state'] = 'absent'
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            self.get_rules_mock_object([]).apply()
+        assert exc.value.args[0]['msg'] == 'Error: rules requires state: present, use an empty list to delete all the rules.'
+        args = self.rules_args(['1.1.1.0/24'])
+        del args['ro_rule']
+        set_module_args(args)
+        my_obj = self.get_rules_mock_object([])
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == 'Error: Missing required param for creating export policy rule ro_rule'
+        assert my_obj.server.zapis == [('export-rule-get-iter', None, None)]
+        set_module_args(self.rules_args(['1.1.1.0/24']))
+        with pytest.raises(AnsibleFailJson) as exc:
+            self.get_rules_mock_object([], fail='export-rule-create').apply()
+        assert exc.value.args[0]['msg'] == 'Error creating export policy rule test: NetApp API failed. Reason - TEST:This exception is from the unit test'
+        args = self.rules_args(['1.1.1.0/24'])
+        args['rule_index'] = 1
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            policy_rule()
+        assert 'mutually exclusive' in exc.value.args[0]['msg']
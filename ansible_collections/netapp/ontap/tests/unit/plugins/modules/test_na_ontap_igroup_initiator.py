@@ -50,6 +50,21 @@ def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
     raise AnsibleFailJson(kwargs)
 
 
+# REST API canned responses when mocking send_request
+SRR = {
+    # common responses
+    'is_rest': (200, dict(version=dict(generation=9, major=9, minor=0, full='dummy')), None),
+    'is_zapi': (400, {}, "Unreachable"),
+    'empty_good': (200, {}, None),
+    'zero_record': (200, dict(records=[], num_records=0), None),
+    'generic_error': (400, None, "Expected error"),
+    'end_of_sequence': (500, None, "Unexpected call to send_request"),
+    # module specific responses
+    'igroup_record': (200, dict(records=[dict(uuid='igroup_uuid', initiators=[dict(name='init1'), dict(name='init2')])],
+                                num_records=1), None),
+}
+
+
 class MockONTAPConnection(object):
     ''' mock server connection to ONTAP host '''
 
@@ -63,6 +78,8 @@ class MockONTAPConnection(object):
     def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
         ''' mock invoke_successfully returning xml data '''
         self.xml_in = xml
+        if self.data is not None and xml.get_child_content('initiator') == self.data:
+            raise netapp_utils.zapi.NaApiError(code='TEST', message="This exception is from the unit test")
         if self.kind == 'initiator':
             xml = self.build_igroup_initiator()
         elif self.kind == 'initiator_fail':
@@ -120,7 +137,9 @@ class TestMyModule(unittest.TestCase):
         :param kind: passes this param to MockONTAPConnection()
         :return: na_ontap_initiator object
         """
-        obj = initiator()
+        with patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request') as mock_request:
+            mock_request.side_effect = [SRR['is_zapi']]
+            obj = initiator()
         obj.autosupport_log = Mock(return_value=None)
         if kind is None:
             obj.server = MockONTAPConnection()
@@ -216,3 +235,132 @@ class TestMyModule(unittest.TestCase):
         with pytest.raises(AnsibleFailJson) as exc:
             my_obj.modify_initiator(data['name'], 'igroup-add')
         assert 'Error modifying igroup initiator ' in exc.value.args[0]['msg']
+
+    def test_successful_add_concurrently(self):
+        ''' ZAPI calls are made from a pool of workers, each worker thread with its own connection '''
+        data = self.mock_args()
+        data['names'] = ['init1', 'new1', 'new2', 'new3']
+        del data['name']
+        data['max_concurrency'] = 2
+        set_module_args(data)
+        obj = self.get_initiator_mock_object('initiator')
+        with patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.clone_zapi_server',
+                   wraps=netapp_utils.clone_zapi_server) as mock_clone:
+            with pytest.raises(AnsibleExitJson) as exc:
+                obj.apply()
+        assert exc.value.args[0]['changed']
+        assert 1 <= mock_clone.call_count <= 2
+
+    def test_error_add_concurrently(self):
+        ''' errors are reported from the main thread '''
+        data = self.mock_args()
+        data['names'] = ['new1', 'new2']
+        del data['name']
+        data['max_concurrency'] = 2
+        set_module_args(data)
+        obj = self.get_initiator_mock_object('initiator')
+        obj.get_initiators = Mock(return_value=[])
+        obj.server.kind = 'initiator_fail'
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj.apply()
+        msg = 'Error modifying igroup initiator new1: NetApp API failed. Reason - TEST:This exception is from the unit test'
+        assert msg in exc.value.args[0]['msg']
+        assert 'Error modifying igroup initiator new2' in exc.value.args[0]['msg']
+        assert not exc.value.args[0]['changed']
+
+    def test_partial_error_add_concurrently(self):
+        ''' changed is reported when some initiators were added '''
+        data = self.mock_args()
+        data['names'] = ['new1', 'new2', 'new3']
+        del data['name']
+        data['max_concurrency'] = 2
+        set_module_args(data)
+        obj = self.get_initiator_mock_object('initiator')
+        obj.get_initiators = Mock(return_value=[])
+        obj.server.data = 'new2'
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj.apply()
+        assert exc.value.args[0]['msg'].startswith('Error modifying igroup initiator new2: ')
+        assert 'new1' not in exc.value.args[0]['msg']
+        assert exc.value.args[0]['changed']
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_rest_add_in_one_request(self, mock_request):
+        ''' all missing initiators are added with a single POST '''
+        data = self.mock_args()
+        data['names'] = ['init1', 'new1', 'new2', 'new1']
+        del data['name']
+        set_module_args(data)
+        mock_request.side_effect = [
+            SRR['is_rest'],
+            SRR['igroup_record'],
+            SRR['empty_good'],
+            SRR['end_of_sequence']
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            initiator().apply()
+        assert exc.value.args[0]['changed']
+        assert mock_request.call_count == 3
+        args, kwargs = mock_request.call_args
+        assert args[:2] == ('POST', 'protocols/san/igroups/igroup_uuid/initiators')
+        assert kwargs['json'] == dict(records=[dict(name='new1'), dict(name='new2')])
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_rest_add_idempotency(self, mock_request):
+        data = self.mock_args()
+        set_module_args(data)
+        mock_request.side_effect = [
+            SRR['is_rest'],
+            SRR['igroup_record'],
+            SRR['end_of_sequence']
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            initiator().apply()
+        assert not exc.value.args[0]['changed']
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_rest_remove(self, mock_request):
+        data = self.mock_args()
+        data['names'] = ['init1', 'init2', 'init3']
+        del data['name']
+        data['state'] = 'absent'
+        data['force_remove'] = True
+        set_module_args(data)
+        mock_request.side_effect = [
+            SRR['is_rest'],
+            SRR['igroup_record'],
+            SRR['empty_good'],
+            SRR['empty_good'],
+            SRR['end_of_sequence']
+        ]
+        with pytest.raises(AnsibleExitJson) as exc:
+            initiator().apply()
+        assert exc.value.args[0]['changed']
+        assert mock_request.call_count == 4
+        args = mock_request.call_args[0]
+        assert args == ('DELETE', 'protocols/san/igroups/igroup_uuid/initiators/init2', dict(allow_delete_while_mapped=True))
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_rest_errors(self, mock_request):
+        data = self.mock_args()
+        set_module_args(data)
+        mock_request.side_effect = [
+            SRR['is_rest'],
+            SRR['generic_error'],
+            SRR['zero_record'],
+            SRR['igroup_record'],
+            SRR['generic_error'],
+            SRR['end_of_sequence']
+        ]
+        my_obj = initiator()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.get_initiators()
+        assert exc.value.args[0]['msg'] == 'Error fetching igroup info test: calling: protocols/san/igroups: got Expected error'
+        assert my_obj.get_initiators() == []
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.add_initiators(['new1'])
+        assert exc.value.args[0]['msg'] == 'Error: igroup test not found in vserver vserver'
+        my_obj.get_initiators()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.add_initiators(['new1'])
+        assert exc.value.args[0]['msg'] == 'Error adding igroup initiators new1: Expected error'
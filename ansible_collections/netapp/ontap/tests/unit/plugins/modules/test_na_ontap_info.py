@@ -86,6 +86,10 @@ class MockONTAPConnection(object):
             xml = self.list_of_two()
         elif self.type == 'list_of_two_dups':
             xml = self.list_of_two_dups()
+        elif self.type == 'paged_net_port':
+            xml = self.build_paged_net_port_info(xml.get_child_content('tag'))
+        elif self.type == 'by_api':
+            xml = self.build_by_api(xml.get_name())
         else:
             raise KeyError(self.type)
         self.xml_out = xml
@@ -135,6 +139,36 @@ class MockONTAPConnection(object):
         xml.add_child_elem(attributes_list)
         return xml
 
+    @staticmethod
+    def build_paged_net_port_info(tag):
+        ''' build xml data for net-port-info, two records per page, and three pages '''
+        page = 0 if tag is None else int(tag)
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for i in range(page * 2, page * 2 + 2):
+            net_port_info = netapp_utils.zapi.NaElement('net-port-info')
+            net_port_info.add_new_child('node', 'node_' + str(i))
+            net_port_info.add_new_child('port', 'port_' + str(i))
+            attributes_list.add_child_elem(net_port_info)
+        xml.add_child_elem(attributes_list)
+        if page < 2:
+            xml.add_new_child('next-tag', str(page + 1))
+        return xml
+
+    def build_by_api(self, api):
+        ''' build xml data based on the API name '''
+        if api == 'system-get-ontapi-version':
+            xml = netapp_utils.zapi.NaElement('results')
+            xml.add_new_child('minor-version', '170')
+            return xml
+        if api == 'net-port-get-iter':
+            return self.build_net_port_info('with_ifgrp')
+        if api == 'net-port-ifgrp-get':
+            return self.build_net_ifgrp_info()
+        if api == 'vserver-get-iter':
+            return self.build_vserver_info()
+        raise KeyError(api)
+
     @staticmethod
     def list_of_one():
         ''' build xml data for list of one info element '''
@@ -193,6 +227,7 @@ class TestMyModule(unittest.TestCase):
             use_native_zapi_tags=dict(type='bool', required=False, default=False),
             continue_on_error=dict(type='list', required=False, default=['never']),
             query=dict(type='dict', required=False),
+            max_concurrency=dict(type='int', required=False, default=1),
         ))
         module = basic.AnsibleModule(
             argument_spec=argument_spec,
@@ -565,3 +600,74 @@ class TestMyModule(unittest.TestCase):
         assert not obj.error_flags['missing_vserver_api_error']
         assert not obj.error_flags['rpc_error']
         assert not obj.error_flags['other_error']
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.ems_log_event')
+    def test_get_all_concurrently(self, mock_ems_log):
+        ''' subsets are collected by workers using their own connection, dependent subsets are collected last '''
+        subsets = ['net_ifgrp_info', 'net_port_info', 'vserver_info']
+        outputs = list()
+        for max_concurrency in (1, 3):
+            args = dict(self.mock_args())
+            args['max_concurrency'] = max_concurrency
+            set_module_args(args)
+            obj = self.get_info_mock_object('by_api')
+            servers = list()
+
+            def clone_server():
+                servers.append(MockONTAPConnection('by_api'))
+                return servers[-1]
+
+            with patch.object(obj, 'clone_server', side_effect=clone_server):
+                outputs.append(obj.get_all(subsets))
+            if max_concurrency == 1:
+                assert not servers
+            else:
+                # one connection per worker thread for the first wave
+                # net_ifgrp_info is alone in the second wave, and runs in the main thread
+                assert 1 <= len(servers) <= 2
+        assert outputs[0] == outputs[1]
+        assert set(outputs[1]['net_ifgrp_info']) == set(['node_0:ifgrp_0', 'node_1:ifgrp_1'])
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.ems_log_event')
+    def test_get_all_ontapi_version_once(self, mock_ems_log):
+        ''' the version subsets reuse the version read by get_all, rather than calling the API from a worker '''
+        args = dict(self.mock_args())
+        args['max_concurrency'] = 2
+        set_module_args(args)
+        obj = self.get_info_mock_object('by_api')
+        with patch.object(obj.server, 'invoke_successfully', wraps=obj.server.invoke_successfully) as mock_invoke, \
+                patch.object(obj, 'clone_server') as mock_clone:
+            info = obj.get_all(['ontap_version', 'ontapi_version'])
+        assert info['ontap_version'] == '170'
+        assert info['ontapi_version'] == '170'
+        assert [call[0][0].get_name() for call in mock_invoke.call_args_list].count('system-get-ontapi-version') == 1
+        mock_clone.assert_not_called()
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.ems_log_event')
+    def test_get_all_concurrently_error(self, mock_ems_log):
+        ''' an error in a worker is reported with fail_json from the main thread '''
+        args = dict(self.mock_args())
+        args['max_concurrency'] = 2
+        set_module_args(args)
+        obj = self.get_info_mock_object('by_api')
+        with patch.object(obj, 'clone_server', side_effect=lambda: MockONTAPConnection('zapi_error')):
+            with pytest.raises(AnsibleFailJson) as exc:
+                obj.get_all(['net_port_info', 'vserver_info'])
+        assert exc.value.args[0]['msg'] == 'Error calling API net-port-get-iter: NetApp API failed. Reason - test:error'
+
+    def test_get_generic_get_iter_with_next_tag(self):
+        ''' records from all pages are converted '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('paged_net_port')
+        result = obj.get_generic_get_iter('net-port-get-iter', attribute='net-port-info', key_fields=('node', 'port'))
+        assert sorted(result) == ['node_%d:port_%d' % (i, i) for i in range(6)]
+        assert result['node_5:port_5'] == {'node': 'node_5', 'port': 'port_5'}
+        assert obj.server.xml_in.get_child_content('tag') == '2'
+
+    def test_call_api_with_next_tag(self):
+        ''' records from all pages are merged '''
+        set_module_args(self.mock_args())
+        obj = self.get_info_mock_object('paged_net_port')
+        result, error = obj.call_api('net-port-get-iter')
+        assert error is None
+        assert len(result.get_child_by_name('attributes-list').get_children()) == 6
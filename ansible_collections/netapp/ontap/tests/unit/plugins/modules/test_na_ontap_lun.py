@@ -57,17 +57,24 @@ class MockONTAPConnection(object):
         self.parm1 = parm1
         self.xml_in = None
         self.xml_out = None
+        self.requests = list()
 
     def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
         ''' mock invoke_successfully returning xml data '''
         self.xml_in = xml
+        self.requests.append(xml)
         if self.type == 'lun':
             xml = self.build_lun_info(self.parm1)
+        elif self.type == 'lun_mapped':
+            if xml.get_name() == 'lun-map-get-iter':
+                xml = self.build_lun_map_info(self.parm1)
+            else:
+                xml = self.build_lun_info(self.parm1, mapped=True)
         self.xml_out = xml
         return xml
 
     @staticmethod
-    def build_lun_info(lun_name):
+    def build_lun_info(lun_name, mapped=False):
         ''' build xml data for lun-info '''
         xml = netapp_utils.zapi.NaElement('xml')
         lun = dict(
@@ -76,6 +83,8 @@ class MockONTAPConnection(object):
                 size=10
             )
         )
+        if mapped:
+            lun['lun_info']['mapped'] = 'true'
         attributes = {
             'num-records': 1,
             'attributes-list': [lun]
@@ -83,6 +92,21 @@ class MockONTAPConnection(object):
         xml.translate_struct(attributes)
         return xml
 
+    @staticmethod
+    def build_lun_map_info(lun_name):
+        ''' build xml data for lun-map-info '''
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes = {
+            'num-records': 1,
+            'attributes-list': [{'lun-map-info': {
+                'path': "/what/ever/%s" % lun_name,
+                'initiator-group': 'igroup1',
+                'lun-id': '3'
+            }}]
+        }
+        xml.translate_struct(attributes)
+        return xml
+
 
 class TestMyModule(unittest.TestCase):
     ''' a group of related Unit Tests '''
@@ -175,3 +199,24 @@ class TestMyModule(unittest.TestCase):
             self.get_lun_mock_object('lun', 'other_lun_name').apply()
         msg = 'Error renaming lun: lun_from_name does not exist'
         assert msg == exc.value.args[0]['msg']
+
+    def test_get_lun_queries_by_name(self):
+        ''' LUNs are filtered by ONTAP, and LUN maps are read with a single query '''
+        data = dict(self.mock_args())
+        data['from_name'] = 'lun_from_name'
+        set_module_args(data)
+        my_obj = self.get_lun_mock_object('lun_mapped', 'lun_from_name')
+        assert my_obj.get_lun('lun_name') is None
+        current = my_obj.get_lun('lun_from_name')
+        assert current['attached_to'] == 'igroup1'
+        assert current['lun_id'] == '3'
+        assert current['path'] == '/what/ever/lun_from_name'
+        requests = [request.to_string().decode('utf-8') for request in my_obj.server.requests]
+        assert len(requests) == 2
+        assert '<path>/vol/vol_name/lun_name|/vol/vol_name/*/lun_name|/vol/vol_name/lun_from_name|/vol/vol_name/*/lun_from_name</path>' in requests[0]
+        assert requests[1].startswith('<lun-map-get-iter>')
+        assert '<path>/what/ever/lun_from_name</path>' in requests[1]
+        # a name that is not in the snapshot is queried directly
+        assert my_obj.get_lun('other_name') is None
+        assert len(my_obj.server.requests) == 3
+        assert '<path>/vol/vol_name/other_name|/vol/vol_name/*/other_name</path>' in my_obj.server.requests[2].to_string().decode('utf-8')
@@ -56,16 +56,20 @@ class MockONTAPConnection(object):
         self.status = status
         self.xml_in = None
         self.xml_out = None
+        self.zapis = list()
 
     def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
         ''' mock invoke_successfully returning xml data '''
         self.xml_in = xml
         print('IN:', xml.to_string())
         zapi = xml.get_name()
+        self.zapis.append((zapi, xml.get_child_content('volume') or xml.get_child_content('tag')))
         if zapi == 'quota-status' and self.type != 'quota_fail':
             return self.build_quota_status(self.status)
         if self.type == 'quotas':
             xml = self.build_quota_info()
+        elif self.type == 'quota_pages' and zapi == 'quota-list-entries-iter':
+            xml = self.build_quota_pages(xml)
         elif self.type == 'quota_fail':
             raise netapp_utils.zapi.NaApiError(code='TEST', message="This exception is from the unit test")
         self.xml_out = xml
@@ -78,11 +82,40 @@ class MockONTAPConnection(object):
         data = {'num-records': 1,
                 'attributes-list': {'quota-entry': {'volume': 'ansible',
                                                     'file-limit': '-', 'disk-limit': '-', 'quota-target': '/vol/ansible',
-                                                    'soft-file-limit': '-', 'soft-disk-limit': '-', 'threshold': '-'}},
+                                                    'soft-file-limit': '-', 'soft-disk-limit': '-', 'threshold': '-',
+                                                    'quota-type': 'user', 'policy': 'ansible', 'qtree': ''}},
                 'status': 'true'}
         xml.translate_struct(data)
         return xml
 
+    @staticmethod
+    def build_quota_pages(xml_in):
+        ''' build xml data for quota-entry, two pages of records linked with next-tag '''
+        volume = xml_in.get_child_by_name('query').get_child_by_name('quota-entry').get_child_content('volume')
+        entries = [
+            ('user', 'user1', '', '1G'),
+            ('user', 'user2', '', '2G'),
+            ('tree', '/vol/%s/q1' % volume, '', '3G'),
+            ('user', 'user1', 'q1', '4G'),
+        ]
+        next_tag = None
+        if xml_in.get_child_content('tag') is None:
+            entries, next_tag = entries[:2], 'page2'
+        else:
+            entries = entries[2:]
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes_list = netapp_utils.zapi.NaElement('attributes-list')
+        for quota_type, target, qtree, disk_limit in entries:
+            attributes_list.add_child_elem(netapp_utils.zapi.NaElement.create_node_with_children(
+                'quota-entry', **{'volume': volume, 'quota-type': quota_type, 'quota-target': target, 'qtree': qtree,
+                                  'policy': 'default', 'disk-limit': disk_limit, 'file-limit': '-',
+                                  'soft-file-limit': '-', 'soft-disk-limit': '-', 'threshold': '-'}))
+        xml.add_child_elem(attributes_list)
+        xml.add_new_child('num-records', str(len(entries)))
+        if next_tag is not None:
+            xml.add_new_child('next-tag', next_tag)
+        return xml
+
     @staticmethod
     def build_quota_status(status):
         ''' build xml data for quota-status '''
@@ -255,3 +288,91 @@ class TestMyModule(unittest.TestCase):
         with pytest.raises(AnsibleFailJson) as exc:
             my_obj.on_or_off_quota('quota-on')
         assert 'Error setting quota-on for ansible' in exc.value.args[0]['msg']
+
+    def test_get_quotas_follows_next_tag(self):
+        ''' the quota rule is on the second page, and is matched on type, target, and qtree '''
+        data = self.set_default_args()
+        data.update({'quota_target': 'user1', 'qtree': 'q1'})
+        del data['policy']
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('quota_pages')
+        assert my_obj.get_quotas()['disk_limit'] == '4G'
+        assert [zapi for zapi in my_obj.server.zapis] == [('quota-list-entries-iter', None), ('quota-list-entries-iter', 'page2')]
+        data['policy'] = 'other'
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('quota_pages')
+        assert my_obj.get_quotas() is None
+
+    def set_quotas_args(self, quotas):
+        data = self.set_default_args()
+        del data['quota_target']
+        del data['type']
+        data['policy'] = 'default'
+        data['quotas'] = quotas
+        return data
+
+    def test_successful_quotas(self):
+        ''' create, modify, and delete rules, with one quota-list-entries-iter walk and one resize per volume '''
+        quotas = [
+            dict(quota_target='user1', type='user', disk_limit='1G'),
+            dict(quota_target='user2', type='user', disk_limit='20G'),
+            dict(quota_target='user3', type='user', disk_limit='1G'),
+            dict(quota_target='user1', type='user', qtree='q1', state='absent'),
+            dict(quota_target='user1', type='user', volume='vol2', disk_limit='1G'),
+        ]
+        set_module_args(self.set_quotas_args(quotas))
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('quota_pages', 'on')
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['changed']
+        results = exc.value.args[0]['quotas']
+        assert [result['changed'] for result in results] == [False, True, True, True, False]
+        assert [result.get('action') for result in results] == [None, 'modify', 'create', 'delete', None]
+        assert results[1]['modify'] == {'disk_limit': '20G'}
+        zapis = [zapi for zapi in my_obj.server.zapis if zapi[0] != 'ems-autosupport-log']
+        assert zapis == [
+            ('quota-list-entries-iter', None), ('quota-list-entries-iter', 'page2'),
+            ('quota-list-entries-iter', None), ('quota-list-entries-iter', 'page2'),
+            ('quota-modify-entry', 'ansible'), ('quota-set-entry', 'ansible'), ('quota-delete-entry', 'ansible'),
+            ('quota-status', 'ansible'), ('quota-resize', 'ansible'), ('quota-status', 'vol2'),
+        ]
+
+    def test_successful_quotas_check_mode(self):
+        ''' no change is applied in check mode '''
+        quotas = [dict(quota_target='user3', type='user', disk_limit='1G')]
+        data = self.set_quotas_args(quotas)
+        data['set_quota_status'] = True
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.module.check_mode = True
+        my_obj.server = MockONTAPConnection('quota_pages', 'off')
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['quotas'][0]['action'] == 'create'
+        assert not [zapi for zapi in my_obj.server.zapis if zapi[0] in ('quota-set-entry', 'quota-on', 'quota-resize')]
+
+    def test_quotas_errors(self):
+        ''' duplicate rules, and exclusive options '''
+        quotas = [dict(quota_target='user3', type='user'), dict(quota_target='user3', type='user', disk_limit='1G')]
+        set_module_args(self.set_quotas_args(quotas))
+        my_obj = my_module()
+        my_obj.server = MockONTAPConnection('quota_pages')
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == "Error: duplicate rules in quotas: ('ansible', 'user', 'user3', '', 'default')"
+        data = self.set_quotas_args(quotas)
+        data['quota_target'] = 'user3'
+        set_module_args(data)
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_module()
+        assert 'mutually exclusive' in exc.value.args[0]['msg']
+        data = self.set_quotas_args(quotas)
+        del data['quotas']
+        set_module_args(data)
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_module()
+        assert exc.value.args[0]['msg'] == "missing parameter(s) required by 'policy': quota_target, type"
@@ -5,6 +5,10 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import copy
+import os
+import shutil
+import tempfile
 import json
 import pytest
 
@@ -551,3 +555,233 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         print('Info: test_get_all_records_for_volume_info_to_check_next_api_call_functionality_pass: %s' % repr(exc.value.args))
         assert exc.value.args[0]['ontap_info']['storage/volumes']['num_records'] == total_records
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_concurrent_subsets_pass(self, mock_request):
+        ''' subsets are collected concurrently, and the output is the same as when collected sequentially '''
+        def mock_send_request(method, api, params, **kwargs):
+            if api == 'cluster':
+                return SRR['validate_ontap_version_pass']
+            if api == 'next_record_api':
+                return copy.deepcopy(SRR['get_next_record'])
+            if api == 'storage/volumes':
+                return copy.deepcopy(SRR['get_subset_info_with_next'])
+            return copy.deepcopy(SRR['get_subset_info'])
+
+        mock_request.side_effect = mock_send_request
+        args = self.set_default_args()
+        args['gather_subset'] = ['aggregate_info', 'volume_info', 'vserver_info', 'storage/luns']
+        outputs = list()
+        for max_concurrency in (1, 4):
+            args['max_concurrency'] = max_concurrency
+            set_module_args(args)
+            my_obj = ontap_rest_info_module()
+            with pytest.raises(AnsibleExitJson) as exc:
+                my_obj.apply()
+            outputs.append(exc.value.args[0]['ontap_info'])
+        assert outputs[0] == outputs[1]
+        assert list(outputs[1]) == ['storage/aggregates', 'storage/volumes', 'svm/svms', 'storage/luns']
+        assert outputs[1]['storage/volumes']['num_records'] == 5
+        assert mock_request.call_count == 12
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_concurrent_subsets_fail(self, mock_request):
+        ''' an error in a worker thread is reported by the module '''
+        def mock_send_request(method, api, params, **kwargs):
+            if api == 'cluster':
+                return SRR['validate_ontap_version_pass']
+            if api == 'storage/volumes':
+                return 400, None, {'code': '123', 'message': 'Expected error'}
+            return copy.deepcopy(SRR['get_subset_info'])
+
+        mock_request.side_effect = mock_send_request
+        args = self.set_default_args()
+        args['gather_subset'] = ['aggregate_info', 'volume_info', 'vserver_info']
+        args['max_concurrency'] = 3
+        set_module_args(args)
+        my_obj = ontap_rest_info_module()
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == {'code': '123', 'message': 'Expected error'}
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_incremental_pass(self, mock_request):
+        ''' only added and changed records are downloaded on the second run '''
+        volumes = [{'uuid': 'uuid%d' % index, 'name': 'vol%d' % index, 'state': 'online', 'size': 100 * index}
+                   for index in range(1, 6)]
+        calls = list()
+
+        def mock_send_request(method, api, params, **kwargs):
+            if api == 'cluster':
+                return SRR['validate_ontap_version_pass']
+            calls.append(dict(params))
+            records = volumes
+            if params.get('uuid'):
+                records = [record for record in records if record['uuid'] in params['uuid'].split('|')]
+            if params['fields'] == 'uuid,state':
+                records = [dict(uuid=record['uuid'], state=record['state']) for record in records]
+            return 200, {'records': copy.deepcopy(records), 'num_records': len(records), '_links': {'self': {'href': 'dummy_href'}}}, None
+
+        mock_request.side_effect = mock_send_request
+        args = self.set_default_args()
+        args['gather_subset'] = ['volume_info']
+        args['incremental'] = dict(signature_fields=['state'], snapshot_dir=self.snapshot_dir())
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            ontap_rest_info_module().apply()
+        assert exc.value.args[0]['ontap_info']['storage/volumes']['records'] == volumes
+        assert exc.value.args[0]['incremental_summary'] == {
+            'storage/volumes': dict(added=['uuid%d' % index for index in range(1, 6)], changed=[], removed=[], fetched=5)}
+        # light listing, then a single full listing as all records are new
+        assert [call['fields'] for call in calls] == ['uuid,state', []]
+        assert 'uuid' not in calls[1]
+
+        # second run: uuid2 changed, uuid3 removed, uuid6 added
+        volumes[1]['state'] = 'offline'
+        del volumes[2]
+        volumes.append({'uuid': 'uuid6', 'name': 'vol6', 'state': 'online', 'size': 600})
+        # a change that is not part of the signature is not detected
+        volumes[0]['size'] = 1
+        del calls[:]
+        with pytest.raises(AnsibleExitJson) as exc:
+            ontap_rest_info_module().apply()
+        records = exc.value.args[0]['ontap_info']['storage/volumes']['records']
+        assert [record['uuid'] for record in records] == ['uuid1', 'uuid2', 'uuid4', 'uuid5', 'uuid6']
+        assert records[0]['size'] == 100
+        assert records[1]['state'] == 'offline'
+        assert exc.value.args[0]['ontap_info']['storage/volumes']['num_records'] == 5
+        assert exc.value.args[0]['incremental_summary'] == {
+            'storage/volumes': dict(added=['uuid6'], changed=['uuid2'], removed=['uuid3'], fetched=2)}
+        assert len(calls) == 2
+        assert calls[1]['uuid'] == 'uuid6|uuid2'
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_incremental_not_a_collection(self, mock_request):
+        ''' subsets without a key are fully downloaded '''
+        mock_request.side_effect = [
+            SRR['validate_ontap_version_pass'],
+            copy.deepcopy(SRR['get_subset_info']),      # light listing, no uuid
+            copy.deepcopy(SRR['get_subset_info']),      # full listing
+        ]
+        args = self.set_default_args()
+        args['gather_subset'] = ['volume_info']
+        args['incremental'] = dict(snapshot_dir=self.snapshot_dir())
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            ontap_rest_info_module().apply()
+        assert exc.value.args[0]['ontap_info']['storage/volumes']['num_records'] == 3
+        assert exc.value.args[0]['incremental_summary'] == dict()
+        assert mock_request.call_count == 3
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_profile_and_subset_fields_pass(self, mock_request):
+        ''' each subset is collected with its own fields '''
+        fields = dict()
+
+        def mock_send_request(method, api, params, **kwargs):
+            if api == 'cluster':
+                return SRR['validate_ontap_version_pass']
+            fields[api] = params['fields']
+            return copy.deepcopy(SRR['get_subset_info'])
+
+        mock_request.side_effect = mock_send_request
+        args = self.set_default_args()
+        args['gather_subset'] = ['aggregate_info', 'volume_info', 'storage/luns', 'cluster/software']
+        args['profile'] = 'minimal'
+        args['subset_fields'] = {'storage_luns_info': ['uuid', 'serial_number'], 'volume_info': 'name,size'}
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            ontap_rest_info_module().apply()
+        assert set(exc.value.args[0]['ontap_info']) == set(['storage/aggregates', 'storage/volumes', 'storage/luns', 'cluster/software'])
+        assert fields == {
+            'storage/aggregates': 'uuid,name,node.name',
+            'storage/volumes': 'name,size',
+            'storage/luns': 'uuid,serial_number',
+            # no curated profile
+            'cluster/software': [],
+        }
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_profile_full_pass(self, mock_request):
+        ''' full profile requests all fields, unless fields is set '''
+        mock_request.side_effect = [
+            SRR['validate_ontap_version_pass'],
+            copy.deepcopy(SRR['get_subset_info']),
+            copy.deepcopy(SRR['get_subset_info']),
+        ]
+        args = self.set_default_args()
+        args['gather_subset'] = ['aggregate_info', 'cluster/software']
+        args['profile'] = 'full'
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson):
+            ontap_rest_info_module().apply()
+        assert [call[0][2]['fields'] for call in mock_request.call_args_list[1:]] == ['*', '*']
+
+    def test_subset_fields_fail(self):
+        ''' subset_fields keys must be gathered '''
+        args = self.set_default_args()
+        args['gather_subset'] = ['aggregate_info']
+        args['subset_fields'] = {'volume_info': ['name']}
+        set_module_args(args)
+        my_obj = ontap_rest_info_module()
+        my_obj.validate_ontap_version = lambda: None
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == 'Error: subset_fields: volume_info is not in gather_subset.'
+
+    @patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.OntapRestAPI.send_request')
+    def test_max_records_limit_pass(self, mock_request):
+        ''' page size doubles for each following page, up to max_records_limit '''
+        def page(next_href):
+            links = {'self': {'href': 'dummy_href'}}
+            if next_href:
+                links['next'] = {'href': next_href}
+            return 200, {'_links': links, 'num_records': 1, 'records': [{'name': 'dummy_vol1'}]}, None
+
+        mock_request.side_effect = [
+            SRR['validate_ontap_version_pass'],
+            page('/api/storage/volumes?start.uuid=1&fields=name&max_records=1024'),
+            page('/api/storage/volumes?start.uuid=2&fields=name&max_records=2048'),
+            page('/api/storage/volumes?start.uuid=3&fields=name&max_records=3000'),
+            page('/api/storage/volumes?start.uuid=4&fields=name&max_records=3000'),
+            page(None),
+        ]
+        args = self.set_default_args()
+        args['gather_subset'] = ['volume_info']
+        args['max_records_limit'] = 3000
+        set_module_args(args)
+        with pytest.raises(AnsibleExitJson) as exc:
+            ontap_rest_info_module().apply()
+        assert exc.value.args[0]['ontap_info']['storage/volumes']['num_records'] == 5
+        assert [call[0][1] for call in mock_request.call_args_list[2:]] == [
+            'storage/volumes?start.uuid=1&fields=name&max_records=2048',
+            'storage/volumes?start.uuid=2&fields=name&max_records=3000',
+            'storage/volumes?start.uuid=3&fields=name&max_records=3000',
+            'storage/volumes?start.uuid=4&fields=name&max_records=3000',
+        ]
+
+    def test_snapshot_dir_is_private(self):
+        ''' the default directory is created for the current user only, a directory accessible to other users is not used '''
+        args = self.set_default_args()
+        args['incremental'] = dict()
+        set_module_args(args)
+        my_obj = ontap_rest_info_module()
+        tempdir = self.snapshot_dir()
+        with patch('tempfile.gettempdir', return_value=tempdir):
+            assert my_obj.get_snapshot_path('volume_info') == (None, None)
+            my_obj.write_snapshot('volume_info', dict(uuid1=dict(name='vol1')), dict(uuid1=dict()))
+            snapshot_dir, dummy = my_obj.get_snapshot_path('volume_info')
+            assert snapshot_dir == os.path.join(tempdir, 'ansible_netapp_ontap_cache', 'rest_info')
+            assert os.stat(snapshot_dir).st_mode & 0o777 == 0o700
+            assert my_obj.read_snapshot('volume_info') == (dict(uuid1=dict(name='vol1')), dict(uuid1=dict()))
+            os.chmod(os.path.join(tempdir, 'ansible_netapp_ontap_cache'), 0o755)
+            assert my_obj.read_snapshot('volume_info') == (dict(), dict())
+        my_obj.parameters['incremental']['snapshot_dir'] = snapshot_dir
+        assert my_obj.read_snapshot('volume_info')[0]
+        with patch('os.getuid', return_value=os.getuid() + 1):
+            assert my_obj.read_snapshot('volume_info') == (dict(), dict())
+
+    def snapshot_dir(self):
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        return snapshot_dir
@@ -0,0 +1,192 @@
+# (c) 2021, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for ONTAP Ansible module: na_ontap_restit '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch
+
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_restit \
+    import NetAppONTAPRestAPI as my_module  # module under test
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+# using pytest natively, without unittest.TestCase
+@pytest.fixture
+def patch_ansible():
+    with patch.multiple(basic.AnsibleModule,
+                        exit_json=exit_json,
+                        fail_json=fail_json) as mocks:
+        yield mocks
+
+
+def job(uuid):
+    return dict(job=dict(uuid=uuid, _links=dict(self=dict(href='/api/cluster/jobs/%s' % uuid))))
+
+
+class MockRestAPI(object):
+    ''' responses by api, records the calls, the order of calls is only checked with a single worker '''
+
+    def __init__(self, responses=None, jobs=None):
+        self.responses = responses or dict()
+        self.jobs = jobs or dict()
+        self.calls = list()
+
+    def send_request(self, method, api, params, json=None, accept=None, vserver_name=None, vserver_uuid=None):
+        self.calls.append((method, api, params, json, vserver_name))
+        if api == 'cluster/jobs':
+            records = [dict(uuid=uuid, state=self.jobs.get(uuid, 'success'), message='job %s' % uuid) for uuid in params['uuid'].split('|')]
+            return 200, dict(records=records), None
+        return self.responses.get(api, (200, dict(records=[]), None))
+
+
+def default_args():
+    return {
+        'hostname': 'hostname',
+        'username': 'username',
+        'password': 'password',
+    }
+
+
+def run_module(args, mock_rest):
+    set_module_args(args)
+    my_obj = my_module()
+    with patch.object(my_obj.rest_api, 'send_request', side_effect=mock_rest.send_request), patch('time.sleep'):
+        my_obj.apply()
+
+
+def test_single_request(patch_ansible):
+    mock_rest = MockRestAPI({'cluster/software': (200, dict(version='9.8'), None)})
+    with pytest.raises(AnsibleExitJson) as exc:
+        run_module(dict(default_args(), api='cluster/software', query=dict(fields='version')), mock_rest)
+    assert exc.value.args[0]['response'] == dict(version='9.8')
+    assert exc.value.args[0]['status_code'] == 200
+    assert mock_rest.calls == [('GET', 'cluster/software', dict(fields='version'), None, None)]
+
+
+def test_single_request_error(patch_ansible):
+    mock_rest = MockRestAPI({'unknown/endpoint': (404, None, dict(message='not found', code='4'))})
+    with pytest.raises(AnsibleFailJson) as exc:
+        run_module(dict(default_args(), api='unknown/endpoint'), mock_rest)
+    assert exc.value.args[0]['msg'] == "Error when calling 'unknown/endpoint': check error_message and error_code for details."
+    assert exc.value.args[0]['error_message'] == 'not found'
+    assert exc.value.args[0]['error_code'] == '4'
+
+
+def test_requests(patch_ansible):
+    ''' top level options are used as defaults, responses are reported in order '''
+    mock_rest = MockRestAPI({'storage/volumes/uuid2': (202, job('job2'), None)})
+    requests = [dict(api='storage/volumes/uuid%d' % index) for index in range(3)]
+    requests.append(dict(api='storage/volumes', method='GET', body=None, query=dict(fields='qos'), vserver_name='svm2'))
+    args = dict(default_args(), requests=requests, method='PATCH', body=dict(qos=dict(policy=dict(name='gold'))), vserver_name='svm1')
+    with pytest.raises(AnsibleExitJson) as exc:
+        run_module(args, mock_rest)
+    assert exc.value.args[0]['changed']
+    responses = exc.value.args[0]['responses']
+    assert [(response['api'], response['method'], response['status']) for response in responses] == \
+        [('storage/volumes/uuid%d' % index, 'PATCH', 'passed') for index in range(3)] + [('storage/volumes', 'GET', 'passed')]
+    assert responses[2]['job'] == dict(uuid='job2', state='success', message='job job2')
+    assert mock_rest.calls[:4] == [('PATCH', 'storage/volumes/uuid%d' % index, None, args['body'], 'svm1') for index in range(3)] + \
+        [('GET', 'storage/volumes', dict(fields='qos'), args['body'], 'svm2')]
+    # the job is polled at the end
+    assert mock_rest.calls[4][1] == 'cluster/jobs'
+
+
+def test_requests_barrier(patch_ansible):
+    ''' jobs are waited on at each barrier, and polled together '''
+    responses = dict(('storage/volumes/uuid%d' % index, (202, job('job%d' % index), None)) for index in range(4))
+    mock_rest = MockRestAPI(responses)
+    requests = [dict(api='storage/volumes/uuid%d' % index) for index in range(4)]
+    requests[2]['barrier'] = True
+    with pytest.raises(AnsibleExitJson) as exc:
+        run_module(dict(default_args(), requests=requests, method='PATCH', max_concurrency=4), mock_rest)
+    assert [response['status'] for response in exc.value.args[0]['responses']] == ['passed'] * 4
+    apis = [call[1] for call in mock_rest.calls]
+    assert sorted(apis[:2]) == ['storage/volumes/uuid0', 'storage/volumes/uuid1']
+    assert apis[2] == 'cluster/jobs'
+    assert mock_rest.calls[2][2]['uuid'] == 'job0|job1'
+    assert sorted(apis[3:5]) == ['storage/volumes/uuid2', 'storage/volumes/uuid3']
+    assert apis[5] == 'cluster/jobs'
+    assert len(apis) == 6
+
+
+def test_requests_stop_on_error(patch_ansible):
+    mock_rest = MockRestAPI({'storage/volumes/uuid1': (400, None, dict(message='invalid', code='262179'))})
+    requests = [dict(api='storage/volumes/uuid%d' % index) for index in range(3)]
+    with pytest.raises(AnsibleFailJson) as exc:
+        run_module(dict(default_args(), requests=requests, method='PATCH'), mock_rest)
+    assert exc.value.args[0]['msg'] == 'Error: 1 of 3 requests failed, check status, error_message and error_code in responses.'
+    assert exc.value.args[0]['changed']
+    responses = exc.value.args[0]['responses']
+    assert [response['status'] for response in responses] == ['passed', 'failed', 'skipped']
+    assert responses[1]['error_message'] == 'invalid'
+    assert responses[1]['error_code'] == '262179'
+    assert responses[2] == dict(api='storage/volumes/uuid2', method='PATCH', status='skipped')
+    assert len(mock_rest.calls) == 2
+
+
+def test_requests_job_failure(patch_ansible):
+    ''' a failed job stops at the next barrier, unless continue_on_error is set '''
+    mock_rest = MockRestAPI({'storage/volumes/uuid0': (202, job('job0'), None)}, jobs=dict(job0='failure'))
+    requests = [dict(api='storage/volumes/uuid0'), dict(api='storage/volumes/uuid1', barrier=True)]
+    with pytest.raises(AnsibleFailJson) as exc:
+        run_module(dict(default_args(), requests=requests, method='DELETE'), mock_rest)
+    responses = exc.value.args[0]['responses']
+    assert [response['status'] for response in responses] == ['failed', 'skipped']
+    assert responses[0]['error_message'] == 'job job0'
+    assert not exc.value.args[0]['changed']
+    mock_rest = MockRestAPI({'storage/volumes/uuid0': (202, job('job0'), None)}, jobs=dict(job0='failure'))
+    with pytest.raises(AnsibleFailJson) as exc:
+        run_module(dict(default_args(), requests=requests, method='DELETE', continue_on_error=True), mock_rest)
+    assert [response['status'] for response in exc.value.args[0]['responses']] == ['failed', 'passed']
+
+
+def test_requests_no_wait(patch_ansible):
+    mock_rest = MockRestAPI({'storage/volumes/uuid0': (202, job('job0'), None)})
+    with pytest.raises(AnsibleExitJson) as exc:
+        run_module(dict(default_args(), requests=[dict(api='storage/volumes/uuid0')], method='DELETE', wait_for_completion=False), mock_rest)
+    assert 'job' not in exc.value.args[0]['responses'][0]
+    assert len(mock_rest.calls) == 1
+
+
+def test_requests_options(patch_ansible):
+    set_module_args(dict(default_args(), api='cluster', requests=[dict(api='cluster')]))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_module()
+    assert exc.value.args[0]['msg'] == 'parameters are mutually exclusive: api|requests'
+    set_module_args(default_args())
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_module()
+    assert exc.value.args[0]['msg'] == 'one of the following is required: api, requests'
@@ -70,19 +70,54 @@ class MockONTAPConnection(object):
         self.parm = parm
         self.status = status
         self.quiesce_status = quiesce_status
+        self.zapis = list()
 
     def invoke_successfully(self, xml, enable_tunneling):  # pylint: disable=unused-argument
         ''' mock invoke_successfully returning xml data '''
         self.xml_in = xml
-        if self.type == 'snapmirror':
+        if self.type == 'snapmirror_multi':
+            # parm is a list of {destination: snapmirror-info} dicts, returned in order for each snapmirror-get-iter
+            # the last one is repeated.  Other ZAPIs are recorded in zapis.
+            if xml.get_name() == 'snapmirror-get-iter':
+                destinations = xml.get_child_by_name('query').get_child_by_name('snapmirror-info').get_child_content('destination-location')
+                infos = self.parm.pop(0) if len(self.parm) > 1 else self.parm[0]
+                xml = self.build_snapmirror_records([dict(info, **{'destination-location': destination})
+                                                     for destination, info in sorted(infos.items())
+                                                     if destination in destinations.split('|')])
+            else:
+                self.zapis.append((xml.get_name(), xml.get_child_content('destination-location')))
+                if self.status == 'fail_' + xml.get_name():
+                    raise netapp_utils.zapi.NaApiError(code='TEST', message="This exception is from the unit test")
+                xml = self.build_snapmirror_records([])
+        elif self.type == 'snapmirror':
             xml = self.build_snapmirror_info(self.parm, self.status, self.quiesce_status)
+        elif self.type == 'snapmirror_sequence':
+            # parm is a list of snapmirror-info dicts, returned in order for each snapmirror-get-iter
+            # the last one is repeated
+            if xml.get_name() == 'snapmirror-get-iter':
+                info = self.parm.pop(0) if len(self.parm) > 1 else self.parm[0]
+                xml = self.build_snapmirror_info(info.get('mirror-state'), info.get('relationship-status'), self.quiesce_status, info)
+            else:
+                xml = self.build_snapmirror_info(None, None, self.quiesce_status)
         elif self.type == 'snapmirror_fail':
             raise netapp_utils.zapi.NaApiError(code='TEST', message="This exception is from the unit test")
         self.xml_out = xml
         return xml
 
     @staticmethod
-    def build_snapmirror_info(mirror_state, status, quiesce_status):
+    def build_snapmirror_records(infos):
+        ''' build xml data for several snapmirror-info records '''
+        xml = netapp_utils.zapi.NaElement('xml')
+        attributes = netapp_utils.zapi.NaElement('attributes-list')
+        for info in infos:
+            attributes.translate_struct({'snapmirror-info': dict({'relationship-type': 'data_protection', 'schedule': None}, **info)})
+        xml.add_child_elem(attributes)
+        xml.add_new_child('num-records', str(len(infos)))
+        xml.add_new_child('status', 'passed')
+        return xml
+
+    @staticmethod
+    def build_snapmirror_info(mirror_state, status, quiesce_status, extra_info=None):
         ''' build xml data for snapmirror-entry '''
         xml = netapp_utils.zapi.NaElement('xml')
         data = {'num-records': 1,
@@ -94,6 +129,8 @@ class MockONTAPConnection(object):
                                                         'max-transfer-rate': 1000,
                                                         'identity-preserve': 'true'},
                                     'snapmirror-destination-info': {'destination-location': 'ansible'}}}
+        if extra_info:
+            data['attributes-list']['snapmirror-info'].update(extra_info)
         xml.translate_struct(data)
         return xml
 
@@ -489,6 +526,253 @@ class TestMyModule(unittest.TestCase):
             my_obj.apply()
         assert exc.value.args[0]['changed']
 
+    def test_wait_for_transfer_initialize(self):
+        ''' initialize snapmirror and wait for the baseline transfer, polling with exponential backoff '''
+        data = self.set_default_args()
+        data['wait_for_transfer'] = True
+        data['update'] = False
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        states = [
+            {'mirror-state': 'uninitialized', 'relationship-status': 'idle'},       # apply
+            {'mirror-state': 'uninitialized', 'relationship-status': 'idle'},       # initialize
+            {'mirror-state': 'uninitialized', 'relationship-status': 'transferring', 'snapshot-progress': 1000},
+            {'mirror-state': 'uninitialized', 'relationship-status': 'transferring', 'snapshot-progress': 3000},
+            {'mirror-state': 'snapmirrored', 'relationship-status': 'idle', 'last-transfer-size': 4000},
+        ]
+        my_obj.server = MockONTAPConnection('snapmirror_sequence', states)
+        sleep_calls = list()
+        with pytest.raises(AnsibleExitJson) as exc:
+            with patch('time.sleep', sleep_calls.append):
+                my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['actions'] == ['initialize']
+        assert sleep_calls == [1, 2]
+        stats = exc.value.args[0]['transfer_stats']
+        assert stats['bytes_transferred'] == 4000
+        assert stats['poll_count'] == 3
+        assert stats['elapsed_time'] == 3
+        assert stats['eta'] == 0
+
+    def test_wait_for_transfer_update_uses_eta(self):
+        ''' update snapmirror and wait for the transfer, next poll is based on the rate and the last transfer size '''
+        data = self.set_default_args()
+        data['wait_for_transfer'] = True
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        last_transfer = {'last-transfer-size': 100000, 'last-transfer-duration': 100, 'last-transfer-end-timestamp': 1000}
+        states = [
+            dict(last_transfer, **{'mirror-state': 'snapmirrored', 'relationship-status': 'idle'}),     # apply
+            dict(last_transfer, **{'mirror-state': 'snapmirrored', 'relationship-status': 'idle'}),     # update
+            dict(last_transfer, **{'mirror-state': 'snapmirrored', 'relationship-status': 'idle'}),     # not started
+            dict(last_transfer, **{'mirror-state': 'snapmirrored', 'relationship-status': 'transferring', 'snapshot-progress': 50000}),
+            {'mirror-state': 'snapmirrored', 'relationship-status': 'idle', 'last-transfer-size': 100000,
+             'last-transfer-duration': 60, 'last-transfer-end-timestamp': 1060},
+        ]
+        my_obj.server = MockONTAPConnection('snapmirror_sequence', states)
+        sleep_calls = list()
+        with pytest.raises(AnsibleExitJson) as exc:
+            with patch('time.sleep', sleep_calls.append):
+                my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['actions'] == ['update']
+        # first poll: transfer not started, backoff; second poll: 50000 bytes left at 1000 bytes/s, ETA is 50 seconds
+        assert sleep_calls == [1, 50]
+        stats = exc.value.args[0]['transfer_stats']
+        assert stats['bytes_transferred'] == 100000
+        assert stats['poll_count'] == 3
+
+    def test_wait_for_transfer_timeout(self):
+        ''' transfer does not complete within transfer_timeout '''
+        data = self.set_default_args()
+        data['wait_for_transfer'] = True
+        data['transfer_timeout'] = 10
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        states = [
+            {'mirror-state': 'uninitialized', 'relationship-status': 'idle'},
+            {'mirror-state': 'uninitialized', 'relationship-status': 'idle'},
+            {'mirror-state': 'uninitialized', 'relationship-status': 'transferring', 'snapshot-progress': 1000},
+        ]
+        my_obj.server = MockONTAPConnection('snapmirror_sequence', states)
+        sleep_calls = list()
+        with pytest.raises(AnsibleFailJson) as exc:
+            with patch('time.sleep', sleep_calls.append):
+                my_obj.apply()
+        assert exc.value.args[0]['msg'] == 'Error: timeout waiting for SnapMirror transfer to complete after 10 seconds.'
+        assert sleep_calls == [1, 2, 4, 3]
+        assert exc.value.args[0]['transfer_stats']['elapsed_time'] == 10
+
+    def test_quiesce_wait_timeout(self):
+        ''' quiesce is bounded by wait_timeout '''
+        data = self.set_default_args()
+        data['relationship_state'] = 'broken'
+        data['wait_timeout'] = 5
+        set_module_args(data)
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        my_obj.server = MockONTAPConnection('snapmirror', 'snapmirrored', status='idle', quiesce_status='InProgress')
+        sleep_calls = list()
+        with pytest.raises(AnsibleFailJson) as exc:
+            with patch('time.sleep', sleep_calls.append):
+                my_obj.apply()
+        assert 'Taking a long time to Quiescing SnapMirror, try again later' in exc.value.args[0]['msg']
+        assert sleep_calls == [1, 2, 2]
+
+    def set_relationships_args(self, relationships, **kwargs):
+        data = self.set_default_args()
+        for option in ('source_path', 'destination_path', 'source_vserver', 'destination_vserver'):
+            del data[option]
+        data['relationships'] = relationships
+        data.update(kwargs)
+        return data
+
+    def test_relationships_break_resync_resume_update(self):
+        ''' relationships are read with a single query, breaks share a single quiesce wait '''
+        relationships = [
+            dict(destination_path='svm:vol1', relationship_state='broken'),
+            dict(destination_path='svm:vol2'),
+            dict(destination_path='svm:vol3'),
+            dict(destination_path='svm:vol4', relationship_state='broken'),
+        ]
+        set_module_args(self.set_relationships_args(relationships))
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        before = {
+            'svm:vol1': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle'},
+            'svm:vol2': {'mirror-state': 'broken-off', 'relationship-status': 'idle'},
+            'svm:vol3': {'mirror-state': 'snapmirrored', 'relationship-status': 'quiesced'},
+            'svm:vol4': {'mirror-state': 'broken-off', 'relationship-status': 'idle'},
+        }
+        quiescing = dict(before, **{'svm:vol1': {'mirror-state': 'snapmirrored', 'relationship-status': 'quiescing'}})
+        quiesced = dict(before, **{'svm:vol1': {'mirror-state': 'snapmirrored', 'relationship-status': 'quiesced'}})
+        after = {
+            'svm:vol1': {'mirror-state': 'broken-off', 'relationship-status': 'idle'},
+            'svm:vol2': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle'},
+            'svm:vol3': {'mirror-state': 'snapmirrored', 'relationship-status': 'transferring'},
+            'svm:vol4': {'mirror-state': 'broken-off', 'relationship-status': 'idle'},
+        }
+        my_obj.server = MockONTAPConnection('snapmirror_multi', [before, quiescing, quiesced, after])
+        sleep_calls = list()
+        with pytest.raises(AnsibleExitJson) as exc:
+            with patch('time.sleep', sleep_calls.append):
+                my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert my_obj.server.zapis == [
+            ('snapmirror-quiesce', 'svm:vol1'),
+            ('snapmirror-break', 'svm:vol1'),
+            ('snapmirror-resume', 'svm:vol3'),
+            ('snapmirror-resync', 'svm:vol2'),
+            ('snapmirror-update', 'svm:vol3'),
+        ]
+        assert sleep_calls == [1]
+        assert exc.value.args[0]['relationships'] == [
+            dict(destination_path='svm:vol1', actions=['break'], mirror_state='broken-off', status='idle'),
+            dict(destination_path='svm:vol2', actions=['resync'], mirror_state='snapmirrored', status='idle'),
+            dict(destination_path='svm:vol3', actions=['resume', 'update'], mirror_state='snapmirrored', status='transferring'),
+            dict(destination_path='svm:vol4', actions=[], mirror_state='broken-off', status='idle'),
+        ]
+        assert exc.value.args[0]['transfer_stats'] == dict(bytes_transferred=0, elapsed_time=1, poll_count=2)
+
+    def test_relationships_check_mode(self):
+        ''' actions are reported but not performed '''
+        set_module_args(self.set_relationships_args([dict(destination_path='svm:vol1')], update=False))
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        my_obj.module.check_mode = True
+        before = {'svm:vol1': {'mirror-state': 'uninitialized', 'relationship-status': 'idle'}}
+        my_obj.server = MockONTAPConnection('snapmirror_multi', [before])
+        with pytest.raises(AnsibleExitJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['relationships'] == [
+            dict(destination_path='svm:vol1', actions=['initialize'], mirror_state='uninitialized', status='idle')]
+        assert my_obj.server.zapis == []
+
+    def test_relationships_wait_for_transfers_concurrently(self):
+        ''' transfers are started from a pool of workers, and waited on together '''
+        relationships = [dict(destination_path='svm:vol%d' % index) for index in range(1, 4)]
+        set_module_args(self.set_relationships_args(relationships, wait_for_transfer=True, max_concurrency=2))
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        before = dict(('svm:vol%d' % index, {'mirror-state': 'snapmirrored', 'relationship-status': 'idle',
+                                             'last-transfer-end-timestamp': 1000, 'last-transfer-size': 10})
+                      for index in range(1, 4))
+        transferring = dict(before, **{'svm:vol2': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle',
+                                                    'last-transfer-end-timestamp': 1010, 'last-transfer-size': 200},
+                                       'svm:vol3': {'mirror-state': 'snapmirrored', 'relationship-status': 'transferring',
+                                                    'last-transfer-end-timestamp': 1000}})
+        after = {
+            'svm:vol1': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle',
+                         'last-transfer-end-timestamp': 1020, 'last-transfer-size': 100},
+            'svm:vol2': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle',
+                         'last-transfer-end-timestamp': 1010, 'last-transfer-size': 200},
+            'svm:vol3': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle',
+                         'last-transfer-end-timestamp': 1020, 'last-transfer-size': 300},
+        }
+        my_obj.server = MockONTAPConnection('snapmirror_multi', [before, transferring, after])
+        sleep_calls = list()
+        with patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.clone_zapi_server',
+                   wraps=netapp_utils.clone_zapi_server) as mock_clone:
+            with pytest.raises(AnsibleExitJson) as exc:
+                with patch('time.sleep', sleep_calls.append):
+                    my_obj.apply()
+        assert exc.value.args[0]['changed']
+        # one connection per worker thread, rather than per relationship
+        assert 1 <= mock_clone.call_count <= 2
+        assert sorted(my_obj.server.zapis) == [('snapmirror-update', 'svm:vol%d' % index) for index in range(1, 4)]
+        # a single poll for all relationships each time
+        assert sleep_calls == [1]
+        assert exc.value.args[0]['transfer_stats'] == dict(bytes_transferred=600, elapsed_time=1, poll_count=2)
+
+    def test_relationships_errors(self):
+        ''' errors are reported for each relationship, other relationships are processed '''
+        relationships = [
+            dict(destination_path='svm:vol1', relationship_state='broken'),
+            dict(destination_path='svm:vol2'),
+            dict(destination_path='svm:vol3'),
+        ]
+        set_module_args(self.set_relationships_args(relationships))
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        before = {
+            'svm:vol1': {'mirror-state': 'uninitialized', 'relationship-status': 'idle'},
+            'svm:vol3': {'mirror-state': 'snapmirrored', 'relationship-status': 'idle'},
+        }
+        my_obj.server = MockONTAPConnection('snapmirror_multi', [before], status='fail_snapmirror-update')
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        msg = 'Error: failed to apply 3 of 3 relationships: ' \
+              'svm:vol1: SnapMirror relationship cannot be broken if mirror state is uninitialized  ' \
+              'svm:vol2: Error: SnapMirror relationship not found  ' \
+              'svm:vol3: Error calling snapmirror-update: NetApp API failed. Reason - TEST:This exception is from the unit test'
+        assert exc.value.args[0]['msg'] == msg
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['relationships'][1] == dict(destination_path='svm:vol2', actions=[], msg='Error: SnapMirror relationship not found')
+
+    def test_relationships_validation(self):
+        ''' relationships cannot be combined with a single relationship, or be deleted '''
+        data = self.set_relationships_args([dict(destination_path='svm:vol1')], destination_path='svm:vol1')
+        set_module_args(data)
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_module()
+        assert exc.value.args[0]['msg'] == 'parameters are mutually exclusive: relationships|destination_path'
+        set_module_args(self.set_relationships_args([dict(destination_path='svm:vol1'), dict(destination_path='svm:vol1')]))
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == 'Error: duplicate destination_path in relationships: svm:vol1'
+        set_module_args(self.set_relationships_args([dict(destination_path='svm:vol1')], state='absent'))
+        my_obj = my_module()
+        my_obj.asup_log_for_cserver = Mock(return_value=None)
+        with pytest.raises(AnsibleFailJson) as exc:
+            my_obj.apply()
+        assert exc.value.args[0]['msg'] == 'Error: relationships requires state: present, relationships cannot be deleted in this mode.'
+
     def test_elementsw_volume_exists(self):
         ''' elementsw_volume_exists '''
         data = self.set_default_args()
@@ -117,6 +117,7 @@ class MockONTAPConnection(object):
                     'volume-id-attributes': {
                         'containing-aggregate-name': vol_details['aggregate'],
                         'instance-uuid': 'uuid',
+                        'name': vol_details['name'],
                         'junction-path': vol_details['junction_path'],
                         'style-extended': 'flexvol'
                     },
@@ -768,6 +769,7 @@ class TestMyModule(unittest.TestCase):
         with pytest.raises(AnsibleExitJson) as exc:
             obj.apply()
         assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['job_progress'] == [dict(jobid='1234', state='success', progress=['dummy'])]
 
     def test_successful_create_flex_group_auto_provision(self):
         ''' Test successful create flexGroup auto provision '''
@@ -1013,7 +1015,7 @@ class TestMyModule(unittest.TestCase):
         job = 'job_info'
         success = 'success_modify_async'
         mount = 'job_info'  # not correct, but works
-        kind = [online, job, job, success, mount, job, job]
+        kind = [online, job, success, mount, job]
         obj = self.get_volume_mock_object(kind)
         with pytest.raises(AnsibleExitJson) as exc:
             obj.apply()
@@ -1027,6 +1029,7 @@ class TestMyModule(unittest.TestCase):
         obj = self.get_volume_mock_object('job_info', job_error='failure')
         result = obj.check_job_status('123')
         assert result == 'failure'
+        assert obj.job_progress == [dict(jobid='123', state='failure', progress=['dummy'])]
 
     def test_check_job_status_time_out_is_0(self):
         ''' Test check job status time out is 0'''
@@ -1035,7 +1038,7 @@ class TestMyModule(unittest.TestCase):
         set_module_args(data)
         obj = self.get_volume_mock_object('job_info', job_error='time_out')
         result = obj.check_job_status('123')
-        assert result == 'job completion exceeded expected timer of: 0 seconds'
+        assert result == 'job completion exceeded expected timer of: 0 seconds, last progress: dummy'
 
     def test_check_job_status_unexpected(self):
         ''' Test check job status unexpected state '''
@@ -1046,6 +1049,7 @@ class TestMyModule(unittest.TestCase):
         with pytest.raises(AnsibleFailJson) as exc:
             obj.check_job_status('123')
         assert exc.value.args[0]['failed']
+        assert exc.value.args[0]['job_progress'] == [dict(jobid='123', state='other', progress=['dummy'])]
 
     def test_error_set_efficiency_policy(self):
         data = self.mock_args()
@@ -1224,3 +1228,102 @@ class TestMyModule(unittest.TestCase):
             self.get_volume_mock_object('flexgroup').apply()
         msg = 'Error: aggregate_name option cannot be used with FlexGroups.'
         assert msg == exc.value.args[0]['msg']
+
+    def batch_args(self, volumes, max_concurrency=1):
+        args = self.mock_args()
+        del args['name']
+        args['volumes'] = volumes
+        args['max_concurrency'] = max_concurrency
+        return args
+
+    def test_batch_create_and_idempotency(self):
+        ''' existing volumes are read with a single query, missing volumes are created '''
+        set_module_args(self.batch_args([dict(name='test_vol'), dict(name='new_vol', size=40)]))
+        obj = self.get_volume_mock_object(['volume', None])
+        requests = self.record_requests(obj.server)
+        with pytest.raises(AnsibleExitJson) as exc:
+            obj.apply()
+        assert exc.value.args[0]['changed']
+        results = exc.value.args[0]['volumes']
+        assert results == [dict(name='test_vol', changed=False), dict(name='new_vol', changed=True)]
+        assert [request.get_name() for request in requests] == ['volume-get-iter', 'sis-get-iter', 'volume-create', 'volume-get-iter']
+        assert requests[2].get_child_content('volume') == 'new_vol'
+        assert requests[2].get_child_content('size') == str(40 * 1024 ** 2)
+
+    @staticmethod
+    def record_requests(server):
+        requests = list()
+        invoke = server.invoke_successfully
+
+        def record_request(xml, enable_tunneling):
+            requests.append(xml)
+            return invoke(xml, enable_tunneling)
+        server.invoke_successfully = record_request
+        return requests
+
+    def test_batch_query(self):
+        ''' a single volume-get-iter and a single sis-get-iter for all volumes '''
+        set_module_args(self.batch_args([dict(name='test_vol'), dict(name='vol2')]))
+        obj = self.get_volume_mock_object('volume')
+        requests = self.record_requests(obj.server)
+        records = obj.get_volumes(['test_vol', 'vol2'])
+        assert list(records) == ['test_vol']
+        assert obj.get_sis_records(['/vol/test_vol', '/vol/vol2'])[0].get_child_content('policy') == 'testme'
+        assert len(requests) == 2
+        requests = [request.to_string().decode('utf-8') for request in requests]
+        assert '<name>test_vol|vol2</name>' in requests[0]
+        assert '<max-records>2</max-records>' in requests[0]
+        assert '<path>/vol/test_vol|/vol/vol2</path>' in requests[1]
+
+    def test_batch_error_is_reported_per_volume(self):
+        ''' an error on one volume does not stop the other volumes '''
+        set_module_args(self.batch_args([dict(name='new_vol'), dict(name='test_vol', state='absent')]))
+        obj = self.get_volume_mock_object(['volume', 'zapi_error', 'volume'])
+        with pytest.raises(AnsibleFailJson) as exc:
+            obj.apply()
+        msg = 'Error: failed to apply 1 of 2 volumes: new_vol: Error provisioning volume new_vol of size 20971520: NetApp API failed. Reason - test:error'
+        assert exc.value.args[0]['msg'] == msg
+        assert exc.value.args[0]['changed']
+        results = exc.value.args[0]['volumes']
+        assert results[0]['failed']
+        assert results[1] == dict(name='test_vol', changed=True)
+
+    def test_batch_concurrent_delete(self):
+        ''' volumes are processed by concurrent workers, each worker thread with its own connections '''
+        names = ['test_vol'] + ['vol%d' % index for index in range(2, 7)]
+        set_module_args(self.batch_args([dict(name=name, state='absent') for name in names], max_concurrency=2))
+        obj = self.get_volume_mock_object('volume')
+        with patch('ansible_collections.netapp.ontap.plugins.module_utils.netapp.clone_zapi_server', wraps=netapp_utils.clone_zapi_server) as mock_clone:
+            with pytest.raises(AnsibleExitJson) as exc:
+                obj.apply()
+        assert exc.value.args[0]['changed']
+        assert exc.value.args[0]['volumes'] == [dict(name='test_vol', changed=True)] + [dict(name=name, changed=False) for name in names[1:]]
+        # server and cluster connections, for at most 2 threads
+        assert 2 <= mock_clone.call_count <= 4
+
+    def test_batch_duplicate_names(self):
+        set_module_args(self.batch_args([dict(name='test_vol'), dict(name='test_vol', size=10)]))
+        with pytest.raises(AnsibleFailJson) as exc:
+            self.get_volume_mock_object('volume').apply()
+        assert exc.value.args[0]['msg'] == 'Error: duplicate volume names in volumes: test_vol'
+
+    def test_batch_name_and_volumes_are_exclusive(self):
+        args = self.batch_args([dict(name='test_vol')])
+        args['name'] = 'test_vol'
+        set_module_args(args)
+        with pytest.raises(AnsibleFailJson) as exc:
+            self.get_volume_mock_object('volume')
+        assert exc.value.args[0]['msg'] == 'parameters are mutually exclusive: name|volumes'
+
+    def test_batch_volume_parameters(self):
+        ''' options set for a volume override the options set for the task '''
+        set_module_args(self.batch_args([dict(name='vol1', size_unit='gb'), dict(name='vol2', size=1, size_unit='tb', comment='vol2')]))
+        obj = self.get_volume_mock_object('volume')
+        params = obj.get_volume_parameters(obj.parameters['volumes'][0])
+        assert params['name'] == 'vol1'
+        assert params['size'] == 20 * 1024 ** 3
+        assert 'volumes' not in params
+        params = obj.get_volume_parameters(obj.parameters['volumes'][1])
+        assert params['size'] == 1024 ** 4
+        assert params['comment'] == 'vol2'
+        assert params['vserver'] == 'test_vserver'
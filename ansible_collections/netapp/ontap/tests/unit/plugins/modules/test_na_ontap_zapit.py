@@ -0,0 +1,201 @@
+# (c) 2021, NetApp, Inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+''' unit tests for ONTAP Ansible module: na_ontap_zapit '''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+import pytest
+
+from ansible_collections.netapp.ontap.tests.unit.compat.mock import patch, Mock
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+import ansible_collections.netapp.ontap.plugins.module_utils.netapp as netapp_utils
+
+from ansible_collections.netapp.ontap.plugins.modules.na_ontap_zapit \
+    import NetAppONTAPZapi as my_module  # module under test
+
+if not netapp_utils.has_netapp_lib():
+    pytestmark = pytest.mark.skip('skipping as missing required netapp_lib')
+
+
+def set_module_args(args):
+    """prepare arguments so that they will be picked up during module creation"""
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)  # pylint: disable=protected-access
+
+
+class AnsibleExitJson(Exception):
+    """Exception class to be raised by module.exit_json and caught by the test case"""
+
+
+class AnsibleFailJson(Exception):
+    """Exception class to be raised by module.fail_json and caught by the test case"""
+
+
+def exit_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over exit_json; package return data into an exception"""
+    if 'changed' not in kwargs:
+        kwargs['changed'] = False
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):  # pylint: disable=unused-argument
+    """function to patch over fail_json; package return data into an exception"""
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+# using pytest natively, without unittest.TestCase
+@pytest.fixture
+def patch_ansible():
+    with patch.multiple(basic.AnsibleModule,
+                        exit_json=exit_json,
+                        fail_json=fail_json) as mocks:
+        yield mocks
+
+
+class MockONTAPConnection(object):
+    ''' mock server connection to ONTAP host, records the ZAPI names '''
+
+    def __init__(self):
+        self.zapis = list()
+
+    def invoke_elem(self, xml, enable_tunneling):  # pylint: disable=unused-argument
+        ''' mock invoke_elem returning xml data '''
+        zapi = xml.get_name()
+        self.zapis.append(zapi)
+        if zapi == 'connection-error':
+            raise netapp_utils.zapi.NaApiError('Unexpected error', 'connection refused')
+        xml = netapp_utils.zapi.NaElement('results')
+        if zapi == 'failed-zapi':
+            xml.add_attr('status', 'failed')
+            xml.add_attr('errno', '13005')
+            xml.add_attr('reason', 'Unable to find API: failed-zapi')
+        else:
+            xml.add_attr('status', 'passed')
+            xml.add_node_with_children('version-tuple', **{'generation': '9', 'major': '8'})
+            list_elem = netapp_utils.zapi.NaElement('aggr-list')
+            for aggr in ('aggr1', 'aggr2'):
+                list_elem.add_new_child('aggr-name', aggr)
+            xml.add_child_elem(list_elem)
+            xml.add_new_child('comment', None)
+        return xml
+
+
+def default_args():
+    return {
+        'hostname': 'hostname',
+        'username': 'username',
+        'password': 'password',
+        'vserver': 'vserver',
+    }
+
+
+def get_zapit_mock_object(args):
+    set_module_args(args)
+    my_obj = my_module()
+    my_obj.server = MockONTAPConnection()
+    my_obj.ems = Mock()
+    return my_obj
+
+
+RESPONSE = {'version-tuple': {'generation': '9', 'major': '8'}, 'aggr-list': {'aggr-name': ['aggr1', 'aggr2']}, 'comment': None}
+
+
+def test_single_zapi(patch_ansible):
+    my_obj = get_zapit_mock_object(dict(default_args(), zapi={'system-get-version': None}))
+    with pytest.raises(AnsibleExitJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['changed']
+    assert exc.value.args[0]['response'] == RESPONSE
+
+
+def test_single_zapi_failed(patch_ansible):
+    my_obj = get_zapit_mock_object(dict(default_args(), zapi={'failed-zapi': None}))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['status'] == 'failed'
+    assert exc.value.args[0]['errno'] == '13005'
+    assert exc.value.args[0]['reason'] == 'Unable to find API: failed-zapi'
+    assert exc.value.args[0]['response'] == dict()
+
+
+def test_single_zapi_errors(patch_ansible):
+    my_obj = get_zapit_mock_object(dict(default_args(), zapi={'system-get-version': None, 'vserver-get-iter': None}))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['msg'].startswith('A single ZAPI can be called at a time, received:')
+    my_obj = get_zapit_mock_object(dict(default_args(), zapi={'connection-error': None}))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['msg'] == 'Error running zapi connection-error: NetApp API failed. Reason - Unexpected error:connection refused'
+
+
+def test_zapis(patch_ansible):
+    ''' the zapis are called in order, with a single EMS event '''
+    zapis = [{'system-get-version': None}, {'vserver-get-iter': {'query': {'vserver-info': {'vserver-name': 'svm1'}}}}, {'cluster-identity-get': None}]
+    my_obj = get_zapit_mock_object(dict(default_args(), zapis=zapis))
+    with pytest.raises(AnsibleExitJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['changed']
+    assert exc.value.args[0]['responses'] == [dict(zapi=zapi, status='passed', response=RESPONSE)
+                                              for zapi in ('system-get-version', 'vserver-get-iter', 'cluster-identity-get')]
+    assert my_obj.server.zapis == ['system-get-version', 'vserver-get-iter', 'cluster-identity-get']
+    my_obj.ems.assert_called_once_with('cluster-identity-get,system-get-version,vserver-get-iter')
+
+
+def test_zapis_stop_on_error(patch_ansible):
+    zapis = [{'system-get-version': None}, {'failed-zapi': None}, {'cluster-identity-get': None}]
+    my_obj = get_zapit_mock_object(dict(default_args(), zapis=zapis))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['msg'] == 'ZAPI failure: check status, errno and reason in responses.'
+    assert exc.value.args[0]['changed']
+    assert exc.value.args[0]['responses'] == [
+        dict(zapi='system-get-version', status='passed', response=RESPONSE),
+        dict(zapi='failed-zapi', status='failed', response=dict(), errno='13005', reason='Unable to find API: failed-zapi'),
+        dict(zapi='cluster-identity-get', status='skipped')
+    ]
+    assert my_obj.server.zapis == ['system-get-version', 'failed-zapi']
+
+
+def test_zapis_continue_on_error(patch_ansible):
+    zapis = [{'connection-error': None}, {'failed-zapi': None}, {'cluster-identity-get': None}]
+    my_obj = get_zapit_mock_object(dict(default_args(), zapis=zapis, continue_on_error=True))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    responses = exc.value.args[0]['responses']
+    assert [response['status'] for response in responses] == ['error', 'failed', 'passed']
+    assert responses[0] == dict(zapi='connection-error', status='error', errno='Unexpected error', reason='connection refused')
+    assert len(my_obj.server.zapis) == 3
+
+
+def test_zapis_concurrency(patch_ansible):
+    ''' results are reported in order, all zapis are called '''
+    zapis = [{'system-get-version': None}, {'failed-zapi': None}] + [{'zapi-%d' % index: None} for index in range(8)]
+    my_obj = get_zapit_mock_object(dict(default_args(), zapis=zapis, max_concurrency=4))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    responses = exc.value.args[0]['responses']
+    assert [response['zapi'] for response in responses] == [list(zapi.keys())[0] for zapi in zapis]
+    assert [response['status'] for response in responses] == ['passed', 'failed'] + ['passed'] * 8
+    assert sorted(my_obj.server.zapis) == sorted(response['zapi'] for response in responses)
+    my_obj.ems.assert_called_once()
+
+
+def test_zapis_errors(patch_ansible):
+    my_obj = get_zapit_mock_object(dict(default_args(), zapis=[{'system-get-version': None}, {'a': None, 'b': None}]))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_obj.apply()
+    assert exc.value.args[0]['msg'] == "A single ZAPI can be called at a time, received: ['a', 'b'] in zapis entry 1"
+    assert not my_obj.server.zapis
+    set_module_args(dict(default_args(), zapis=[{'system-get-version': None}], zapi={'system-get-version': None}))
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_module()
+    assert exc.value.args[0]['msg'] == 'parameters are mutually exclusive: zapi|zapis'
+    set_module_args(default_args())
+    with pytest.raises(AnsibleFailJson) as exc:
+        my_module()
+    assert exc.value.args[0]['msg'] == 'one of the following is required: zapi, zapis'